@@ -18,14 +18,17 @@
 
 import argparse
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 import glob
 from jinja2 import Template
 from utils.analysis import launch_prometheus_analysis
 from utils.common_ocp import detect_aap_instance, get_aap_version, get_mce_version, get_mch_version, get_ocp_version, validate_kubeconfig
 from utils.command import command
+from utils.kube import get_client
 from utils.output import generate_deploy_load_report
 from utils.output import phase_break
+from utils.results import convert_csv
 from utils.ztp_monitor import ZTPMonitor
 from utils.talm import detect_talm_minor
 import json
@@ -36,6 +39,7 @@ import pathlib
 import random
 import shutil
 import sys
+import tempfile
 import time
 
 # TODO:
@@ -111,8 +115,20 @@ logger = logging.getLogger("acm-deploy-load")
 logging.Formatter.converter = time.gmtime
 
 
+def apply_cluster(manifest_file, kubeconfig, server_side_apply, dry_run):
+  # Applies one cluster's manifests, returns rc and the time the cluster finished applying
+  if server_side_apply:
+    rc = get_client(kubeconfig).apply_file(manifest_file, dry_run=dry_run)
+  else:
+    oc_cmd = ["oc", "--kubeconfig", kubeconfig, "apply", "-f", manifest_file]
+    # Might need to add retries and have method to count retries
+    rc, output = command(oc_cmd, dry_run)
+  return rc, time.time()
+
+
 def deploy_ztp_clusters(clusters, manifest_type, ztp_deploy_apps, start_index, end_index, clusters_per_app, argocd_dir, dry_run, ztp_client_templates):
   git_files = []
+  start_render_time = time.time()
   last_ztp_app_index = math.floor((start_index) / clusters_per_app)
   for idx, cluster in enumerate(clusters[start_index:end_index]):
     ztp_app_index = math.floor((start_index + idx) / clusters_per_app)
@@ -196,18 +212,31 @@ def deploy_ztp_clusters(clusters, manifest_type, ztp_deploy_apps, start_index, e
       file1.writelines(kustomization_rendered)
   git_files.append("{}/kustomization.yaml".format(ztp_deploy_apps[ztp_app_index]["location"]))
 
+  render_time = round(time.time() - start_render_time, 1)
+
   # Git Process:
-  for file in git_files:
-    logger.debug("git add {}".format(file))
-    git_add = ["git", "add", file]
+  # Every file is staged by one git add reading its pathspecs from a file, instead of one git process per file
+  start_add_time = time.time()
+  with tempfile.NamedTemporaryFile(mode="w", prefix="git-add-", suffix=".txt") as pathspec_file:
+    for file in git_files:
+      logger.debug("git add {}".format(file))
+      pathspec_file.write("{}\n".format(file))
+    pathspec_file.flush()
+    git_add = ["git", "add", "--pathspec-from-file={}".format(pathspec_file.name)]
     rc, output = command(git_add, dry_run, retries=3, cmd_directory=argocd_dir)
-    if rc != 0:
-      logger.error("acm-deploy-load, git add rc: {}, Output: {}".format(rc, output))
-      sys.exit(1)
+  if rc != 0:
+    logger.error("acm-deploy-load, git add rc: {}, Output: {}".format(rc, output))
+    sys.exit(1)
+  add_time = round(time.time() - start_add_time, 1)
   logger.info("Added {} files in git".format(len(git_files)))
+  start_commit_time = time.time()
   git_commit = ["git", "commit", "-m", "Deploying Clusters {} to {}".format(start_index, end_index)]
   rc, output = command(git_commit, dry_run, cmd_directory=argocd_dir)
+  commit_time = round(time.time() - start_commit_time, 1)
+  start_push_time = time.time()
   rc, output = command(["git", "push"], dry_run, cmd_directory=argocd_dir)
+  push_time = round(time.time() - start_push_time, 1)
+  logger.info("Git stages - render: {}s, add: {}s, commit: {}s, push: {}s".format(render_time, add_time, commit_time, push_time))
 
 
 def log_monitor_data(data, elapsed_seconds, cliargs):
@@ -260,6 +289,10 @@ def main():
                       help="Phase 3 / Soak baseline delay after deploys complete (seconds)")
   parser.add_argument("--clusters-per-app", type=int, default=100,
                       help="Maximum number of clusters per cluster application")
+  parser.add_argument("--apply-parallelism", type=int, default=10,
+                      help="Number of clusters applied concurrently by the manifest and clusterinstance (non-gitops) methods")
+  parser.add_argument("--server-side-apply", action="store_true", default=False,
+                      help="Apply cluster manifests with server-side apply through the API instead of oc apply")
   parser.add_argument("--wait-cluster-max", type=int, default=10800,
                       help="Maximum amount of time to wait for cluster install completion (seconds)")
   parser.add_argument("--wait-du-profile-max", type=int, default=18000,
@@ -276,6 +309,16 @@ def main():
   # Monitor Thread Options
   parser.add_argument("-i", "--monitor-interval", type=int, default=60,
                       help="Interval to collect monitoring data (seconds)")
+  parser.add_argument("--monitor-adaptive", action="store_true", default=False,
+                      help="Shorten the monitor interval while counters change and lengthen it while they are flat")
+  parser.add_argument("--monitor-interval-min", type=int, default=10,
+                      help="Shortest adaptive monitor interval (seconds)")
+  parser.add_argument("--monitor-interval-max", type=int, default=300,
+                      help="Longest adaptive monitor interval (seconds)")
+  parser.add_argument("--monitor-watch", action="store_true", default=False,
+                      help="Monitor with one list per resource followed by watch events instead of listing every interval")
+  parser.add_argument("--no-monitor-projection", action="store_true", default=False,
+                      help="Monitor with full objects instead of metadata and table projections of agents, baremetalhosts and managedclusters")
   # The version of talm determines how we monitor for du profile applying/compliant/timeout
   parser.add_argument("--talm-version", type=str, default="4.16",
                       help="The version of talm to fall back on in event we can not detect the talm version")
@@ -357,7 +400,17 @@ def main():
   if (cliargs.monitor_interval < 10):
     logger.error("Monitor interval must be equal to or greater than 10")
     sys.exit(1)
+  if cliargs.monitor_adaptive:
+    if (cliargs.monitor_interval_min < 10):
+      logger.error("Monitor interval min must be equal to or greater than 10")
+      sys.exit(1)
+    if not (cliargs.monitor_interval_min <= cliargs.monitor_interval <= cliargs.monitor_interval_max):
+      logger.error("Monitor interval must be between monitor interval min and max")
+      sys.exit(1)
   if cliargs.rate == "interval":
+    if not (cliargs.apply_parallelism >= 1):
+      logger.error("Apply parallelism must be one or greater")
+      sys.exit(1)
     if not (cliargs.batch >= 1):
       logger.error("Batch size must be equal to or greater than 1")
       sys.exit(1)
@@ -373,6 +426,7 @@ def main():
   report_dir = os.path.join(base_dir_results, report_dir_name)
 
   monitor_data_csv_file = "{}/monitor_data.csv".format(report_dir)
+  cluster_transitions_csv_file = "{}/cluster_transitions.csv".format(report_dir)
 
   # Get starting data and list directories for manifests/siteconfigs/cluster applications
   available_clusters = 0
@@ -459,6 +513,9 @@ def main():
     logger.info("   * Available clusters: {}".format(available_clusters))
     logger.info("   * Cluster range: {} to {}".format(cliargs.start, cliargs.end))
     logger.info("   * Clusters per ZTP argoCD application: {}".format(cliargs.clusters_per_app))
+    if "gitops" not in cliargs.method:
+      logger.info("   * Clusters applied concurrently: {}{}".format(
+          cliargs.apply_parallelism, " (server-side apply)" if cliargs.server_side_apply else ""))
     if cliargs.skip_wait_install:
       logger.info("  * Skip waiting for cluster install completion")
     else:
@@ -488,6 +545,12 @@ def main():
   if not cliargs.no_prometheus_analysis:
     logger.info(" * Run analyze-prometheus.py in background at phase boundaries")
   logger.info(" * Monitor interval: {}s".format(cliargs.monitor_interval))
+  if cliargs.monitor_adaptive:
+    logger.info(" * Monitor adaptive interval: {}s to {}s".format(cliargs.monitor_interval_min, cliargs.monitor_interval_max))
+  if cliargs.monitor_watch:
+    logger.info(" * Monitor via watch events")
+  if cliargs.no_monitor_projection:
+    logger.info(" * Monitor without projection")
   logger.info(" * Results data captured in: {}".format("/".join(report_dir.split("/")[-2:])))
   phase_break()
 
@@ -522,7 +585,9 @@ def main():
     "playbook_running": 0,
     "playbook_completed": 0
   }
-  monitor_thread = ZTPMonitor(cliargs.method, talm_minor, monitor_data, monitor_data_csv_file, cliargs.dry_run, cliargs.monitor_interval, cliargs.kubeconfig)
+  monitor_thread = ZTPMonitor(cliargs.method, talm_minor, monitor_data, monitor_data_csv_file, cliargs.dry_run, cliargs.monitor_interval, cliargs.kubeconfig,
+      cliargs.monitor_watch, not cliargs.no_monitor_projection, cluster_transitions_csv_file, cliargs.monitor_adaptive,
+      cliargs.monitor_interval_min, cliargs.monitor_interval_max)
   monitor_thread.start()
 
   #############################################################################
@@ -574,16 +639,26 @@ def main():
         deploy_ztp_clusters(
             cluster_list, manifest_type, ztp_deploy_apps, start_cluster_index, end_cluster_index,
             cliargs.clusters_per_app, cliargs.argocd_directory, cliargs.dry_run, cliargs.ztp_client_templates)
+        # Cluster files are named <cluster>-<siteconfig|clusterinstance>.yml
+        monitor_thread.cluster_applied(
+            [os.path.basename(cluster).rsplit("-", 1)[0] for cluster in cluster_list[start_cluster_index:end_cluster_index]])
       else:
-        # Apply the clusters
-        for cluster in cluster_list[start_cluster_index:end_cluster_index]:
-          monitor_data["cluster_applied_committed"] += 1
-          oc_cmd = ["oc", "--kubeconfig", cliargs.kubeconfig, "apply", "-f", cluster]
-          # Might need to add retries and have method to count retries
-          rc, output = command(oc_cmd, cliargs.dry_run)
-          if rc != 0:
-            logger.error("acm-deploy-load, oc apply rc: {}".format(rc))
-            sys.exit(1)
+        # Apply the clusters, up to apply-parallelism at a time so the batch lands on the hub as a burst
+        start_apply_time = time.time()
+        with ThreadPoolExecutor(max_workers=cliargs.apply_parallelism, thread_name_prefix="apply") as executor:
+          futures = {executor.submit(apply_cluster, cluster, cliargs.kubeconfig, cliargs.server_side_apply, cliargs.dry_run): cluster
+              for cluster in cluster_list[start_cluster_index:end_cluster_index]}
+          for future in as_completed(futures):
+            rc, applied_time = future.result()
+            if rc != 0:
+              logger.error("acm-deploy-load, apply {} rc: {}".format(futures[future], rc))
+              for pending in futures:
+                pending.cancel()
+              sys.exit(1)
+            monitor_data["cluster_applied_committed"] += 1
+            # Manifest files are named <cluster>-<manifest|clusterinstance>.yml
+            monitor_thread.cluster_applied([os.path.basename(futures[future]).rsplit("-", 1)[0]], applied_time)
+        logger.info("Applied {} cluster(s) in {}s".format(len(futures), round(time.time() - start_apply_time, 1)))
 
       start_cluster_index += cliargs.batch
       if start_cluster_index >= available_clusters or end_cluster_index == cliargs.end:
@@ -755,6 +830,8 @@ def main():
   logger.info("Stopping monitoring thread may take up to: {}".format(cliargs.monitor_interval))
   monitor_thread.signal = False
   monitor_thread.join()
+  convert_csv(monitor_data_csv_file, versions, ["date"])
+  convert_csv(cluster_transitions_csv_file, versions, ["timestamp"])
 
   #############################################################################
   # Report Card / Graph Phase
@@ -22,10 +22,10 @@ import base64
 from datetime import datetime, timedelta, timezone
 import glob
 from jinja2 import Template
-from utils.command import command
+from utils.kube import close_client
+from utils.kube import get_client
 from utils.output import log_write
 from utils.output import phase_break
-import json
 import logging
 import os
 import pathlib
@@ -53,45 +53,57 @@ logger = logging.getLogger("acm-deploy-load")
 logging.Formatter.converter = time.gmtime
 
 
+def apply_file(kubeconfig, manifest_file, retries):
+  # Applies the whole file again on failure with the same backoff command() gave oc apply
+  for attempt in range(retries):
+    if attempt > 0:
+      time.sleep(attempt)
+    rc = get_client(kubeconfig).apply_file(manifest_file)
+    if rc == 0:
+      break
+  return rc
+
+
 def manage_clusters(clusters, mc_dir, hub_kc):
   for cluster in clusters:
     logger.info("Managing {}".format(cluster["name"]))
-    oc_cmd = ["oc", "--kubeconfig", hub_kc, "apply", "-f", cluster["mc"]]
-    rc, output = command(oc_cmd, False, retries=3, no_log=True)
+    rc = apply_file(hub_kc, cluster["mc"], 3)
     if rc != 0:
-      logger.error("oc apply -f {} rc: {}".format(cluster["mc"], rc))
+      logger.error("apply -f {} rc: {}".format(cluster["mc"], rc))
       sys.exit(1)
-    logger.debug(output.strip())
 
     # Many retries as it may not instant create the secret data upon import
-    oc_cmd = ["oc", "--kubeconfig", hub_kc, "get", "secret", "-n", cluster["name"], "{}-import".format(cluster["name"]), "-o", "json"]
-    rc, output = command(oc_cmd, False, retries=20, no_log=True)
+    for attempt in range(20):
+      if attempt > 0:
+        time.sleep(attempt)
+      rc, import_secret = get_client(hub_kc).get("v1", "secrets", "{}-import".format(cluster["name"]), cluster["name"])
+      if rc == 0:
+        break
     if rc != 0:
-      logger.error("oc get secret -n {1} {1}-import rc: {2}".format(cluster["name"], rc))
+      logger.error("get secret -n {0} {0}-import rc: {1}".format(cluster["name"], rc))
       sys.exit(1)
 
-    output_json = json.loads(output)
-    decoded_crds_output = (base64.b64decode(output_json["data"]["crds.yaml"])).decode("utf-8")
+    decoded_crds_output = (base64.b64decode(import_secret["data"]["crds.yaml"])).decode("utf-8")
     cluster_crds_file = "{}/{}-crds.yml".format(mc_dir, cluster["name"])
     with open(cluster_crds_file, "w") as file1:
       file1.writelines(decoded_crds_output)
-    decoded_import_output = (base64.b64decode(output_json["data"]["import.yaml"])).decode("utf-8")
+    decoded_import_output = (base64.b64decode(import_secret["data"]["import.yaml"])).decode("utf-8")
     cluster_import_file = "{}/{}-import.yml".format(mc_dir, cluster["name"])
     with open(cluster_import_file, "w") as file1:
       file1.writelines(decoded_import_output)
 
     # Lastly import the crd and import data into the spoke cluster to complete process of initiating managing a cluster
-    oc_cmd = ["oc", "--kubeconfig", cluster["kc"], "apply", "-f", cluster_crds_file]
-    rc, output = command(oc_cmd, False, retries=10, no_log=True)
+    rc = apply_file(cluster["kc"], cluster_crds_file, 10)
     if rc != 0:
-      logger.error("oc --kubeconfig {} apply -f {} rc: {}".format(cluster["kc"], cluster_crds_file, rc))
+      logger.error("apply --kubeconfig {} -f {} rc: {}".format(cluster["kc"], cluster_crds_file, rc))
       sys.exit(1)
 
-    oc_cmd = ["oc", "--kubeconfig", cluster["kc"], "apply", "-f", cluster_import_file]
-    rc, output = command(oc_cmd, False, retries=10, no_log=True)
+    rc = apply_file(cluster["kc"], cluster_import_file, 10)
     if rc != 0:
-      logger.error("oc --kubeconfig {} apply -f {} rc: {}".format(cluster["kc"], cluster_import_file, rc))
+      logger.error("apply --kubeconfig {} -f {} rc: {}".format(cluster["kc"], cluster_import_file, rc))
       sys.exit(1)
+    # Each spoke is visited once, release its pooled connections
+    close_client(cluster["kc"])
 
 
 def update_policy_cm(policy_ns, cm_name, policy_keys, policy_dir, hub_kc):
@@ -104,12 +116,10 @@ def update_policy_cm(policy_ns, cm_name, policy_keys, policy_dir, hub_kc):
   policy_cm_file = "{}/policy-cm-{}.yml".format(policy_dir, ts)
   with open(policy_cm_file, "w") as file1:
     file1.writelines(hcm_template_rendered)
-  oc_cmd = ["oc", "--kubeconfig", hub_kc, "apply", "-f", policy_cm_file]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  rc = apply_file(hub_kc, policy_cm_file, 3)
   if rc != 0:
-    logger.error("oc apply -f {} rc: {}".format(policy_cm_file, rc))
+    logger.error("apply -f {} rc: {}".format(policy_cm_file, rc))
     sys.exit(1)
-  logger.debug(output.strip())
 
 
 def main():
@@ -198,10 +208,10 @@ def main():
 
   # Detect a policy configmap
   logger.info("Detecting configmap {} in namespace {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace))
-  oc_cmd = ["oc", "--kubeconfig", cliargs.kubeconfig, "get", "cm", "-n", cliargs.hub_policy_namespace, cliargs.hub_policy_cm_name, "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  rc, _ = get_client(cliargs.kubeconfig).get("v1", "configmaps", cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace,
+      retries=3)
   if rc != 0:
-    logger.error("oc get cm {} -n {} rc: {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace, rc))
+    logger.error("get cm {} -n {} rc: {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace, rc))
     sys.exit(1)
   else:
     logger.info("Detected configmap {} in namespace {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace))
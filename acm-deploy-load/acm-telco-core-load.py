@@ -26,6 +26,7 @@ from jinja2 import Template
 from utils.analysis import launch_prometheus_analysis
 from utils.command import command
 from utils.common_ocp import get_mce_version, get_mch_version, get_ocp_version, validate_kubeconfig
+from utils.kube import get_client
 from utils.output import generate_telco_core_load_report
 from utils.output import log_write
 from utils.output import phase_break
@@ -106,12 +107,16 @@ def update_policy_cm(policy_ns, cm_name, policy_keys, policy_dir, hub_kc):
   policy_cm_file = "{}/policy-cm-{}.yml".format(policy_dir, ts)
   with open(policy_cm_file, "w") as file1:
     file1.writelines(hcm_template_rendered)
-  oc_cmd = ["oc", "--kubeconfig", hub_kc, "apply", "-f", policy_cm_file]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  # Applies the whole file again on failure with the same backoff command() gave oc apply
+  for attempt in range(3):
+    if attempt > 0:
+      time.sleep(attempt)
+    rc = get_client(hub_kc).apply_file(policy_cm_file)
+    if rc == 0:
+      break
   if rc != 0:
-    logger.error("oc apply -f {} rc: {}".format(policy_cm_file, rc))
+    logger.error("apply -f {} rc: {}".format(policy_cm_file, rc))
     sys.exit(1)
-  logger.debug(output.strip())
 
 
 def main():
@@ -285,10 +290,10 @@ def main():
   # Detect a policy configmap
   if cliargs.no_policy == False:
     logger.info("Detecting configmap {} in namespace {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace))
-    oc_cmd = ["oc", "--kubeconfig", cliargs.kubeconfig, "get", "cm", "-n", cliargs.hub_policy_namespace, cliargs.hub_policy_cm_name, "-o", "json"]
-    rc, output = command(oc_cmd, False, retries=3, no_log=True)
+    rc, _ = get_client(cliargs.kubeconfig).get("v1", "configmaps", cliargs.hub_policy_cm_name,
+        cliargs.hub_policy_namespace, retries=3)
     if rc != 0:
-      logger.error("oc get cm {} -n {} rc: {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace, rc))
+      logger.error("get cm {} -n {} rc: {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace, rc))
       sys.exit(1)
     else:
       logger.info("Detected configmap {} in namespace {}".format(cliargs.hub_policy_cm_name, cliargs.hub_policy_namespace))
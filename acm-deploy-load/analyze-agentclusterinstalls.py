@@ -18,8 +18,7 @@
 
 import argparse
 from datetime import datetime
-import json
-from utils.command import command
+from utils.kube import get_client
 from utils.output import log_write
 import logging
 import numpy as np
@@ -46,49 +45,47 @@ def main():
   aci_csv_file = "{}/agentclusterinstalls-{}.csv".format(cliargs.results_directory, ts)
   aci_stats_file = "{}/agentclusterinstalls-{}.stats".format(cliargs.results_directory, ts)
 
-  oc_cmd = ["oc", "get", "agentclusterinstalls", "-A", "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
-  if rc != 0:
-    logger.error("analyze-agentclusterinstalls, oc get agentclusterinstalls rc: {}".format(rc))
-    sys.exit(1)
-  aci_data = json.loads(output)
-
   logger.info("Writing CSV: {}".format(aci_csv_file))
   with open(aci_csv_file, "w") as csv_file:
     csv_file.write("name,status,creationTimestamp,completed.lastTransitionTime,duration\n")
 
   aci_installcompleted_values = []
-  for item in aci_data["items"]:
-    aci_name = item["metadata"]["name"]
-    if aci_name == "local-agent-cluster-cluster-install":
-      logger.info("analyze-agentclusterinstalls, Skipping local-agent-cluster-cluster-install")
-      continue
-    if aci_name == "local-cluster":
-      logger.info("analyze-agentclusterinstalls, Skipping local-cluster")
-      continue
-    aci_status = "unknown"
-    aci_creationTimestamp = item["metadata"]["creationTimestamp"]
-    aci_completed_ltt = ""
-    aci_duration = 0
-    for condition in item["status"]["conditions"]:
-      if condition["type"] == "Completed":
-        if condition["status"] == "True":
-          aci_completed_ltt = condition["lastTransitionTime"]
-        aci_status = condition["reason"]
-        break
-
-    if aci_status == "InstallationCompleted":
-      start = datetime.strptime(aci_creationTimestamp, "%Y-%m-%dT%H:%M:%SZ")
-      end = datetime.strptime(aci_completed_ltt, "%Y-%m-%dT%H:%M:%SZ")
-      aci_duration = (end - start).total_seconds()
-      # Exclude values of 0
-      if aci_duration > 0:
-        aci_installcompleted_values.append(aci_duration)
-
-    # logger.info("{},{},{},{},{}".format(aci_name, aci_status, aci_creationTimestamp, aci_completed_ltt, aci_duration))
-
-    with open(aci_csv_file, "a") as csv_file:
-      csv_file.write("{},{},{},{},{}\n".format(aci_name, aci_status, aci_creationTimestamp, aci_completed_ltt, aci_duration))
+  # AgentClusterInstalls are listed and analyzed one page at a time
+  for rc, page in get_client().list_pages("extensions.hive.openshift.io/v1beta1", "agentclusterinstalls", retries=3):
+    if rc != 0:
+      logger.error("analyze-agentclusterinstalls, list agentclusterinstalls rc: {}".format(rc))
+      sys.exit(1)
+    for item in page["items"]:
+      aci_name = item["metadata"]["name"]
+      if aci_name == "local-agent-cluster-cluster-install":
+        logger.info("analyze-agentclusterinstalls, Skipping local-agent-cluster-cluster-install")
+        continue
+      if aci_name == "local-cluster":
+        logger.info("analyze-agentclusterinstalls, Skipping local-cluster")
+        continue
+      aci_status = "unknown"
+      aci_creationTimestamp = item["metadata"]["creationTimestamp"]
+      aci_completed_ltt = ""
+      aci_duration = 0
+      for condition in item["status"]["conditions"]:
+        if condition["type"] == "Completed":
+          if condition["status"] == "True":
+            aci_completed_ltt = condition["lastTransitionTime"]
+          aci_status = condition["reason"]
+          break
+
+      if aci_status == "InstallationCompleted":
+        start = datetime.strptime(aci_creationTimestamp, "%Y-%m-%dT%H:%M:%SZ")
+        end = datetime.strptime(aci_completed_ltt, "%Y-%m-%dT%H:%M:%SZ")
+        aci_duration = (end - start).total_seconds()
+        # Exclude values of 0
+        if aci_duration > 0:
+          aci_installcompleted_values.append(aci_duration)
+
+      # logger.info("{},{},{},{},{}".format(aci_name, aci_status, aci_creationTimestamp, aci_completed_ltt, aci_duration))
+
+      with open(aci_csv_file, "a") as csv_file:
+        csv_file.write("{},{},{},{},{}\n".format(aci_name, aci_status, aci_creationTimestamp, aci_completed_ltt, aci_duration))
 
   logger.info("Writing Stats: {}".format(aci_stats_file))
   stats_count = len(aci_installcompleted_values)
@@ -19,10 +19,13 @@
 import argparse
 from datetime import datetime
 from datetime import timedelta
-import json
-from utils.command import command
 from utils.common_ocp import get_ocp_namespace_list
+from utils.kube import get_client
 from utils.output import log_write
+from utils.results import convert_csv
+from utils.results import write_results
+from utils.timeline import minute_counts
+from utils.timeline import minute_index
 import logging
 import numpy as np
 import pandas as pd
@@ -66,31 +69,18 @@ def main():
   aj_samples_file = "{}/ansiblejobs-{}-samples.csv".format(cliargs.results_directory, ts)
   aj_graph_file = "{}/ansiblejobs-{}.png".format(cliargs.results_directory, ts)
 
-  oc_cmd = ["oc", "get", "ansiblejobs", "-A", "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  rc, aj_data = get_client().list("tower.ansible.com/v1alpha1", "ansiblejobs", retries=3)
   if rc != 0:
-    logger.error("analyze-ansiblejobs, oc get ansiblejobs rc: {}".format(rc))
+    logger.error("analyze-ansiblejobs, list ansiblejobs rc: {}".format(rc))
     sys.exit(1)
-  aj_data = json.loads(output)
 
   aj_analyzed = len(aj_data["items"])
   aj_status_total = {}
-  create_started_durations = []
-  started_finished_durations = []
-  complete_durations = []
-
-  # For use with creating the status graph
-  aj_graph_start_time = ""
-  aj_graph_end_time = ""
-  aj_graph_timestamps = {}
+  aj_rows = []
 
   if aj_analyzed == 0:
     logger.info("No AnsibleJobs to analyze. Exiting")
   else:
-    logger.info("Writing CSV: {}".format(aj_csv_file))
-    with open(aj_csv_file, "w") as csv_file:
-      csv_file.write("name,tower_id,target_count,status,changed,failed,elapsed,creationTimestamp,started,finished,complete_duration,create_started_duration,started_finished_duration\n")
-
     for item in aj_data["items"]:
       aj_name = item["metadata"]["name"]
       aj_creationTimestamp = item["metadata"]["creationTimestamp"]
@@ -124,87 +114,58 @@ def main():
         if "elapsed" in item["status"]["ansibleJobResult"]:
           aj_result_elapsed = item["status"]["ansibleJobResult"]["elapsed"]
 
-      created_dt = datetime.strptime(aj_creationTimestamp, "%Y-%m-%dT%H:%M:%SZ")
-      created_dt_no_seconds = datetime.strptime(aj_creationTimestamp, "%Y-%m-%dT%H:%M:%SZ").replace(second=0, microsecond=0)
-      # Set earliest created timestamp
-      if aj_graph_start_time == "":
-        aj_graph_start_time = created_dt_no_seconds
-      else:
-        if created_dt_no_seconds < aj_graph_start_time:
-          aj_graph_start_time = created_dt_no_seconds
-
-      create_started_duration = ""
-      started_finished_duration = ""
-      complete_duration = ""
-      if aj_result_started != "":
-        started_dt = datetime.strptime(aj_result_started, "%Y-%m-%dT%H:%M:%S.%fZ")
-        started_dt_no_seconds = datetime.strptime(aj_result_started, "%Y-%m-%dT%H:%M:%S.%fZ").replace(second=0, microsecond=0)
-        create_started_duration = (started_dt - created_dt).total_seconds()
-        create_started_durations.append(create_started_duration)
-      if aj_result_finished != "":
-        finished_dt = datetime.strptime(aj_result_finished, "%Y-%m-%dT%H:%M:%S.%fZ")
-        finished_dt_no_seconds = datetime.strptime(aj_result_finished, "%Y-%m-%dT%H:%M:%S.%fZ").replace(second=0, microsecond=0)
-        # Set latest finished timestamp
-        if aj_graph_end_time == "":
-          aj_graph_end_time = finished_dt_no_seconds
-        else:
-          if finished_dt_no_seconds > aj_graph_end_time:
-            aj_graph_end_time = finished_dt_no_seconds
-        aj_graph_timestamps[aj_name] = {
-            "create": created_dt_no_seconds,
-            "started": started_dt_no_seconds,
-            "finished": finished_dt_no_seconds}
-        started_finished_duration = (finished_dt - started_dt).total_seconds()
-        complete_duration = (finished_dt - created_dt).total_seconds()
-        started_finished_durations.append(started_finished_duration)
-        complete_durations.append(complete_duration)
+      aj_rows.append((aj_name, aj_tower_id, aj_target_count, aj_result_status, aj_result_changed, aj_result_failed,
+          aj_result_elapsed, aj_creationTimestamp, aj_result_started or None, aj_result_finished or None))
+
+    # Parse every timestamp once, a job not yet started or finished has NaT and no duration
+    aj_df = pd.DataFrame(aj_rows, columns=["name", "tower_id", "target_count", "status", "changed", "failed",
+        "elapsed", "creationTimestamp", "started", "finished"])
+    created_dt = pd.to_datetime(aj_df["creationTimestamp"], format="%Y-%m-%dT%H:%M:%SZ")
+    started_dt = pd.to_datetime(aj_df["started"], format="%Y-%m-%dT%H:%M:%S.%fZ")
+    finished_dt = pd.to_datetime(aj_df["finished"], format="%Y-%m-%dT%H:%M:%S.%fZ")
+    create_started = (started_dt - created_dt).dt.total_seconds()
+    started_finished = (finished_dt - started_dt).dt.total_seconds()
+    complete = (finished_dt - created_dt).dt.total_seconds()
+    create_started_durations = create_started.dropna().tolist()
+    started_finished_durations = started_finished.dropna().tolist()
+    complete_durations = complete.dropna().tolist()
 
-      with open(aj_csv_file, "a") as csv_file:
+    logger.info("Writing CSV: {}".format(aj_csv_file))
+    with open(aj_csv_file, "w") as csv_file:
+      csv_file.write("name,tower_id,target_count,status,changed,failed,elapsed,creationTimestamp,started,finished,complete_duration,create_started_duration,started_finished_duration\n")
+      for row, complete_duration, create_started_duration, started_finished_duration in zip(
+          aj_rows, complete, create_started, started_finished):
         csv_file.write("{},{},{},{},{},{},{},{},{},{},{},{},{}\n".format(
-            aj_name, aj_tower_id, aj_target_count, aj_result_status, aj_result_changed, aj_result_failed,
-            aj_result_elapsed, aj_creationTimestamp, aj_result_started, aj_result_finished, complete_duration,
-            create_started_duration, started_finished_duration))
-
-
-    if aj_graph_start_time != "" and aj_graph_end_time != "":
-      # Create 1 minute buckets for series data of ansiblejobs
-      data_buckets = {}
-      # Add 5 buffer minutes to buckets, at least 2 before start time
-      bucket_count = int((aj_graph_end_time - aj_graph_start_time).total_seconds() / 60) + 5
-      for i in range(bucket_count):
-        data_bk_ts = (aj_graph_start_time - timedelta(minutes=2)) + timedelta(minutes=i)
-        data_buckets[data_bk_ts] = {"queued": 0, "running": 0, "completed": 0}
-        # logger.info("Bucket: {}".format(data_bk_ts))
-
-      # Now populate each bucket series with data between timestamps for each job:
-      for aj in aj_graph_timestamps:
-        # logger.info(aj_graph_timestamps[aj])
-        queued_start_time = (aj_graph_timestamps[aj]["create"]).replace(second=0, microsecond=0)
-        queued_end_time = (aj_graph_timestamps[aj]["started"]).replace(second=0, microsecond=0)
-        running_start_time = (aj_graph_timestamps[aj]["started"]).replace(second=0, microsecond=0)
-        running_end_time = (aj_graph_timestamps[aj]["finished"]).replace(second=0, microsecond=0)
-        queued_bucket_count = int((queued_end_time - queued_start_time).total_seconds() / 60)
-        running_bucket_count = int((running_end_time - running_start_time).total_seconds() / 60)
-        completed_bucket_count = int((aj_graph_end_time - running_end_time).total_seconds() / 60) + 3
-        for i in range(queued_bucket_count):
-          data_bk_ts = queued_start_time + timedelta(minutes=i)
-          data_buckets[data_bk_ts]["queued"] += 1
-        for i in range(running_bucket_count):
-          data_bk_ts = running_start_time + timedelta(minutes=i)
-          data_buckets[data_bk_ts]["running"] += 1
-        for i in range(completed_bucket_count):
-          data_bk_ts = running_end_time + timedelta(minutes=i)
-          data_buckets[data_bk_ts]["completed"] += 1
+            *row[:8], row[8] or "", row[9] or "", "" if pd.isna(complete_duration) else complete_duration,
+            "" if pd.isna(create_started_duration) else create_started_duration,
+            "" if pd.isna(started_finished_duration) else started_finished_duration))
+    convert_csv(aj_csv_file, datetime_columns=["creationTimestamp", "started", "finished"],
+        dtype={"name": str, "tower_id": str, "status": str})
+
+    if finished_dt.notna().any():
+      # 1 minute buckets of the ansiblejobs series, from 2 minutes before the earliest created through 2 minutes after
+      # the latest finished
+      aj_graph_start_time = created_dt.min().floor("min") - timedelta(minutes=2)
+      aj_graph_end_time = finished_dt.max().floor("min")
+      bucket_count = int((aj_graph_end_time - aj_graph_start_time).total_seconds() / 60) + 3
+
+      # Each finished job is queued from its created minute until the minute it started, running until the minute it
+      # finished and completed from then through the last bucket
+      graphed = started_dt.notna() & finished_dt.notna()
+      created_bk = minute_index(created_dt[graphed], aj_graph_start_time)
+      started_bk = minute_index(started_dt[graphed], aj_graph_start_time)
+      finished_bk = minute_index(finished_dt[graphed], aj_graph_start_time)
+      df = pd.DataFrame({
+        "datetime": pd.date_range(aj_graph_start_time, periods=bucket_count, freq="min"),
+        "queued": minute_counts(created_bk, started_bk - 1, bucket_count),
+        "running": minute_counts(started_bk, finished_bk - 1, bucket_count),
+        "completed": minute_counts(finished_bk, np.full(len(finished_bk), bucket_count - 1), bucket_count)
+      })
 
       # Write the samples csv file which contains:
       # datetime, queued, running, completed
-      with open(aj_samples_file, "w") as csv_file:
-        csv_file.write("datetime,queued,running,completed\n")
-        for sample in data_buckets:
-          csv_file.write("{},{},{},{}\n".format(sample.strftime("%Y-%m-%dT%H:%M:%SZ"), data_buckets[sample]["queued"], data_buckets[sample]["running"], data_buckets[sample]["completed"]))
-
-      # Read in samples csv file to generate a png graph
-      df = pd.read_csv(aj_samples_file)
+      df.to_csv(aj_samples_file, index=False, date_format="%Y-%m-%dT%H:%M:%SZ")
+      write_results(aj_samples_file, df, datetime_columns=["datetime"])
 
       aj_graph_title = "AnsibleJobs - Status "
       aj_graph_y = ["queued", "running", "completed"]
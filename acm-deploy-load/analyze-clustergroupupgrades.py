@@ -19,8 +19,7 @@
 import argparse
 from datetime import datetime
 from datetime import timedelta
-import json
-from utils.command import command
+from utils.kube import get_client
 from utils.output import log_write
 from utils.talm import detect_talm_minor
 import logging
@@ -59,13 +58,6 @@ def main():
   talm_minor = int(detect_talm_minor(cliargs.kubeconfig, cliargs.talm_version))
   logger.info("Using TALM cgu analysis based on TALM minor version: {}".format(talm_minor))
 
-  oc_cmd = ["oc", "--kubeconfig", cliargs.kubeconfig, "get", "clustergroupupgrades", "-n", cliargs.namespace, "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
-  if rc != 0:
-    logger.error("analyze-clustergroupupgrades, oc get clustergroupupgrades -n {} rc: {}".format(cliargs.namespace, rc))
-    sys.exit(1)
-  cgu_data = json.loads(output)
-
   cgus_total = 0
   cgu_lc_skipped = False
   cgu_conditions = {}
@@ -81,120 +73,126 @@ def main():
   with open(cgu_csv_file, "w") as csv_file:
     csv_file.write("name,status,creationTimestamp,precacheCompleted,precacheDuration,startedAt,backupCompleted,backupDuration,completedAt,duration\n")
 
-  for item in cgu_data["items"]:
-    cgu_name = item["metadata"]["name"]
-    if cgu_name.lower() == "local-cluster":
-      logger.info("Skipping local-cluster")
-      cgu_lc_skipped = True
-      continue
-    cgus_total += 1
-    cgu_status = "unknown"
+  # ClusterGroupUpgrades are listed and analyzed one page at a time
+  for rc, page in get_client(cliargs.kubeconfig).list_pages("ran.openshift.io/v1alpha1", "clustergroupupgrades",
+      cliargs.namespace, retries=3):
+    if rc != 0:
+      logger.error("analyze-clustergroupupgrades, list clustergroupupgrades -n {} rc: {}".format(cliargs.namespace, rc))
+      sys.exit(1)
+    for item in page["items"]:
+      cgu_name = item["metadata"]["name"]
+      if cgu_name.lower() == "local-cluster":
+        logger.info("Skipping local-cluster")
+        cgu_lc_skipped = True
+        continue
+      cgus_total += 1
+      cgu_status = "unknown"
+
+      # Determine earliest creationTimestamp for the cgus in this namespace
+      cgu_created = datetime.strptime(item["metadata"]["creationTimestamp"], "%Y-%m-%dT%H:%M:%SZ")
+      if cgus_create_time == "":
+        cgus_create_time = cgu_created
+      elif cgus_create_time > cgu_created:
+        logger.info("Replacing cgu created time {} with earlier time {}".format(cgus_create_time, cgu_created))
+        cgus_create_time = cgu_created
 
-    # Determine earliest creationTimestamp for the cgus in this namespace
-    cgu_created = datetime.strptime(item["metadata"]["creationTimestamp"], "%Y-%m-%dT%H:%M:%SZ")
-    if cgus_create_time == "":
-      cgus_create_time = cgu_created
-    elif cgus_create_time > cgu_created:
-      logger.info("Replacing cgu created time {} with earlier time {}".format(cgus_create_time, cgu_created))
-      cgus_create_time = cgu_created
+      precache_ltt = ""
+      backup_ltt = ""
+      cgu_startedAt = ""
+      cgu_completedAt = ""
+      cgu_precache_duration = 0
+      cgu_backup_duration = 0
+      cgu_duration = 0
+      if "startedAt" in item["status"]["status"]:
+        # Determine earliest startedAt time for the cgus in this namespace
+        cgu_startedAt = datetime.strptime(item["status"]["status"]["startedAt"], "%Y-%m-%dT%H:%M:%SZ")
+        if cgus_started_time == "":
+          cgus_started_time = cgu_startedAt
+        elif cgus_started_time > cgu_startedAt:
+          logger.info("Replacing cgu started time {} with earlier time {}".format(cgus_started_time, cgu_startedAt))
+          cgus_started_time = cgu_startedAt
+      if "completedAt" in item["status"]["status"]:
+        # Determine latest populated completed time
+        cgu_completedAt = datetime.strptime(item["status"]["status"]["completedAt"], "%Y-%m-%dT%H:%M:%SZ")
+        if cgus_completed_time == "":
+          cgus_completed_time = cgu_completedAt
+        elif cgus_completed_time < cgu_completedAt:
+          logger.info("Replacing cgu completed time {} with later time {}".format(cgus_completed_time, cgu_completedAt))
+          cgus_completed_time = cgu_completedAt
+        cgu_duration = (cgu_completedAt - cgu_startedAt).total_seconds()
 
-    precache_ltt = ""
-    backup_ltt = ""
-    cgu_startedAt = ""
-    cgu_completedAt = ""
-    cgu_precache_duration = 0
-    cgu_backup_duration = 0
-    cgu_duration = 0
-    if "startedAt" in item["status"]["status"]:
-      # Determine earliest startedAt time for the cgus in this namespace
-      cgu_startedAt = datetime.strptime(item["status"]["status"]["startedAt"], "%Y-%m-%dT%H:%M:%SZ")
-      if cgus_started_time == "":
-        cgus_started_time = cgu_startedAt
-      elif cgus_started_time > cgu_startedAt:
-        logger.info("Replacing cgu started time {} with earlier time {}".format(cgus_started_time, cgu_startedAt))
-        cgus_started_time = cgu_startedAt
-    if "completedAt" in item["status"]["status"]:
-      # Determine latest populated completed time
-      cgu_completedAt = datetime.strptime(item["status"]["status"]["completedAt"], "%Y-%m-%dT%H:%M:%SZ")
-      if cgus_completed_time == "":
-        cgus_completed_time = cgu_completedAt
-      elif cgus_completed_time < cgu_completedAt:
-        logger.info("Replacing cgu completed time {} with later time {}".format(cgus_completed_time, cgu_completedAt))
-        cgus_completed_time = cgu_completedAt
-      cgu_duration = (cgu_completedAt - cgu_startedAt).total_seconds()
+      if "conditions" in item["status"]:
+        for condition in item["status"]["conditions"]:
+          if talm_minor >= 12:
+            if "type" in condition:
+              if (condition["type"] == "Progressing" and condition["status"] == "False"
+                  and condition["reason"] != "Completed" and condition["reason"] != "TimedOut"):
+                cgu_status = "NotStarted"
+              if (condition["type"] == "PrecachingSuceeded" and condition["status"] == "True" and
+                  (condition["reason"] == "PrecachingCompleted" or condition["reason"] == "PartiallyDone")):
+                precache_ltt = datetime.strptime(condition["lastTransitionTime"], "%Y-%m-%dT%H:%M:%SZ")
+                if cgus_precache_time == "":
+                  cgus_precache_time = precache_ltt
+                elif cgus_precache_time < precache_ltt:
+                  logger.info("Replacing cgu precaching succeeded time {} with later time {}".format(cgus_precache_time, precache_ltt))
+                  cgus_precache_time = precache_ltt
+                cgu_precache_duration = (precache_ltt - cgu_created).total_seconds()
+                cgu_precaching_durations.append(cgu_precache_duration)
 
-    if "conditions" in item["status"]:
-      for condition in item["status"]["conditions"]:
-        if talm_minor >= 12:
-          if "type" in condition:
-            if (condition["type"] == "Progressing" and condition["status"] == "False"
-                and condition["reason"] != "Completed" and condition["reason"] != "TimedOut"):
-              cgu_status = "NotStarted"
-            if (condition["type"] == "PrecachingSuceeded" and condition["status"] == "True" and
-                (condition["reason"] == "PrecachingCompleted" or condition["reason"] == "PartiallyDone")):
+              if (condition["type"] == "BackupSuceeded" and condition["status"] == "True" and
+                  (condition["reason"] == "BackupCompleted" or condition["reason"] == "PartiallyDone")):
+                backup_ltt = datetime.strptime(condition["lastTransitionTime"], "%Y-%m-%dT%H:%M:%SZ")
+                cgu_backup_duration = (backup_ltt - cgu_startedAt).total_seconds()
+                cgu_backup_durations.append(cgu_backup_duration)
+
+              if condition["type"] == "Progressing" and condition["status"] == "True" and condition["reason"] == "InProgress":
+                cgu_status = "InProgress"
+              if condition["type"] == "Succeeded" and condition["status"] == "False" and condition["reason"] == "TimedOut":
+                cgu_status = "TimedOut"
+              if condition["type"] == "Succeeded" and condition["status"] == "True" and condition["reason"] == "Completed":
+                cgu_status = "Completed"
+                cgu_succeeded_durations.append(cgu_duration)
+              if cgu_status != "unknown":
+                if cgu_status not in cgu_conditions:
+                  cgu_conditions[cgu_status] = 1
+                else:
+                  cgu_conditions[cgu_status] += 1
+                break
+          else:
+            if condition["reason"] not in cgu_conditions:
+              cgu_conditions[condition["reason"]] = 1
+            else:
+              cgu_conditions[condition["reason"]] += 1
+            if condition["type"] == "Ready":
+              if condition["status"] == "True":
+                if "completedAt" in item["status"]["status"]:
+                  # Determine latest populated completed time
+                  cgu_completedAt = datetime.strptime(item["status"]["status"]["completedAt"], "%Y-%m-%dT%H:%M:%SZ")
+                  if cgus_completed_time == "":
+                    cgus_completed_time = cgu_completedAt
+                  elif cgus_completed_time < cgu_completedAt:
+                    logger.info("Replacing cgu completed time {} with later time {}".format(cgus_completed_time, cgu_completedAt))
+                    cgus_completed_time = cgu_completedAt
+              cgu_status = condition["reason"]
+            elif condition["type"] == "PrecachingDone":
               precache_ltt = datetime.strptime(condition["lastTransitionTime"], "%Y-%m-%dT%H:%M:%SZ")
               if cgus_precache_time == "":
                 cgus_precache_time = precache_ltt
               elif cgus_precache_time < precache_ltt:
-                logger.info("Replacing cgu precaching succeeded time {} with later time {}".format(cgus_precache_time, precache_ltt))
+                logger.info("Replacing cgu precaching done time {} with later time {}".format(cgus_precache_time, precache_ltt))
                 cgus_precache_time = precache_ltt
-              cgu_precache_duration = (precache_ltt - cgu_created).total_seconds()
+              cgu_precache_duration = (cgus_precache_time - cgu_created).total_seconds()
               cgu_precaching_durations.append(cgu_precache_duration)
 
-            if (condition["type"] == "BackupSuceeded" and condition["status"] == "True" and
-                (condition["reason"] == "BackupCompleted" or condition["reason"] == "PartiallyDone")):
-              backup_ltt = datetime.strptime(condition["lastTransitionTime"], "%Y-%m-%dT%H:%M:%SZ")
-              cgu_backup_duration = (backup_ltt - cgu_startedAt).total_seconds()
-              cgu_backup_durations.append(cgu_backup_duration)
-
-            if condition["type"] == "Progressing" and condition["status"] == "True" and condition["reason"] == "InProgress":
-              cgu_status = "InProgress"
-            if condition["type"] == "Succeeded" and condition["status"] == "False" and condition["reason"] == "TimedOut":
-              cgu_status = "TimedOut"
-            if condition["type"] == "Succeeded" and condition["status"] == "True" and condition["reason"] == "Completed":
-              cgu_status = "Completed"
+            if cgu_status == "UpgradeCompleted" and cgu_startedAt != "" and cgu_completedAt != "":
+              cgu_duration = (cgu_completedAt - cgu_startedAt).total_seconds()
               cgu_succeeded_durations.append(cgu_duration)
-            if cgu_status != "unknown":
-              if cgu_status not in cgu_conditions:
-                cgu_conditions[cgu_status] = 1
-              else:
-                cgu_conditions[cgu_status] += 1
-              break
-        else:
-          if condition["reason"] not in cgu_conditions:
-            cgu_conditions[condition["reason"]] = 1
-          else:
-            cgu_conditions[condition["reason"]] += 1
-          if condition["type"] == "Ready":
-            if condition["status"] == "True":
-              if "completedAt" in item["status"]["status"]:
-                # Determine latest populated completed time
-                cgu_completedAt = datetime.strptime(item["status"]["status"]["completedAt"], "%Y-%m-%dT%H:%M:%SZ")
-                if cgus_completed_time == "":
-                  cgus_completed_time = cgu_completedAt
-                elif cgus_completed_time < cgu_completedAt:
-                  logger.info("Replacing cgu completed time {} with later time {}".format(cgus_completed_time, cgu_completedAt))
-                  cgus_completed_time = cgu_completedAt
-            cgu_status = condition["reason"]
-          elif condition["type"] == "PrecachingDone":
-            precache_ltt = datetime.strptime(condition["lastTransitionTime"], "%Y-%m-%dT%H:%M:%SZ")
-            if cgus_precache_time == "":
-              cgus_precache_time = precache_ltt
-            elif cgus_precache_time < precache_ltt:
-              logger.info("Replacing cgu precaching done time {} with later time {}".format(cgus_precache_time, precache_ltt))
-              cgus_precache_time = precache_ltt
-            cgu_precache_duration = (cgus_precache_time - cgu_created).total_seconds()
-            cgu_precaching_durations.append(cgu_precache_duration)
-
-          if cgu_status == "UpgradeCompleted" and cgu_startedAt != "" and cgu_completedAt != "":
-            cgu_duration = (cgu_completedAt - cgu_startedAt).total_seconds()
-            cgu_succeeded_durations.append(cgu_duration)
-    else:
-      logger.warning("Missing conditions from status in CGU {}".format(cgu_name))
-    # logger.info("{},{},{},{},{}".format(cgu_name, cgu_status, cgu_startedAt, cgu_completedAt, cgu_duration))
+      else:
+        logger.warning("Missing conditions from status in CGU {}".format(cgu_name))
+      # logger.info("{},{},{},{},{}".format(cgu_name, cgu_status, cgu_startedAt, cgu_completedAt, cgu_duration))
 
-    with open(cgu_csv_file, "a") as csv_file:
-      csv_file.write("{},{},{},{},{},{},{},{},{},{}\n".format(cgu_name, cgu_status, cgu_created, precache_ltt, cgu_precache_duration, cgu_startedAt, backup_ltt, cgu_backup_duration, cgu_completedAt, cgu_duration))
+      with open(cgu_csv_file, "a") as csv_file:
+        csv_file.write("{},{},{},{},{},{},{},{},{},{}\n".format(cgu_name, cgu_status, cgu_created, precache_ltt, cgu_precache_duration, cgu_startedAt, backup_ltt, cgu_backup_duration, cgu_completedAt, cgu_duration))
 
   logger.info("Writing Stats: {}".format(cgu_stats_file))
 
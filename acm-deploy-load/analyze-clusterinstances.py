@@ -19,7 +19,7 @@
 import argparse
 from datetime import datetime
 import json
-from utils.command import command
+from utils.kube import get_client
 from utils.output import log_write
 import logging
 import numpy as np
@@ -68,13 +68,10 @@ def main():
   ci_stats_file = "{}/clusterinstances-{}.stats".format(cliargs.results_directory, ts)
 
   if not cliargs.offline_process:
-    oc_cmd = ["oc", "get", "clusterinstances", "-A", "-o", "json"]
-    rc, output = command(oc_cmd, False, retries=3, no_log=True)
+    rc = get_client().write_list(raw_data_file, "siteconfig.open-cluster-management.io/v1alpha1", "clusterinstances", retries=3)
     if rc != 0:
-      logger.error("analyze-clusterinstances, oc get clusterinstances rc: {}".format(rc))
+      logger.error("analyze-clusterinstances, list clusterinstances rc: {}".format(rc))
       sys.exit(1)
-    with open(raw_data_file, "w") as ci_data_file:
-      ci_data_file.write(output)
   with open(raw_data_file, "r") as ci_file_data:
     ci_data = json.load(ci_file_data)
 
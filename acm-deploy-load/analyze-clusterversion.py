@@ -21,10 +21,18 @@ import argparse
 from collections import OrderedDict
 from datetime import datetime
 import json
-from utils.command import command
+from utils.kube import get_client
 from utils.output import log_write
+from utils.results import convert_csv
+from utils.spoke_collector import add_collector_arguments
+from utils.spoke_collector import read_raw
+from utils.spoke_collector import resuming
+from utils.spoke_collector import SpokeCollector
+from utils.spoke_collector import spoke_request
 import logging
 import numpy as np
+import os
+from pathlib import Path
 import sys
 import time
 
@@ -43,26 +51,48 @@ def main():
   parser.add_argument("-k", "--kubeconfigs", type=str, default="/root/hv-vm/kc",
                       help="The location of the kubeconfigs, nested under each cluster's directory")
   parser.add_argument("results_directory", type=str, help="The location to place analyzed data")
+  parser.add_argument("--offline-process", action="store_true", default=False, help="Uses previously stored raw data")
+  parser.add_argument("--raw-data-directory", type=str, default="",
+                    help="Set raw data directory for offline processing. Empty finds last directory")
+  add_collector_arguments(parser)
   cliargs = parser.parse_args()
 
   logger.info("Analyze clusterversion")
   ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+  raw_data_dir = "{}/clusterversion-{}".format(cliargs.results_directory, ts)
+  if cliargs.offline_process or resuming(cliargs):
+    if cliargs.raw_data_directory == "":
+      # Detect last raw data directory
+      dir_scan = sorted([ f.path for f in os.scandir(cliargs.results_directory) if f.is_dir() and "clusterversion" in f.path ])
+      if len(dir_scan) == 0:
+        logger.error("No previous offline directories found. Exiting")
+        sys.exit(1)
+      raw_data_dir = dir_scan[-1]
+    else:
+      raw_data_dir = cliargs.raw_data_directory
+    logger.info("Reading raw data from: {}".format(raw_data_dir))
+  else:
+    Path(raw_data_dir).mkdir(parents=True, exist_ok=True)
+    logger.info("Storing raw data in: {}".format(raw_data_dir))
   cv_csv_file = "{}/clusterversion-{}.csv".format(cliargs.results_directory, ts)
   cv_stats_file = "{}/clusterversion-{}.stats".format(cliargs.results_directory, ts)
 
-  oc_cmd = ["oc", "get", "agentclusterinstalls", "-A", "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
-  if rc != 0:
-    logger.error("analyze-clusterversion, oc get agentclusterinstalls rc: {}".format(rc))
-    sys.exit(1)
-  aci_data = json.loads(output)
-
   clusters = []
   clusters_total = 0
   clusters_unreachable = []
   clusterversions_data = OrderedDict()
   clusters_dup_entries = []
 
+  if not cliargs.offline_process and not resuming(cliargs):
+    rc = get_client().write_list("{}/acis.json".format(raw_data_dir), "extensions.hive.openshift.io/v1beta1",
+        "agentclusterinstalls", retries=3)
+    if rc != 0:
+      logger.error("analyze-clusterversion, list agentclusterinstalls rc: {}".format(rc))
+      sys.exit(1)
+
+  with open("{}/acis.json".format(raw_data_dir), "r") as aci_data_file:
+    aci_data = json.load(aci_data_file)
+
   for item in aci_data["items"]:
     aci_name = item["metadata"]["name"]
     for condition in item["status"]["conditions"]:
@@ -75,21 +105,24 @@ def main():
   clusters_total = len(clusters)
   logger.info("Number of cluster clusterversions to examine: {}".format(clusters_total))
 
+  if not cliargs.offline_process:
+    SpokeCollector(cliargs.kubeconfigs, raw_data_dir,
+                   [spoke_request("cv", "config.openshift.io/v1", "clusterversions", "version")],
+                   cliargs.concurrency, cliargs.spoke_timeout).collect(clusters, cliargs.resume,
+                                                                       cliargs.retry_unreachable, cliargs.stale_after)
+
   logger.info("Writing CSV: {}".format(cv_csv_file))
   with open(cv_csv_file, "w") as csv_file:
     csv_file.write("name,version,state,startedTime,completionTime,duration\n")
 
   for cluster in clusters:
-    kubeconfig = "{}/{}/kubeconfig".format(cliargs.kubeconfigs, cluster)
-    oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "clusterversion", "version", "-o", "json"]
-    rc, output = command(oc_cmd, False, retries=2, no_log=True)
-    if rc != 0:
-      logger.error("analyze-clusterversion, oc get clusterversion rc: {}".format(rc))
+    cv_data = read_raw(raw_data_dir, cluster, "cv")
+    if cv_data == "":
+      logger.info("Recording {} as an unreachable cluster".format(cluster))
       clusters_unreachable.append(cluster)
       with open(cv_csv_file, "a") as csv_file:
         csv_file.write("{},NA,NA,,,\n".format(cluster))
       continue
-    cv_data = json.loads(output)
 
     for ver_hist_entry in cv_data["status"]["history"]:
       cv_version = ver_hist_entry["version"]
@@ -128,6 +161,8 @@ def main():
             clusters_dup_entries.append(cluster)
       with open(cv_csv_file, "a") as csv_file:
         csv_file.write("{},{},{},{},{},{}\n".format(cluster, cv_version, cv_state, cv_startedtime, cv_completiontime, cv_duration))
+  convert_csv(cv_csv_file, datetime_columns=["startedTime", "completionTime"],
+      dtype={"name": str, "version": str, "state": str})
 
   percent_unreachable = round((len(clusters_unreachable) / clusters_total) * 100, 1)
 
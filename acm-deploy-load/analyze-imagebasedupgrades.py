@@ -25,9 +25,13 @@ import json
 import logging
 import os
 from pathlib import Path
-from utils.command import command
+from utils.kube import get_client
 from utils.output import assemble_stats
 from utils.output import log_write
+from utils.spoke_collector import add_collector_arguments
+from utils.spoke_collector import resuming
+from utils.spoke_collector import SpokeCollector
+from utils.spoke_collector import spoke_request
 import sys
 import time
 
@@ -214,6 +218,7 @@ def main():
   parser.add_argument("-k", "--kubeconfigs", type=str, default="/root/hv-vm/kc",
                       help="The location of the kubeconfigs, nested under each cluster's directory")
   parser.add_argument("-ni", "--no-ibu-analysis", action="store_true", default=False, help="Skip analyzing individual IBU objects")
+  add_collector_arguments(parser)
   cliargs = parser.parse_args()
 
   ibu_analysis = not cliargs.no_ibu_analysis
@@ -221,7 +226,7 @@ def main():
   logger.info("Analyze imagebasedupgrade")
   ts = datetime.now().strftime("%Y%m%d-%H%M%S")
   raw_data_dir = "{}/ibu-{}-cgu-{}".format(cliargs.results_directory, cliargs.ocp_version, ts)
-  if cliargs.offline_process:
+  if cliargs.offline_process or resuming(cliargs):
     if cliargs.raw_data_directory == "":
       # Detect last raw data directory
       dir_scan = sorted([ f.path for f in os.scandir(cliargs.results_directory) if f.is_dir() and "ibu-{}-cgu".format(cliargs.ocp_version) in f.path ])
@@ -249,15 +254,13 @@ def main():
   gather_stages[cliargs.finalize_label] = "finalize-cgus.json"
 
   for stage_label in gather_stages:
-    if not cliargs.offline_process:
+    if not cliargs.offline_process and not resuming(cliargs):
       label_selector = "{}={}".format(stage_label, cliargs.ocp_version)
-      oc_cmd = ["oc", "get", "clustergroupupgrades", "-n", cliargs.namespace, "-l", label_selector, "-o", "json"]
-      rc, output = command(oc_cmd, False, retries=3, no_log=True)
+      rc = get_client().write_list("{}/{}".format(raw_data_dir, gather_stages[stage_label]), "ran.openshift.io/v1alpha1",
+          "clustergroupupgrades", cliargs.namespace, label_selector, retries=3)
       if rc != 0:
-        logger.error("analyze-imagebasedupgrade, oc get clustergroupupgrades -n {} -l {} rc: {}".format(cliargs.namespace, label_selector, cliargs.ocp_version, rc))
+        logger.error("analyze-imagebasedupgrade, list clustergroupupgrades -n {} -l {} rc: {}".format(cliargs.namespace, label_selector, rc))
         sys.exit(1)
-      with open("{}/{}".format(raw_data_dir, gather_stages[stage_label]), "w") as cgu_data_file:
-        cgu_data_file.write(output)
 
   logger.info("Reading {}/prep-cgus.json".format(raw_data_dir))
   with open("{}/prep-cgus.json".format(raw_data_dir), "r") as cgu_data_file:
@@ -315,17 +318,12 @@ def main():
 
   if ibu_analysis:
     # Get individual cluster IBU data here
+    if not cliargs.offline_process:
+      SpokeCollector(cliargs.kubeconfigs, raw_data_dir,
+                     [spoke_request("ibu", "lca.openshift.io/v1", "imagebasedupgrades", "upgrade")],
+                     cliargs.concurrency, cliargs.spoke_timeout).collect(ibus, cliargs.resume,
+                                                                         cliargs.retry_unreachable, cliargs.stale_after)
     for cluster in ibus:
-      kubeconfig = "{}/{}/kubeconfig".format(cliargs.kubeconfigs, cluster)
-      if not cliargs.offline_process:
-        oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "ibu", "upgrade", "-o", "json"]
-        rc, output = command(oc_cmd, False, retries=2, no_log=True)
-        if rc != 0:
-          logger.error("analyze-imagebasedupgrade, oc get ibu rc: {}".format(rc))
-          output = ""
-        with open("{}/{}-ibu.json".format(raw_data_dir, cluster), "w") as ibu_data_file:
-          ibu_data_file.write(output)
-
       if os.stat("{}/{}-ibu.json".format(raw_data_dir, cluster)).st_size == 0:
         ibu_data = ""
       else:
@@ -19,7 +19,7 @@
 import argparse
 from datetime import datetime
 import json
-from utils.command import command
+from utils.kube import get_client
 from utils.output import log_write
 import logging
 import numpy as np
@@ -68,13 +68,10 @@ def main():
   ici_stats_file = "{}/imageclusterinstalls-{}.stats".format(cliargs.results_directory, ts)
 
   if not cliargs.offline_process:
-    oc_cmd = ["oc", "get", "imageclusterinstalls", "-A", "-o", "json"]
-    rc, output = command(oc_cmd, False, retries=3, no_log=True)
+    rc = get_client().write_list(raw_data_file, "extensions.hive.openshift.io/v1alpha1", "imageclusterinstalls", retries=3)
     if rc != 0:
-      logger.error("analyze-imageclusterinstalls, oc get imageclusterinstalls rc: {}".format(rc))
+      logger.error("analyze-imageclusterinstalls, list imageclusterinstalls rc: {}".format(rc))
       sys.exit(1)
-    with open(raw_data_file, "w") as ici_data_file:
-      ici_data_file.write(output)
   with open(raw_data_file, "r") as ici_file_data:
     ici_data = json.load(ici_file_data)
 
@@ -19,21 +19,32 @@
 # import prometheus_api_client
 import argparse
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
 from utils.common_ocp import get_base_ocp_namespaces
 from utils.common_ocp import get_ocp_namespace_list
 from utils.common_ocp import get_ocp_version
 from utils.common_ocp import get_prometheus_token
 from utils.common_ocp import get_thanos_querier_route
+from utils.prometheus_cache import QueryCache
+from utils.prometheus_catalog import namespace_selector
+from utils.prometheus_catalog import plan_queries
+from utils.results import read_results
+from utils.results import write_results
 from utils.talm import detect_talm_csv
 import json
 import logging
+import multiprocessing
+import numpy as np
 import os
 import pandas as pd
 import plotly.express as px
+import re
 import urllib3
 import requests
+from requests.adapters import HTTPAdapter
 import sys
+from threading import Lock
 import time
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -48,717 +59,89 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(
 logger = logging.getLogger("acm-deploy-load")
 logging.Formatter.converter = time.gmtime
 
-
-def calculate_query_offset(end_ts):
-  cur_utc_unix_time = time.mktime(datetime.now(tz=timezone.utc).timetuple())
-  offset_minutes = (int(cur_utc_unix_time) - end_ts) / 60
-  if offset_minutes < 1:
-    offset_minutes = 0
-  return offset_minutes
-
-
-def aap_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "aap")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # Interesting AAP Objects:
-  # q = "apiserver_storage_objects{resource='ansiblejobs.tower.ansible.com'}"
-  # query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "aap-aj", "AnsibleJob Objects", "Count", w, h, q_names)
-
-  # AAP Namespace
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform'})"
-  query_thanos(route, q, "ansible-automation-platform", token, end_ts, duration, sub_report_dir, "cpu-aap", "ansible-automation-platform CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform'})"
-  query_thanos(route, q, "ansible-automation-platform", token, end_ts, duration, sub_report_dir, "mem-aap", "ansible-automation-platform Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='ansible-automation-platform'}[5m]))"
-  query_thanos(route, q, "ansible-automation-platform", token, end_ts, duration, sub_report_dir, "net-rcv-aap", "ansible-automation-platform Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='ansible-automation-platform'}[5m]))"
-  query_thanos(route, q, "ansible-automation-platform", token, end_ts, duration, sub_report_dir, "net-xmt-aap", "ansible-automation-platform Network Transmit Throughput", "NET", w, h, q_names)
-
-  # AAP Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-gateway-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-gateway-operator", "AAP Gateway Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-gateway-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-gateway-operator", "AAP Gateway Operator Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'automation-controller-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ac-operator", "AAP Automation Controller Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'automation-controller-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ac-operator", "AAP Automation Controller Operator Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'automation-hub-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ah-operator", "AAP Automation Hub Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'automation-hub-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ah-operator", "AAP Automation Hub Operator Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'eda-server-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-operator", "AAP EDA Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'eda-server-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-operator", "AAP EDA Operator Memory Usage", "MEM", w, h, q_names)
-
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'ansible-lightspeed-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-lightspeed-operator", "AAP Lightspeed Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'ansible-lightspeed-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-lightspeed-operator", "AAP Lightspeed Operator Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'resource-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-resource-operator", "AAP Resource Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'resource-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-resource-operator", "AAP Resource Operator Memory Usage", "MEM", w, h, q_names)
-
-  # AAP Postgres and Redis Pod
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-postgres-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-postgres", "AAP Postgres CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-postgres-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-postgres", "AAP Postgres Memory Usage", "MEM", w, h, q_names)
-
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-redis-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-redis", "AAP Redis CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-redis-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-redis", "AAP Redis Memory Usage", "MEM", w, h, q_names)
-
-  # AAP Automation Controller pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-controller-task-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ac-task", "AAP Controller Task CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-controller-task-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ac-task", "AAP Controller Task Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-controller-web-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ac-web", "AAP Controller Web CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-controller-web-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ac-web", "AAP Controller Web Memory Usage", "MEM", w, h, q_names)
-
-  # AAP Automation Hub pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-api-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ah-api", "AAP Hub Api CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-api-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ah-api", "AAP Hub Api Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-content-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ah-content", "AAP Hub Content CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-content-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ah-content", "AAP Hub Content Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-redis-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ah-redis", "AAP Hub Redis CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-redis-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ah-redis", "AAP Hub Redis Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-web-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ah-web", "AAP Hub Web CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-web-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ah-web", "AAP Hub Web Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-worker-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-ah-worker", "AAP Hub Worker CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-worker-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-ah-worker", "AAP Hub Worker Memory Usage", "MEM", w, h, q_names)
-
-  # AAP EDA pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-activation-worker-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-activation-worker", "EDA Activation Worker CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-activation-worker-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-activation-worker", "EDA Activation Worker Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-api-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-api", "EDA Api CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-api-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-api", "EDA Api Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-default-worker-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-default-worker", "EDA Default Worker CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-default-worker-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-default-worker", "EDA Default Worker Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-event-stream-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-event-stream", "EDA Event Stream CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-event-stream-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-event-stream", "EDA Event Stream Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-scheduler-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-scheduler", "EDA Scheduler CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-scheduler-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-scheduler", "EDA Scheduler Memory Usage", "MEM", w, h, q_names)
-
-  # AAP EDA Activation Job pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'activation-job-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-eda-activation-jobs", "EDA Activation Jobs CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'activation-job-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-eda-activation-jobs", "EDA Activation Jobs Memory Usage", "MEM", w, h, q_names)
-
-  # AAP Automation Job pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'automation-job-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-aap-automation-jobs", "AAP Automation Jobs CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'automation-job-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-aap-automation-jobs", "AAP Automation Jobs Memory Usage", "MEM", w, h, q_names)
-  return q_names
-
-
-def adp_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "adp")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # ADP openshift-adp Namespace CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-adp'})"
-  query_thanos(route, q, "openshift-adp", token, end_ts, duration, sub_report_dir, "cpu-adp", "OpenShift ADP CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-adp'})"
-  query_thanos(route, q, "openshift-adp", token, end_ts, duration, sub_report_dir, "mem-adp", "OpenShift ADP Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-adp'}[5m]))"
-  query_thanos(route, q, "openshift-adp", token, end_ts, duration, sub_report_dir, "net-rcv-adp", "OpenShift ADP Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-adp'}[5m]))"
-  query_thanos(route, q, "openshift-adp", token, end_ts, duration, sub_report_dir, "net-xmt-adp", "OpenShift ADP Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ADP pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-adp'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-adp-pods", "OpenShift ADP Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-adp'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-adp-pods", "OpenShift ADP Pod Memory Usage", "MEM", w, h, q_names)
-  return q_names
-
-
-# ACM - open-cluster-management-agent and open-cluster-management-agent-addon namespaces only
-def acm_agent_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "acm-agent")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  acm_agent_namespaces = [
-    "open-cluster-management-addon-observability",
-    "open-cluster-management-agent",
-    "open-cluster-management-agent-addon"
-  ]
-  ns = "namespace=~'" + "|".join(acm_agent_namespaces) + "'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "open-cluster-management-agent + addons", token, end_ts, duration, sub_report_dir, "cpu-acm-agent", "ACM Agent+Addons CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "open-cluster-management-agent + addons", token, end_ts, duration, sub_report_dir, "mem-acm-agent", "ACM Agent+Addons Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "open-cluster-management-agent + addons", token, end_ts, duration, sub_report_dir, "net-rcv-acm-agent", "ACM Agent+Addons Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "open-cluster-management-agent + addons", token, end_ts, duration, sub_report_dir, "net-xmt-acm-agent", "ACM Agent+Addons Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM open-cluster-management-agent pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-agent'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-agent-pods", "ACM Agent Pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-agent'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-agent-pods", "ACM Agent Pods Memory Usage", "MEM", w, h, q_names)
-
-  # ACM open-cluster-management-agent-addon pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-agent-addon'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-agent-addon-pods", "ACM Agent Addon Pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-agent-addon'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-agent-addon-pods", "ACM Agent Addon Pods Memory Usage", "MEM", w, h, q_names)
-
-  # ACM open-cluster-management-addon-observability pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-addon-observability'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-addon-obs-pods", "ACM Addon Observability Pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-addon-observability'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-addon-obs-pods", "ACM Addon Observability Pods Memory Usage", "MEM", w, h, q_names)
-  return q_names
-
-
-# ACM - Complete (Opininated list of Hub ACM Namespaces)
-def acm_complete_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "acm-complete")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  acm_namespaces = [
-    "open-cluster-management",
-    "open-cluster-management-agent",
-    "open-cluster-management-agent-addon",
-    "open-cluster-management-hub",
-    "open-cluster-management-observability"
-  ]
-  ns = "namespace=~'" + "|".join(acm_namespaces) + "'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "cpu-acm-complete", "ACM Complete CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "mem-acm-complete", "ACM Complete Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "net-rcv-acm-complete", "ACM Complete Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "net-xmt-acm-complete", "ACM Complete Network Transmit Throughput", "NET", w, h, q_names)
-
-  # Remove "open-cluster-management-observability" namespace from acm_namespaces list
-  acm_namespaces.remove("open-cluster-management-observability")
-  ns = "namespace=~'" + "|".join(acm_namespaces) + "'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "cpu-acm-complete-no-obs", "ACM Complete (No Observability) CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "mem-acm-complete-no-obs", "ACM Complete (No Observability) Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "net-rcv-acm-complete-no-obs", "ACM Complete (No Observability) Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "ACM Complete", token, end_ts, duration, sub_report_dir, "net-xmt-acm-complete-no-obs", "ACM Complete (No Observability) Network Transmit Throughput", "NET", w, h, q_names)
-
-  return q_names
-
-
-# ACM - open-cluster-management-hub namespace only
-def acm_hub_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "acm-hub")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # ACM open-cluster-management-hub namespace CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-hub'})"
-  query_thanos(route, q, "open-cluster-management-hub", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm", "ACM open-cluster-management-hub CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-hub'})"
-  query_thanos(route, q, "open-cluster-management-hub", token, end_ts, duration, sub_report_dir, "mem-acm-ocm", "ACM open-cluster-management-hub Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))"
-  query_thanos(route, q, "open-cluster-management-hub", token, end_ts, duration, sub_report_dir, "net-rcv-acm-ocm", "ACM open-cluster-management-hub Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))"
-  query_thanos(route, q, "open-cluster-management-hub", token, end_ts, duration, sub_report_dir, "net-xmt-acm-ocm", "ACM open-cluster-management-hub Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM open-cluster-management-hub pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-hub'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-hub-pods", "ACM Hub NS Pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-hub'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-hub-pods", "ACM Hub NS Pods Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-acm-hub-pods", "ACM Hub NS Pods Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-acm-hub-pods", "ACM Hub NS Pods Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-# ACM & MCE Complete (Complete cost of ACM which includes MCE and additional MCE namespaces)
-def acm_mce_complete_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "acm-mce-complete")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  mce_namespaces = [
-    "hive",
-    "hypershift",
-    "multicluster-engine",
-    "open-cluster-management",
-    "open-cluster-management-agent",
-    "open-cluster-management-agent-addon",
-    "open-cluster-management-hub",
-    "open-cluster-management-observability",
-    "openshift-user-workload-monitoring"
-  ]
-  ns = "namespace=~'" + "|".join(mce_namespaces) + "'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "ACM & MCE Complete", token, end_ts, duration, sub_report_dir, "cpu-acm-mce-complete", "ACM & MCE Complete CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "ACM & MCE Complete", token, end_ts, duration, sub_report_dir, "mem-acm-mce-complete", "ACM & MCE Complete Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "ACM & MCE Complete", token, end_ts, duration, sub_report_dir, "net-rcv-acm-mce-complete", "ACM & MCE Complete Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "ACM & MCE Complete", token, end_ts, duration, sub_report_dir, "net-xmt-acm-mce-complete", "ACM & MCE Complete Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-# ACM - open-cluster-management-observability namespace only
-def acm_observability_queries(report_dir, route, token, end_ts, duration, w, h, namespaces):
-  sub_report_dir = os.path.join(report_dir, "acm-observability")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # ACM Observability CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-observability'})"
-  query_thanos(route, q, "open-cluster-management-observability", token, end_ts, duration, sub_report_dir, "cpu-acm-obs", "ACM Observability CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management-observability'})"
-  query_thanos(route, q, "open-cluster-management-observability", token, end_ts, duration, sub_report_dir, "mem-acm-obs", "ACM Observability Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))"
-  query_thanos(route, q, "open-cluster-management-observability'", token, end_ts, duration, sub_report_dir, "net-rcv-acm-obs", "ACM Observability Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))"
-  query_thanos(route, q, "open-cluster-management-observability'", token, end_ts, duration, sub_report_dir, "net-xmt-acm-obs", "ACM Observability Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM Observability pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-observability'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-obs-pods", "ACM Observability Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-observability'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-obs-pods", "ACM Observability Pod Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-acm-obs-pods", "ACM Observability Pod Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-acm-obs-pods", "ACM Observability Pod Network Transmit Throughput", "NET", w, h, q_names)
-
-  # Major OBS Resource Consumer (Thanos Receive Default)
-  q = "sum(container_memory_working_set_bytes{cluster='',namespace='open-cluster-management-observability', pod=~'observability-thanos-receive-default.*', container!=''})"
-  query_thanos(route, q, "Thanos Receive Default ", token, end_ts, duration, sub_report_dir, "mem-acm-obs-rcv-total", "ACM Observability Receiver Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',namespace='open-cluster-management-observability', pod=~'observability-thanos-receive-default.*', container!=''})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-obs-rcv-pod", "ACM Observability Receiver Memory Usage", "MEM", w, h, q_names)
-
-  # Volume Space used by OBS
-  q = "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='open-cluster-management-observability'})"
-  query_thanos(route, q, "persistentvolumeclaim", token, end_ts, duration, sub_report_dir, "pvc-obs", "ACM Observability Volume Usage", "DISK_USAGE", w, h, q_names)
-
-  if "openshift-storage" in namespaces:
-    # NooBaa bucket used by ACM Observability Thanos object storage
-    q = "NooBaa_bucket_used_bytes{bucket_name=~'acm-observability-thanos.*'}"
-    query_thanos(route, q, "bucket_name", token, end_ts, duration, sub_report_dir, "noobaa-obs-bucket-used", "ACM Observability NooBaa Bucket Used", "DISK_USAGE", w, h, q_names)
-
-  return q_names
-
-
-# ACM - open-cluster-management namespace only
-def acm_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "acm")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # Interesting ACM objects
-  q = "apiserver_storage_objects{resource='managedclusters.cluster.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-mc", "Managedcluster Objects", "Count", w, h, q_names)
-  q = "apiserver_storage_objects{resource='managedclusteraddons.addon.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-mcaddons", "Managedclusteraddons Objects", "Count", w, h, q_names)
-  q = "apiserver_storage_objects{resource='policies.policy.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-policies", "Policy Objects", "Count", w, h, q_names)
-  q = "apiserver_storage_objects{resource='placementrules.apps.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-placementrules", "Placementrules Objects", "Count", w, h, q_names)
-  q = "apiserver_storage_objects{resource='placementbindings.policy.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-placementbindings", "Placementbindings Objects", "Count", w, h, q_names)
-  q = "apiserver_storage_objects{resource='placementdecisions.cluster.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-placementdecisions", "Placementdecisions Objects", "Count", w, h, q_names)
-  q = "apiserver_storage_objects{resource='manifestworks.work.open-cluster-management.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "acm-manifestworks", "Manifestworks Objects", "Count", w, h, q_names)
-
-  # ACM Open-cluster-management namespace CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management'})"
-  query_thanos(route, q, "open-cluster-management", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm", "ACM open-cluster-management CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management'})"
-  query_thanos(route, q, "open-cluster-management", token, end_ts, duration, sub_report_dir, "mem-acm-ocm", "ACM open-cluster-management Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))"
-  query_thanos(route, q, "open-cluster-management", token, end_ts, duration, sub_report_dir, "net-rcv-acm-ocm", "ACM open-cluster-management Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))"
-  query_thanos(route, q, "open-cluster-management", token, end_ts, duration, sub_report_dir, "net-xmt-acm-ocm", "ACM open-cluster-management Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM Open-cluster-management pods
-  # Graphing all open-cluster-management pods in one graph is too visually busy however useful to find outliers
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-pods", "Open-cluster-management Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-pods", "Open-cluster-management Pod Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-acm-ocm-pods", "Open-cluster-management Pod Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-acm-ocm-pods", "Open-cluster-management Pod Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM acm-cli-downloads CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'acm-cli-downloads.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-acm-cli-downloads", "ACM acm-cli-downloads CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'acm-cli-downloads.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-acm-cli-downloads", "ACM acm-cli-downloads Memory Usage", "MEM", w, h, q_names)
-
-  # ACM cluster-permission CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'cluster-permission.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-cluster-permission", "ACM cluster-permission CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'cluster-permission.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-cluster-permission", "ACM cluster-permission Memory Usage", "MEM", w, h, q_names)
-
-  # ACM console-chart-console-v2 CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'console-chart-console-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-console-chart-console-v2", "ACM console-chart-console-v2 CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'console-chart-console-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-console-chart-console-v2", "ACM console-chart-console-v2 Memory Usage", "MEM", w, h, q_names)
-
-  # ACM grc policy CPU/Memory/Network
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'grc-policy-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-grc-policy", "ACM grc-policy CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'grc-policy-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-grc-policy", "ACM grc-policy Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management',pod=~'grc-policy-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-acm-grc-policy-prop", "ACM grc-policy Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management',pod=~'grc-policy-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-acm-grc-policy-prop", "ACM grc-policy Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM insights CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'insights.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-insights", "ACM insights CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'insights.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-insights", "ACM insights Memory Usage", "MEM", w, h, q_names)
-
-  # ACM klusterlet-addon-controller-v2 CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'klusterlet-addon-controller-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-klusterlet-addon-controller-v2", "ACM klusterlet-addon-controller-v2 CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'klusterlet-addon-controller-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-klusterlet-addon-controller-v2", "ACM klusterlet-addon-controller-v2 Memory Usage", "MEM", w, h, q_names)
-
-  # ACM multicluster CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'multicluster-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-multicluster-", "ACM multicluster pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'multicluster-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-multicluster-", "ACM multicluster pods Memory Usage", "MEM", w, h, q_names)
-
-  # ACM multiclusterhub CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'multiclusterhub-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-multiclusterhub", "ACM multiclusterhub pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'multiclusterhub-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-multiclusterhub", "ACM multiclusterhub pods Memory Usage", "MEM", w, h, q_names)
-
-  # ACM Search CPU/Memory/Network
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'search.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-search", "ACM Search pods CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management',pod=~'search.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-search", "ACM Search pods Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-acm-search", "ACM Search pods Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-acm-search", "ACM Search pods Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM Search Total CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'search.*'})"
-  query_thanos(route, q, "ACM - Search", token, end_ts, duration, sub_report_dir, "cpu-acm-search-total", "ACM Search CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management',pod=~'search.*'})"
-  query_thanos(route, q, "ACM - Search", token, end_ts, duration, sub_report_dir, "mem-acm-search-total", "ACM Search Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))"
-  query_thanos(route, q, "ACM - Search", token, end_ts, duration, sub_report_dir, "net-rcv-acm-search-total", "ACM Search Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))"
-  query_thanos(route, q, "ACM - Search", token, end_ts, duration, sub_report_dir, "net-xmt-acm-search-total", "ACM Search Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ACM Volume Space used
-  q = "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='open-cluster-management'})"
-  query_thanos(route, q, "persistentvolumeclaim", token, end_ts, duration, sub_report_dir, "pvc-acm", "ACM Volume Usage", "DISK_USAGE", w, h, q_names)
-
-  # ACM siteconfig-controller-manager CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'siteconfig-controller-manager.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-siteconfig-controller-manager", "ACM siteconfig-controller-manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'siteconfig-controller-manager.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-siteconfig-controller-manager", "ACM siteconfig-controller-manager Memory Usage", "MEM", w, h, q_names)
-
-  # ACM submariner-addon CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'submariner-addon.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-submariner-addon", "ACM submariner-addon CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'submariner-addon.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-submariner-addon", "ACM submariner-addon Memory Usage", "MEM", w, h, q_names)
-
-  # ACM volsync-addon-controller CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'volsync-addon-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-acm-ocm-volsync-addon-controller", "ACM volsync-addon-controller CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'volsync-addon-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-acm-ocm-volsync-addon-controller", "ACM volsync-addon-controller Memory Usage", "MEM", w, h, q_names)
-  return q_names
-
-
-# Base OCP Combines All Base OCP Namespaces CPU/Memory/Network into a single metric/graph
-def base_ocp_queries(report_dir, route, token, end_ts, duration, w, h, ocp_version):
-  sub_report_dir = os.path.join(report_dir, "base-ocp")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  base_ocp_namespaces = get_base_ocp_namespaces(ocp_version)
-  ns = "namespace=~'" + "|".join(base_ocp_namespaces) + "'"
-  cpu_q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, cpu_q, "base-ocp", token, end_ts, duration, sub_report_dir, "cpu-base-ocp", "Base OCP CPU Cores Usage", "CPU", w, h, q_names)
-  mem_q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, mem_q, "base-ocp", token, end_ts, duration, sub_report_dir, "mem-base-ocp", "Base OCP Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace!=''," + ns + "}[5m]))"
-  query_thanos(route, q, "base-ocp", token, end_ts, duration, sub_report_dir, "net-rcv-base-ocp", "Base OCP Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace!=''," + ns + "}[5m]))"
-  query_thanos(route, q, "base-ocp", token, end_ts, duration, sub_report_dir, "net-xmt-base-ocp", "Base OCP Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-def cluster_queries(report_dir, route, token, end_ts, duration, w, h, namespaces):
-  sub_report_dir = os.path.join(report_dir, "cluster")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # Cluster Complete utilization (OS + Applications)
-  # sum(node_cpu_info) is Cluster Core Count and sum(irate(node_cpu_seconds_total{mode="idle"}[1m])) is Idle CPU Usage, subtract idle from core count
-  q = "(count(node_cpu_seconds_total{mode='idle'}) - sum(irate(node_cpu_seconds_total{mode='idle'}[1m])))"
-  query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "cpu-cluster", "Cluster CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(node_memory_MemTotal_bytes - node_memory_MemAvailable_bytes)"
-  query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "mem-cluster", "Cluster Memory Usage", "MEM", w, h, q_names)
-
-  # Cluster Application utilization below
-  if 'minio' in namespaces:
-    # Cluster CPU/Memory/Network and nonterminated pods (excluding Minio)
-    q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace!='minio'})"
-    query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "cpu-cluster-app_no-minio", "Cluster Application CPU Cores Usage (Excluding Minio)", "CPU", w, h, q_names)
-    q = "sum(container_memory_working_set_bytes{cluster='',namespace!='minio',container!=''})"
-    query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "mem-cluster-app_no-minio", "Cluster Application Memory Usage (Excluding Minio)", "MEM", w, h, q_names)
-    q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace!='',namespace!='minio'}[5m]))"
-    query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "net-rcv-cluster_no-minio", "Cluster Network Receive Throughput (Excluding Minio)", "NET", w, h, q_names)
-    q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace!='',namespace!='minio'}[5m]))"
-    query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "net-xmt-cluster_no-minio", "Cluster Network Transmit Throughput (Excluding Minio)", "NET", w, h, q_names)
-    q = "sum(kube_pod_status_phase{phase!='Succeeded',phase!='Failed',namespace!='minio'})"
-    query_thanos(route, q, "non-terminated pods", token, end_ts, duration, sub_report_dir, "nonterm-pods-cluster_no-minio", "Non-terminated pods across entire cluster (Excluding Minio)", "Count", w, h, q_names)
-
-  # Cluster CPU/Memory/Network and nonterminated pods (No namespaces excluded)
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''})"
-  query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "cpu-cluster-app", "Cluster Application CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''})"
-  query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "mem-cluster-app", "Cluster Application Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace!=''}[5m]))"
-  query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "net-rcv-cluster", "Cluster Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace!=''}[5m]))"
-  query_thanos(route, q, "cluster", token, end_ts, duration, sub_report_dir, "net-xmt-cluster", "Cluster Network Transmit Throughput", "NET", w, h, q_names)
-  q = "sum(kube_pod_status_phase{phase!='Succeeded',phase!='Failed'})"
-  query_thanos(route, q, "non-terminated pods", token, end_ts, duration, sub_report_dir, "nonterm-pods-cluster", "Non-terminated pods across entire cluster", "Count", w, h, q_names)
-  # Sum of nodes in each status (Ready, DiskPressure, MemoryPressure, PIDPressure)
-  q = "sum by (condition) (kube_node_status_condition{status='true'})"
-  query_thanos(route, q, "condition", token, end_ts, duration, sub_report_dir, "cluster-node-status", "Cluster Nodes Status", "Count", w, h, q_names)
-  return q_names
-
-
-def core_ocp_queries(report_dir, route, token, end_ts, duration, w, h):
-  # Opinionated list of OCP Namespaces to collect prometheus data on
-  core_ocp_namespaces = [
-    "openshift-apiserver",
-    "openshift-console",
-    "openshift-controller-manager",
-    "openshift-etcd",
-    "openshift-ingress",
-    "openshift-kni-infra",
-    "openshift-kube-apiserver",
-    "openshift-kube-controller-manager",
-    "openshift-kube-scheduler",
-    "openshift-machine-api",
-    "openshift-monitoring",
-    "openshift-ovn-kubernetes"
-  ]
-
-  sub_report_dir = os.path.join(report_dir, "core-ocp")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  for ns in core_ocp_namespaces:
-    q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='" + ns + "'})"
-    query_thanos(route, q, ns, token, end_ts, duration, sub_report_dir, "cpu-{}".format(ns), "{} CPU Cores Usage".format(ns), "CPU", w, h, q_names)
-    q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='" + ns + "'})"
-    query_thanos(route, q, ns, token, end_ts, duration, sub_report_dir, "mem-{}".format(ns), "{} Memory Usage".format(ns), "MEM", w, h, q_names)
-    # q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='" + ns + "'}[5m]))"
-    # query_thanos(route, q, ns, token, end_ts, duration, sub_report_dir, "net-rcv-{}".format(ns), "{} Network Receive Throughput".format(ns), "NET", w, h, q_names)
-    # q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='" + ns + "'}[5m]))"
-    # query_thanos(route, q, ns, token, end_ts, duration, sub_report_dir, "net-xmt-{}".format(ns), "{} Network Transmit Throughput".format(ns), "NET", w, h, q_names)
-
-    # split by pods in the namespaces
-    q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='" + ns + "'})"
-    query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-{}-pod".format(ns), "{} CPU Cores Usage".format(ns), "CPU", w, h, q_names)
-    q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='" + ns + "'})"
-    query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-{}-pod".format(ns), "{} Memory Usage".format(ns), "MEM", w, h, q_names)
-
-    # Volume space used by openshift-monitoring, just monitoring for now
-    if ns == "openshift-monitoring":
-      q = "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='" + ns + "'})"
-      query_thanos(route, q, "persistentvolumeclaim", token, end_ts, duration, sub_report_dir, "pvc-{}".format(ns), "{} Volume Usage".format(ns), "DISK_USAGE", w, h, q_names)
-
-  q = "(sum by (container) (kube_pod_container_status_restarts_total) > 3)"
-  query_thanos(route, q, "container", token, end_ts, duration, sub_report_dir, "pod-restarts", "Pod Restarts > 3", "Count", w, h, q_names)
-  return q_names
-
-
-def etcd_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "etcd")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # ETCD DB Size is what can trigger out of quota
-  q = "etcd_mvcc_db_total_size_in_bytes"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "db-size", "ETCD DB Size", "DISK_USAGE", w, h, q_names)
-  q = "etcd_mvcc_db_total_size_in_use_in_bytes"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "db-size-in-use", "ETCD DB Size In-use", "DISK_USAGE", w, h, q_names)
-  q = "histogram_quantile(0.99, sum(rate(etcd_disk_wal_fsync_duration_seconds_bucket{job='etcd'}[5m])) by (instance, pod, le))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "fsync-duration", "ETCD Disk Sync Duration", "Seconds", w, h, q_names)
-  q = "histogram_quantile(0.99, irate(etcd_disk_backend_commit_duration_seconds_bucket[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "backend-commit-duration", "ETCD Backend Commit Duration", "Seconds", w, h, q_names)
-  q = "changes(etcd_server_leader_changes_seen_total{job='etcd'}[1d])"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "total-leader-elections", "ETCD Leader Elections Per Day", "Count", w, h, q_names)
-  q = "max by (pod) (etcd_server_leader_changes_seen_total)"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "leader-changes", "ETCD Max Leader Changes", "Count", w, h, q_names)
-
-  # Summing by pod means latencies between each other member are "summed" FYI
-  q = "sum by (pod) (histogram_quantile(0.99, irate(etcd_network_peer_round_trip_time_seconds_bucket[1m])))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "peer-roundtrip-time", "ETCD Peer Roundtrip Time", "Seconds", w, h, q_names)
-  return q_names
-
-
-def gitops_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "gitops")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # GitOps has two namespaces
-  gitops_namespaces = [
-    "openshift-gitops-operator",
-    "openshift-gitops"
-  ]
-  ns = "namespace=~'" + "|".join(gitops_namespaces) + "'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "openshift-gitops", token, end_ts, duration, sub_report_dir, "cpu-gitops", "OpenShift GitOps CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "openshift-gitops", token, end_ts, duration, sub_report_dir, "mem-gitops", "OpenShift GitOps Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "openshift-gitops", token, end_ts, duration, sub_report_dir, "net-rcv-gitops", "OpenShift GitOps Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "openshift-gitops", token, end_ts, duration, sub_report_dir, "net-xmt-gitops", "OpenShift GitOps Network Transmit Throughput", "NET", w, h, q_names)
-
-  # GitOps pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-gitops-pod", "OpenShift GitOps Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-gitops-pod", "OpenShift GitOps Pod Memory Usage", "MEM", w, h, q_names)
-  return q_names
-
-
-def hive_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "hive")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # Hive CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='hive'})"
-  query_thanos(route, q, "hive", token, end_ts, duration, sub_report_dir, "cpu-hive", "Hive CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='hive'})"
-  query_thanos(route, q, "hive", token, end_ts, duration, sub_report_dir, "mem-hive", "Hive Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='hive'}[5m]))"
-  query_thanos(route, q, "hive", token, end_ts, duration, sub_report_dir, "net-rcv-hive", "Hive Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='hive'}[5m]))"
-  query_thanos(route, q, "hive", token, end_ts, duration, sub_report_dir, "net-xmt-hive", "Hive Network Transmit Throughput", "NET", w, h, q_names)
-
-  # Hive pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='hive'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-hive-pods", "Hive Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='hive'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-hive-pods", "Hive Pod Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='hive'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-hive-pods", "Hive Pod Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='hive'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-hive-pods", "Hive Pod Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-def hypershift_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "hypershift")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # Hypershift CPU/Memory/Network
-  q = "sum (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='hypershift'})"
-  query_thanos(route, q, "hypershift", token, end_ts, duration, sub_report_dir, "cpu-hypershift", "Hypershift CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='hypershift'})"
-  query_thanos(route, q, "hypershift", token, end_ts, duration, sub_report_dir, "mem-hypershift", "Hypershift Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='hypershift'}[5m]))"
-  query_thanos(route, q, "hypershift", token, end_ts, duration, sub_report_dir, "net-rcv-hypershift", "Hypershift Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='hypershift'}[5m]))"
-  query_thanos(route, q, "hypershift", token, end_ts, duration, sub_report_dir, "net-xmt-hypershift", "Hypershift Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-def hypershift_uwm_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "hypershift-uwm")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # OpenShift User Workload Monitoring CPU/Memory/Network
-  q = "sum (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-user-workload-monitoring'})"
-  query_thanos(route, q, "hypershift-uwm", token, end_ts, duration, sub_report_dir, "cpu-hypershift-uwm", "Hypershift UWM CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-user-workload-monitoring'})"
-  query_thanos(route, q, "hypershift-uwm", token, end_ts, duration, sub_report_dir, "mem-hypershift-uwm", "Hypershift UWM Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))"
-  query_thanos(route, q, "hypershift-uwm", token, end_ts, duration, sub_report_dir, "net-rcv-hypershift-uwm", "Hypershift UWM Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))"
-  query_thanos(route, q, "hypershift-uwm", token, end_ts, duration, sub_report_dir, "net-xmt-hypershift-uwm", "Hypershift UWM Network Transmit Throughput", "NET", w, h, q_names)
-
-  # OpenShift User Workload Monitoring pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-user-workload-monitoring'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-hypershift-uwm-pods", "Hypershift UWM Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-user-workload-monitoring'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-hypershift-uwm-pods", "Hypershift UWM Pod Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-hypershift-uwm-pods", "Hypershift UWM Pod Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-hypershift-uwm-pods", "Hypershift UWM Pod Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-def lso_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "lso")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # Local Storage Operator CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-local-storage'})"
-  query_thanos(route, q, "openshift-local-storage", token, end_ts, duration, sub_report_dir, "cpu-lso", "OpenShift LSO CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-local-storage'})"
-  query_thanos(route, q, "openshift-local-storage", token, end_ts, duration, sub_report_dir, "mem-lso", "OpenShift LSO Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-local-storage'}[5m]))"
-  query_thanos(route, q, "openshift-local-storage", token, end_ts, duration, sub_report_dir, "net-rcv-lso", "OpenShift LSO Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-local-storage'}[5m]))"
-  query_thanos(route, q, "openshift-local-storage", token, end_ts, duration, sub_report_dir, "net-xmt-lso", "OpenShift LSO Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
+# Analysis runs in two stages. Stage one plans the queries of utils/prometheus_catalog.py into requests, runs them on
+# query_executor over one pooled session to thanos-querier and persists each query result as csv and stats, recording
+# it in graphs.json. Stage two renders graphs.json into pngs on processes that each keep one kaleido instance, and can
+# be skipped (--no-graphs) or run later (--render-only).
+session = requests.Session()
+query_executor = None
+query_futures = []
+# Range queries are split into chunks of query_chunk_seconds fetched on fetch_executor, apart from query_executor so
+# queries waiting on their chunks never starve the chunk fetches
+fetch_executor = None
+query_chunk_seconds = 6 * 60 * 60
+# Decoded chunks of historical windows are kept on disk so re-running an analysis does not query thanos again
+query_cache = None
+graphs = []
+graphs_lock = Lock()
+# Multipliers converting raw prometheus values into the graphed unit
+UNIT_SCALE = {
+  "MEM": 1 / (1024 * 1024 * 1024),
+  # Prometheus irate() returns bytes/s; convert to megabits per second (Mbps)
+  "NET": 8 / 1_000_000,
+  "DISK_USAGE": 1 / (1000 * 1000 * 1000),
+  "DISK_TPUT_MB": 1 / (1000 * 1000),
+}
+
+
+def duration_seconds(duration):
+  # Converts a prometheus duration such as 30s, 1m, 6h or 2d into seconds
+  units = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+  return int(duration[:-1]) * units[duration[-1]]
+
+
+def query_range(route, query, token, start_ts, end_ts, step):
+  # Returns rc and the result matrix of a range query, rc is 0 on success
+  # Use POST body so the query is form-encoded; putting it in the URL unencoded breaks
+  # complex queries (spaces, quotes, slashes, regex) and can return empty results.
+  query_endpoint = "{}/api/v1/query_range".format(route)
+  headers = {"Authorization": "Bearer {}".format(token)}
+  payload = {"query": query, "start": start_ts, "end": end_ts, "step": step}
+  try:
+    query_data = session.post(query_endpoint, headers=headers, data=payload, verify=False)
+  except requests.exceptions.RequestException as e:
+    logger.error("Query range {} to {} failed: {}".format(start_ts, end_ts, e))
+    return 1, []
+  if query_data.status_code != 200:
+    logger.error("Query Post status returned: {}".format(query_data.status_code))
+    logger.error("Query response: \n{}".format(query_data.text.rstrip()))
+    return query_data.status_code, []
+  qd_json = query_data.json()
+  if ("data" not in qd_json) or ("result" not in qd_json["data"]):
+    logger.error("Missing data/results field(s) from query result: {}".format(qd_json))
+    return 1, []
+  return 0, qd_json["data"]["result"]
+
+
+def decode_series(result):
+  # Converts each series of a result matrix to an (n, 2) float array of [unix_ts, value] in one pass, values are
+  # strings and may be NaN or +Inf
+  lengths = [len(metric["values"]) for metric in result]
+  points = np.array([point for metric in result for point in metric["values"]], dtype=object).reshape(-1, 2)
+  points = points.astype(np.float64)
+  return [{"metric": metric["metric"], "values": values} for metric, values in
+          zip(result, np.split(points, np.cumsum(lengths)[:-1]))]
+
+
+def decode_matrix(result, series_label, scale=1.0):
+  # Decodes series from decode_series into one wide DataFrame with a datetime column and a column per series
+  lengths = [len(metric["values"]) for metric in result]
+  names = [metric["metric"].get(series_label, series_label) for metric in result]
+  points = np.concatenate([metric["values"] for metric in result])
+  timestamps = points[:, 0]
+  values = points[:, 1] * scale
+  codes = np.repeat(np.arange(len(result)), lengths)
+
+  # Scatter every point into a timestamp x series matrix, series without a point at a timestamp stay NaN
+  unique_ts, rows = np.unique(timestamps, return_inverse=True)
+  matrix = np.full((len(unique_ts), len(result)), np.nan)
+  matrix[rows, codes] = values
+
+  wide = pd.DataFrame(matrix, columns=names)
+  # Series missing the label share a name, keep the first of them
+  wide = wide.loc[:, ~wide.columns.duplicated()]
+  wide.insert(0, "datetime", pd.to_datetime(unique_ts, unit="s", utc=True))
+  return wide, list(wide.columns[1:])
 
 
 def make_report_directories(sub_report_dir):
@@ -772,623 +155,107 @@ def make_report_directories(sub_report_dir):
     os.mkdir(stats_dir)
 
 
-# MCE - Complete (Hive, Hypershift, MCE, UWM) CPU/Memory/Network
-def mce_complete_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "mce-complete")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  mce_namespaces = [
-    "hive",
-    "hypershift",
-    "multicluster-engine",
-    "openshift-user-workload-monitoring"
-  ]
-  ns = "namespace=~'" + "|".join(mce_namespaces) + "'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ns + "})"
-  query_thanos(route, q, "MCE - Complete", token, end_ts, duration, sub_report_dir, "cpu-mce-complete", "MCE Complete (Hive, Hypershift, MCE, UWM) CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!=''," + ns + "})"
-  query_thanos(route, q, "MCE - Complete", token, end_ts, duration, sub_report_dir, "mem-mce-complete", "MCE Complete (Hive, Hypershift, MCE, UWM) Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "MCE - Complete", token, end_ts, duration, sub_report_dir, "net-rcv-mce-complete", "MCE Complete (Hive, Hypershift, MCE, UWM) Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster=''," + ns + "}[5m]))"
-  query_thanos(route, q, "MCE - Complete", token, end_ts, duration, sub_report_dir, "net-xmt-mce-complete", "MCE Complete (Hive, Hypershift, MCE, UWM) Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-# MCE - multicluster-engine namespace only
-def mce_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "mce")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  # Interesting MCE objects
-  q = "apiserver_storage_objects{resource='agents.agent-install.openshift.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "mce-agents", "MCE Agent Objects", "Count", w, h, q_names)
-
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine'})"
-  query_thanos(route, q, "MCE - multicluster-engine", token, end_ts, duration, sub_report_dir, "cpu-mce", "MCE CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-engine'})"
-  query_thanos(route, q, "MCE - multicluster-engine", token, end_ts, duration, sub_report_dir, "mem-mce", "MCE Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))"
-  query_thanos(route, q, "MCE - multicluster-engine", token, end_ts, duration, sub_report_dir, "net-rcv-mce", "MCE Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))"
-  query_thanos(route, q, "MCE - multicluster-engine", token, end_ts, duration, sub_report_dir, "net-xmt-mce", "MCE Network Transmit Throughput", "NET", w, h, q_names)
-
-  # MCE pods (multicluster-engine namespace)
-  # Graphing all MCE pods in one graph is too visually busy however useful to find outliers
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-pods", "MCE Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-engine'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-pods", "MCE Pod Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-mce-pods", "MCE Pod Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-mce-pods", "MCE Pod Network Transmit Throughput", "NET", w, h, q_names)
-
-  # MCE agentinstalladmission CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'agentinstalladmission.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-aia", "MCE agentinstalladmission CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'agentinstalladmission.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-aia", "MCE agentinstalladmission Memory Usage", "MEM", w, h, q_names)
-
-  # MCE Assisted installer service(s) CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'assisted.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-ai", "MCE Assisted-Installer CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'assisted.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-ai", "MCE Assisted-Installer Memory Usage", "MEM", w, h, q_names)
-
-  # MCE cluster-curator-controller CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-curator-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-cluster-curator-controller", "MCE cluster-curator-controller CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-curator-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-cluster-curator-controller", "MCE cluster-curator-controller Memory Usage", "MEM", w, h, q_names)
-
-  # MCE cluster-image-set-controller CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-image-set-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-cis", "MCE cluster-image-set-controller CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-image-set-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-cis", "MCE cluster-image-set-controller Memory Usage", "MEM", w, h, q_names)
-
-  # MCE cluster-manager CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-manager.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-cm", "MCE cluster-manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-manager.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-cm", "MCE cluster-manager Memory Usage", "MEM", w, h, q_names)
-
-  # MCE cluster-proxy, cluster-proxy-addon manager/user Pods CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-proxy.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-cp", "MCE cluster-proxy, cluster-proxy-addon manager/user CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-proxy.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-cp", "MCE cluster-proxy, cluster-proxy-addon manager/user Memory Usage", "MEM", w, h, q_names)
-
-  # MCE clusterclaims-controller CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'clusterclaims-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-clusterclaims-controller", "MCE clusterclaims-controller CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'clusterclaims-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-clusterclaims-controller", "MCE clusterclaims-controller Memory Usage", "MEM", w, h, q_names)
-
-  # MCE clusterlifecycle-state-metrics-v2 CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'clusterlifecycle-state-metrics-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-cls", "MCE clusterlifecycle-state-metrics-v2 CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'clusterlifecycle-state-metrics-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-cls", "MCE clusterlifecycle-state-metrics-v2 Memory Usage", "MEM", w, h, q_names)
-
-  # MCE console-mce-console CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'console-mce-console.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-cmc", "MCE console-mce-console CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'console-mce-console.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-cmc", "MCE console-mce-console Memory Usage", "MEM", w, h, q_names)
-
-  # MCE discovery-operator CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'discovery-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-do", "MCE discovery-operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'discovery-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-do", "MCE discovery-operator Memory Usage", "MEM", w, h, q_names)
-
-  # MCE hcp-cli-download CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'hcp-cli-download.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-hcp-cli-download", "MCE hcp-cli-download CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'hcp-cli-download.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-hcp-cli-download", "MCE hcp-cli-download Memory Usage", "MEM", w, h, q_names)
-
-  # MCE hive-operator CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'hive-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-ho", "MCE hive-operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'hive-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-ho", "MCE hive-operator Memory Usage", "MEM", w, h, q_names)
-
-  # MCE hypershift-addon-manager CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'hypershift-addon-manager.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-ham", "MCE hypershift-addon-manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'hypershift-addon-manager.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-ham", "MCE hypershift-addon-manager Memory Usage", "MEM", w, h, q_names)
-
-  # MCE infrastructure-operator CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'infrastructure-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-io", "MCE infrastructure-operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'infrastructure-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-io", "MCE infrastructure-operator Memory Usage", "MEM", w, h, q_names)
-
-  # MCE Image Based Install Operator CPU/Memory
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'image-based-install-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-ibio", "MCE image-based-install-operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'image-based-install-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-ibio", "MCE image-based-install-operator Memory Usage", "MEM", w, h, q_names)
-
-  # MCE Managedcluster-import-controller CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'managedcluster-import-controller-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-mcic", "MCE managedcluster-import-controller CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'managedcluster-import-controller-v2.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-mcic", "MCE managedcluster-import-controller Memory Usage", "MEM", w, h, q_names)
-
-  # MCE multicluster-engine-operator CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'multicluster-engine-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-meo", "MCE multicluster-engine-operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'multicluster-engine-operator.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-meo", "MCE multicluster-engine-operator Memory Usage", "MEM", w, h, q_names)
-
-  # MCE ocm CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'ocm.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-ocm", "MCE ocm CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'ocm.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-ocm", "MCE ocm Memory Usage", "MEM", w, h, q_names)
-
-  # MCE provider-credential-controller CPU/Memory
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'provider-credential-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mce-pcc", "MCE provider-credential-controller CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'provider-credential-controller.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mce-pcc", "MCE provider-credential-controller Memory Usage", "MEM", w, h, q_names)
-
-  # Volume Space used by MCE
-  q = "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='multicluster-engine'})"
-  query_thanos(route, q, "persistentvolumeclaim", token, end_ts, duration, sub_report_dir, "pvc-mce", "MCE Volume Usage", "DISK_USAGE", w, h, q_names)
-  return q_names
-
-
-def mcgh_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "mcgh")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # MCGH CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub'})"
-  query_thanos(route, q, "MCGH Namespace", token, end_ts, duration, sub_report_dir, "cpu-mcgh", "MCGH CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub'})"
-  query_thanos(route, q, "MCGH Namespace", token, end_ts, duration, sub_report_dir, "mem-mcgh", "MCGH Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub'}[5m]))"
-  query_thanos(route, q, "MCGH Namespace", token, end_ts, duration, sub_report_dir, "net-rcv-mcgh", "MCGH Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub'}[5m]))"
-  query_thanos(route, q, "MCGH Namespace", token, end_ts, duration, sub_report_dir, "net-xmt-mcgh", "MCGH Network Transmit Throughput", "NET", w, h, q_names)
-
-  # MCGH pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'amq-streams-cluster-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mcgh-amq-streams-cluster-operator", "MCGH AMQ Streams Cluster Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'amq-streams-cluster-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mcgh-amq-streams-cluster-operator", "MCGH AMQ Streams Cluster Operator Memory Usage", "MEM", w, h, q_names)
-
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mcgh-kafka-entity-operator", "MCGH Kafka Entity Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mcgh-kafka-entity-operator", "MCGH Kafka Entity Operator Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-mcgh-kafka-entity-operator", "MCGH Kafka Entity Operator Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-mcgh-kafka-entity-operator", "MCGH Kafka Entity Operator Network Transmit Throughput", "NET", w, h, q_names)
-
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mcgh-kafka-kraft", "MCGH Kafka Kraft CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mcgh-kafka-kraft", "MCGH Kafka Kraft Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-mcgh-kafka-kraft", "MCGH Kafka Kraft Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-mcgh-kafka-kraft", "MCGH Kafka Kraft Network Transmit Throughput", "NET", w, h, q_names)
-
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-mcgh-pods", "MCGH Pod CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-mcgh-pods", "MCGH Pod Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-rcv-mcgh-pods", "MCGH Pod Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'}[5m]))"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "net-xmt-mcgh-pods", "MCGH Pod Network Transmit Throughput", "NET", w, h, q_names)
-  return q_names
-
-
-def minio_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "minio")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # Minio CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='minio'})"
-  query_thanos(route, q, "minio", token, end_ts, duration, sub_report_dir, "cpu-minio", "Minio CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='minio'})"
-  query_thanos(route, q, "minio", token, end_ts, duration, sub_report_dir, "mem-minio", "Minio Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='minio'}[5m]))"
-  query_thanos(route, q, "minio", token, end_ts, duration, sub_report_dir, "net-rcv-minio", "Minio Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='minio'}[5m]))"
-  query_thanos(route, q, "minio", token, end_ts, duration, sub_report_dir, "net-xmt-minio", "Minio Network Transmit Throughput", "NET", w, h, q_names)
-  # Volume Space used by Minio
-  q = "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='minio'})"
-  query_thanos(route, q, "persistentvolumeclaim", token, end_ts, duration, sub_report_dir, "pvc-minio", "Minio Volume Usage", "DISK_USAGE", w, h, q_names)
-  # Minio is a single pod thus no need to split by pod
-  return q_names
-
-
-def odf_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "odf")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # ODF openshift-storage Namespace CPU/Memory/Network
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage'})"
-  query_thanos(route, q, "openshift-storage", token, end_ts, duration, sub_report_dir, "cpu-odf", "ODF CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage'})"
-  query_thanos(route, q, "openshift-storage", token, end_ts, duration, sub_report_dir, "mem-odf", "ODF Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-storage'}[5m]))"
-  query_thanos(route, q, "openshift-storage", token, end_ts, duration, sub_report_dir, "net-rcv-odf", "ODF Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-storage'}[5m]))"
-  query_thanos(route, q, "openshift-storage", token, end_ts, duration, sub_report_dir, "net-xmt-odf", "ODF Network Transmit Throughput", "NET", w, h, q_names)
-
-  # ODF Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-operator", "ODF Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-operator", "ODF Operator Memory Usage", "MEM", w, h, q_names)
-  # OCS Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ocs-operator", "OCS Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ocs-operator", "OCS Operator Memory Usage", "MEM", w, h, q_names)
-  # Rook-Ceph Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-rook-ceph-operator", "Rook-Ceph Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-rook-ceph-operator", "Rook-Ceph Operator Memory Usage", "MEM", w, h, q_names)
-  # NooBaa Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-noobaa-operator", "NooBaa Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-noobaa-operator", "NooBaa Operator Memory Usage", "MEM", w, h, q_names)
-  # Ceph CSI Controller Manager pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ceph-csi-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-csi-controller-manager", "Ceph CSI Controller Manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ceph-csi-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-csi-controller-manager", "Ceph CSI Controller Manager Memory Usage", "MEM", w, h, q_names)
-  # CSI Addons Controller Manager pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'csi-addons-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-csi-addons-controller-manager", "CSI Addons Controller Manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'csi-addons-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-csi-addons-controller-manager", "CSI Addons Controller Manager Memory Usage", "MEM", w, h, q_names)
-  # OCS Client Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-client-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ocs-client-operator", "OCS Client Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-client-operator-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ocs-client-operator", "OCS Client Operator Memory Usage", "MEM", w, h, q_names)
-  # OCS Client Operator Console pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-client-operator-console-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ocs-client-operator-console", "OCS Client Operator Console CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-client-operator-console-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ocs-client-operator-console", "OCS Client Operator Console Memory Usage", "MEM", w, h, q_names)
-  # OCS Metrics Exporter pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-metrics-exporter-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ocs-metrics-exporter", "OCS Metrics Exporter CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-metrics-exporter-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ocs-metrics-exporter", "OCS Metrics Exporter Memory Usage", "MEM", w, h, q_names)
-  # OCS Provider Server pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-provider-server-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ocs-provider-server", "OCS Provider Server CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-provider-server-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ocs-provider-server", "OCS Provider Server Memory Usage", "MEM", w, h, q_names)
-  # ODF Blackbox Exporter pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-blackbox-exporter-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-blackbox-exporter", "ODF Blackbox Exporter CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-blackbox-exporter-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-blackbox-exporter", "ODF Blackbox Exporter Memory Usage", "MEM", w, h, q_names)
-  # ODF Console pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-console-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-console", "ODF Console CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-console-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-console", "ODF Console Memory Usage", "MEM", w, h, q_names)
-  # ODF External Snapshotter Operator pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-external-snapshotter-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-external-snapshotter-operator", "ODF External Snapshotter Operator CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-external-snapshotter-operator-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-external-snapshotter-operator", "ODF External Snapshotter Operator Memory Usage", "MEM", w, h, q_names)
-  # UX Backend Server pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ux-backend-server-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ux-backend-server", "UX Backend Server CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ux-backend-server-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ux-backend-server", "UX Backend Server Memory Usage", "MEM", w, h, q_names)
-
-  # Ceph Monitor pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-mon-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-mon", "Ceph Monitor CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-mon-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-mon", "Ceph Monitor Memory Usage", "MEM", w, h, q_names)
-  # Ceph Manager pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-mgr-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-mgr", "Ceph Manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-mgr-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-mgr", "Ceph Manager Memory Usage", "MEM", w, h, q_names)
-  # Ceph OSD pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-osd-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-osd", "Ceph OSD CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-osd-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-osd", "Ceph OSD Memory Usage", "MEM", w, h, q_names)
-  # Ceph MDS pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-mds-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-mds", "Ceph MDS CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-mds-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-mds", "Ceph MDS Memory Usage", "MEM", w, h, q_names)
-  # Ceph RGW pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-rgw-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-rgw", "Ceph RGW CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-rgw-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-rgw", "Ceph RGW Memory Usage", "MEM", w, h, q_names)
-  # Ceph Crash Collector pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-crashcollector-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-crashcollector", "Ceph Crash Collector CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-crashcollector-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-crashcollector", "Ceph Crash Collector Memory Usage", "MEM", w, h, q_names)
-
-  # Rook-Ceph Exporter pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-exporter-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-ceph-exporter", "Ceph Exporter CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-exporter-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-ceph-exporter", "Ceph Exporter Memory Usage", "MEM", w, h, q_names)
-
-  # CSI RBD Node Plugin pods (DaemonSet)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-nodeplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-csi-rbd-nodeplugin", "CSI RBD Node Plugin CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-nodeplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-csi-rbd-nodeplugin", "CSI RBD Node Plugin Memory Usage", "MEM", w, h, q_names)
-  # CSI RBD Controller Plugin pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-ctrlplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-csi-rbd-ctrlplugin", "CSI RBD Controller Plugin CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-ctrlplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-csi-rbd-ctrlplugin", "CSI RBD Controller Plugin Memory Usage", "MEM", w, h, q_names)
-  # CSI CephFS Node Plugin pods (DaemonSet)
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-nodeplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-csi-cephfs-nodeplugin", "CSI CephFS Node Plugin CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-nodeplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-csi-cephfs-nodeplugin", "CSI CephFS Node Plugin Memory Usage", "MEM", w, h, q_names)
-  # CSI CephFS Controller Plugin pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-ctrlplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-csi-cephfs-ctrlplugin", "CSI CephFS Controller Plugin CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-ctrlplugin-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-csi-cephfs-ctrlplugin", "CSI CephFS Controller Plugin Memory Usage", "MEM", w, h, q_names)
-
-  # NooBaa Core pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-core-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-noobaa-core", "NooBaa Core CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-core-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-noobaa-core", "NooBaa Core Memory Usage", "MEM", w, h, q_names)
-  # NooBaa Endpoint pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-endpoint-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-noobaa-endpoint", "NooBaa Endpoint CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-endpoint-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-noobaa-endpoint", "NooBaa Endpoint Memory Usage", "MEM", w, h, q_names)
-  # NooBaa DB (PostgreSQL) pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-db-pg-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-noobaa-db-pg", "NooBaa DB CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-db-pg-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-noobaa-db-pg", "NooBaa DB Memory Usage", "MEM", w, h, q_names)
-  # CNPG Controller Manager pods
-  q = "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'cnpg-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "cpu-odf-cnpg-controller-manager", "CNPG Controller Manager CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'cnpg-controller-manager-.*'})"
-  query_thanos(route, q, "pod", token, end_ts, duration, sub_report_dir, "mem-odf-cnpg-controller-manager", "CNPG Controller Manager Memory Usage", "MEM", w, h, q_names)
-
-  # Ceph Storage Capacity and Usage
-  # Ceph cluster total raw capacity (divide by 1e12 to convert bytes to TB, avoids plotly showing "k GB" on the y-axis)
-  q = "(ceph_cluster_total_bytes / 1e12)"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "ceph-cluster-total-capacity", "Ceph Cluster Total Raw Capacity", "Capacity (TB)", w, h, q_names)
-  q = "ceph_cluster_total_used_bytes"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "ceph-cluster-used-capacity", "Ceph Cluster Used Raw Capacity", "DISK_USAGE", w, h, q_names)
-  # Per-pool stored data with human-readable pool names from ceph_pool_metadata
-  q = "sum by (name) (ceph_pool_stored_raw * on(pool_id) group_left(name) ceph_pool_metadata)"
-  query_thanos(route, q, "name", token, end_ts, duration, sub_report_dir, "ceph-pool-stored-raw", "Ceph Pool Stored Raw Data By Pool", "DISK_USAGE", w, h, q_names)
-  # OSD storage: total used across all OSDs, per-OSD used, per-OSD capacity
-  q = "sum(ceph_osd_stat_bytes_used)"
-  query_thanos(route, q, "Ceph OSD Total", token, end_ts, duration, sub_report_dir, "ceph-osd-used-total", "Ceph OSD Aggregate Used", "DISK_USAGE", w, h, q_names)
-  q = "ceph_osd_stat_bytes_used"
-  query_thanos(route, q, "ceph_daemon", token, end_ts, duration, sub_report_dir, "ceph-osd-used-per-osd", "Ceph OSD Used Per OSD", "DISK_USAGE", w, h, q_names)
-  q = "ceph_osd_stat_bytes"
-  query_thanos(route, q, "ceph_daemon", token, end_ts, duration, sub_report_dir, "ceph-osd-capacity-per-osd", "Ceph OSD Capacity Per OSD", "DISK_USAGE", w, h, q_names)
-  # ODF filesystem PVC usage (block PVCs are not reported by kubelet_volume_stats_used_bytes)
-  q = "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='openshift-storage'})"
-  query_thanos(route, q, "persistentvolumeclaim", token, end_ts, duration, sub_report_dir, "pvc-odf", "ODF PVC Filesystem Usage", "DISK_USAGE", w, h, q_names)
-
-  # Ceph Object Store (RGW) object count and stored size
-  q = "sum(ceph_pool_objects * on(pool_id) group_left(name) ceph_pool_metadata{name=~'.*rgw.*'})"
-  query_thanos(route, q, "Ceph RGW Total", token, end_ts, duration, sub_report_dir, "ceph-rgw-object-count", "Ceph RGW Object Count", "Objects", w, h, q_names)
-  q = "sum(ceph_pool_stored * on(pool_id) group_left(name) ceph_pool_metadata{name=~'.*rgw.*'})"
-  query_thanos(route, q, "Ceph RGW Total", token, end_ts, duration, sub_report_dir, "ceph-rgw-object-size", "Ceph RGW Object Store Used", "DISK_USAGE", w, h, q_names)
-  # NooBaa total storage usage
-  q = "NooBaa_total_usage"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "noobaa-total-usage", "NooBaa Total Usage", "DISK_USAGE", w, h, q_names)
-
-  # Ceph OSD Performance
-  q = "rate(ceph_osd_op_r_latency_sum[5m])"
-  query_thanos(route, q, "ceph_daemon", token, end_ts, duration, sub_report_dir, "ceph-osd-read-latency", "Ceph OSD Read Latency Per OSD", "Latency (ms)", w, h, q_names)
-  q = "rate(ceph_osd_op_w_latency_sum[5m])"
-  query_thanos(route, q, "ceph_daemon", token, end_ts, duration, sub_report_dir, "ceph-osd-write-latency", "Ceph OSD Write Latency Per OSD", "Latency (ms)", w, h, q_names)
-
-  # Ceph IOPS
-  q = "sum(rate(ceph_osd_op_r[5m]))"
-  query_thanos(route, q, "Ceph Total", token, end_ts, duration, sub_report_dir, "ceph-iops-read-total", "Ceph Cluster Read IOPS", "IOPS", w, h, q_names)
-  q = "sum(rate(ceph_osd_op_w[5m]))"
-  query_thanos(route, q, "Ceph Total", token, end_ts, duration, sub_report_dir, "ceph-iops-write-total", "Ceph Cluster Write IOPS", "IOPS", w, h, q_names)
-  q = "rate(ceph_osd_op_r[5m])"
-  query_thanos(route, q, "ceph_daemon", token, end_ts, duration, sub_report_dir, "ceph-iops-read-per-osd", "Ceph Read IOPS Per OSD", "IOPS", w, h, q_names)
-  q = "rate(ceph_osd_op_w[5m])"
-  query_thanos(route, q, "ceph_daemon", token, end_ts, duration, sub_report_dir, "ceph-iops-write-per-osd", "Ceph Write IOPS Per OSD", "IOPS", w, h, q_names)
-  q = "sum by (name) (rate(ceph_pool_rd[5m]) * on(pool_id) group_left(name) ceph_pool_metadata)"
-  query_thanos(route, q, "name", token, end_ts, duration, sub_report_dir, "ceph-iops-read-per-pool", "Ceph Read IOPS Per Pool", "IOPS", w, h, q_names)
-  q = "sum by (name) (rate(ceph_pool_wr[5m]) * on(pool_id) group_left(name) ceph_pool_metadata)"
-  query_thanos(route, q, "name", token, end_ts, duration, sub_report_dir, "ceph-iops-write-per-pool", "Ceph Write IOPS Per Pool", "IOPS", w, h, q_names)
-
-  # Ceph Health Status (0=HEALTH_OK, 1=HEALTH_WARN, 2=HEALTH_ERR)
-  q = "ceph_health_status"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "ceph-health-status", "Ceph Health Status", "Status", w, h, q_names)
-
-  return q_names
-
-
-def node_queries(report_dir, route, token, end_ts, duration, w, h, namespaces):
-  # Node CPU/Memory/Disk/Network
-  sub_report_dir = os.path.join(report_dir, "node")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # Keep in mind the below two queries include Minio
-  # Subtract by node/instance idle CPU usage from core count to get each node/instance's CPU usage
-  q = "(count by (instance) (node_cpu_seconds_total{mode='idle'}) - sum by (instance) (irate(node_cpu_seconds_total{mode='idle'}[1m])))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "cpu-node", "Node CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by (instance) (node_memory_MemTotal_bytes - node_memory_MemAvailable_bytes)"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "mem-node", "Node Memory Usage", "MEM", w, h, q_names)
-
-  if 'minio' in namespaces:
-    # Node CPU/Memory/Disk/Network (excluding Minio)
-    q = "sum by(node) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace!='minio'})"
-    query_thanos(route, q, "node", token, end_ts, duration, sub_report_dir, "cpu-node-app_no-minio", "Node Application CPU Cores Usage (Excluding Minio)", "CPU", w, h, q_names)
-    q = "sum by(node) (container_memory_working_set_bytes{cluster='',container!='',namespace!='minio'})"
-    query_thanos(route, q, "node", token, end_ts, duration, sub_report_dir, "mem-node-app_no-minio", "Node Application Memory Usage (Excluding Minio)", "MEM", w, h, q_names)
-
-  # Node CPU/Memory/Network (including Minio)
-  q = "sum by(node) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''})"
-  query_thanos(route, q, "node", token, end_ts, duration, sub_report_dir, "cpu-node-app", "Node Application CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum by(node) (container_memory_working_set_bytes{cluster='',container!=''})"
-  query_thanos(route, q, "node", token, end_ts, duration, sub_report_dir, "mem-node-app", "Node Application Memory Usage", "MEM", w, h, q_names)
-  q = "sum by (instance) (instance:node_network_receive_bytes_excluding_lo:rate1m{cluster=''})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "net-rcv-node", "Node Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum by (instance) (instance:node_network_transmit_bytes_excluding_lo:rate1m{cluster=''})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "net-xmt-node", "Node Network Transmit Throughput", "NET", w, h, q_names)
-
-  # Disk space utilization does not include Minio PV data (Separate PV Disk for Minio)
-  q = "sum by (instance) (node_filesystem_size_bytes{mountpoint='/sysroot'} - node_filesystem_avail_bytes{mountpoint='/sysroot'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-util-root-node", "Node / space utilization", "DISK_USAGE", w, h, q_names)
-  q = "sum by (instance) (node_filesystem_size_bytes{mountpoint='/var/lib/etcd'} - node_filesystem_avail_bytes{mountpoint='/var/lib/etcd'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-util-etcd-node", "Node /var/lib/etcd space utilization", "DISK_USAGE", w, h, q_names)
-  q = "sum by (instance) (node_filesystem_size_bytes{mountpoint='/var/lib/containers'} - node_filesystem_avail_bytes{mountpoint='/var/lib/containers'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-util-containers-node", "Node /var/lib/containers space utilization", "DISK_USAGE", w, h, q_names)
-
-  # Disk Throughput and Iops utilization by node for disk mounting / or /sysroot
-  # Complexity in this query is due to device naming (/dev/sda1 vs sda) and grouping mountpoints to devices
-  q = "sum by (instance) (irate(node_disk_read_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-tput-read-root-node", "Node / Read Throughput", "DISK_TPUT_MB", w, h, q_names)
-  q = "sum by (instance) (irate(node_disk_written_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-tput-write-root-node", "Node / Write Throughput", "DISK_TPUT_MB", w, h, q_names)
-  q = "sum by (instance) (irate(node_disk_reads_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-iops-read-root-node", "Node / Read Iops", "Iops", w, h, q_names)
-  q = "sum by (instance) (irate(node_disk_writes_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-iops-write-root-node", "Node / Write Iops", "Iops", w, h, q_names)
-  # Disk Throughput and Iops utilization by node for disk mounting /var/lib/etcd
-  # /var/lib/etcd is usually placed on a separate nvme disk
-  q = "sum by (instance) (irate(node_disk_read_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-tput-read-etcd-node", "Node /var/lib/etcd Read Throughput", "DISK_TPUT_MB", w, h, q_names)
-  q = "sum by (instance) (irate(node_disk_written_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-tput-write-etcd-node", "Node /var/lib/etcd Write Throughput", "DISK_TPUT_MB", w, h, q_names)
-  q = "sum by (instance) (irate(node_disk_reads_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-iops-read-etcd-node", "Node /var/lib/etcd Read Iops", "Iops", w, h, q_names)
-  q = "sum by (instance) (irate(node_disk_writes_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "disk-iops-write-etcd-node", "Node /var/lib/etcd Write Iops", "Iops", w, h, q_names)
-
-  q = "sum(kube_pod_status_phase{phase!='Succeeded',phase!='Failed'} * on (namespace, pod, container, uid) group_left(node) kube_pod_info{pod_ip!=''}) by (node)"
-  query_thanos(route, q, "node", token, end_ts, duration, sub_report_dir, "nonterm-pods-node", "Non-terminated pods by Node", "Count", w, h, q_names)
-  return q_names
-
-
-def resource_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "resource")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  q = "sum by (instance) (apiserver_storage_objects)"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "all", "All Resources", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='namespaces'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "namespaces", "Namespaces", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='serviceaccounts'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "serviceaccounts", "Serviceaccounts", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='pods'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "pods", "Pods", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='replicasets.apps'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "replicasets", "Replicasets", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='deployments.apps'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "deployments", "Deployments", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='daemonsets.apps'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "daemonsets", "Daemonsets", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='statefulsets.apps'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "statefulsets", "Statefulsets", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='jobs.batch'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "jobs", "Jobs", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='cronjobs.batch'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "cronjobs", "Cronjobs", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='endpoints'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "endpoints", "Endpoints", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='services'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "services", "Services", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='configmaps'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "configmaps", "Configmaps", "Count", w, h, q_names)
-  q = "sum by (instance) (apiserver_storage_objects{resource='secrets'})"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "secrets", "Secrets", "Count", w, h, q_names)
-  q = "sum by (namespace) (kubelet_volume_stats_used_bytes)"
-  query_thanos(route, q, "namespace", token, end_ts, duration, sub_report_dir, "pvc-usage", "Volume Usage By Namespace", "DISK_USAGE", w, h, q_names)
-  return q_names
-
-
-def talm_queries(report_dir, route, token, end_ts, duration, w, h, talm_namespace):
-  sub_report_dir = os.path.join(report_dir, "talm")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-  q = "apiserver_storage_objects{resource='clustergroupupgrades.ran.openshift.io'}"
-  query_thanos(route, q, "instance", token, end_ts, duration, sub_report_dir, "talm-cgu", "ClusterGroupUpgrades Objects", "Count", w, h, q_names)
-
-  # TALM CPU/Memory/Network
-  # When TALM is installed via OLM subscription it runs in openshift-operators alongside other
-  # operators, so filter by pod name to isolate TALM metrics
-  if talm_namespace == "openshift-operators":
-    ns_filter = "namespace='openshift-operators',pod=~'cluster-group-upgrades-.*'"
-  else:
-    ns_filter = "namespace='openshift-cluster-group-upgrades'"
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{{cluster='',{}}})".format(ns_filter)
-  query_thanos(route, q, "TALM", token, end_ts, duration, sub_report_dir, "cpu-talm", "TALM CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{{cluster='',container!='',{}}})".format(ns_filter)
-  query_thanos(route, q, "TALM", token, end_ts, duration, sub_report_dir, "mem-talm", "TALM Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{{cluster='',{}}}[5m]))".format(ns_filter)
-  query_thanos(route, q, "TALM", token, end_ts, duration, sub_report_dir, "net-rcv-talm", "TALM Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{{cluster='',{}}}[5m]))".format(ns_filter)
-  query_thanos(route, q, "TALM", token, end_ts, duration, sub_report_dir, "net-xmt-talm", "TALM Network Transmit Throughput", "NET", w, h, q_names)
-  # TALM is a single pod thus no need to split by pod
-  return q_names
-
-
-def ztp_day2_queries(report_dir, route, token, end_ts, duration, w, h):
-  sub_report_dir = os.path.join(report_dir, "ztp-day2")
-  make_report_directories(sub_report_dir)
-  q_names = OrderedDict()
-
-  # AAP Namespace
-  q = "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ztp-day2-automation'})"
-  query_thanos(route, q, "ztp-day2-automation", token, end_ts, duration, sub_report_dir, "cpu-ztp-day2", "ztp-day2-automation CPU Cores Usage", "CPU", w, h, q_names)
-  q = "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='ztp-day2-automation'})"
-  query_thanos(route, q, "ztp-day2-automation", token, end_ts, duration, sub_report_dir, "mem-ztp-day2", "ztp-day2-automation Memory Usage", "MEM", w, h, q_names)
-  q = "sum(irate(container_network_receive_bytes_total{cluster='',namespace='ztp-day2-automation'}[5m]))"
-  query_thanos(route, q, "ztp-day2-automation", token, end_ts, duration, sub_report_dir, "net-rcv-ztp-day2", "ztp-day2-automation Network Receive Throughput", "NET", w, h, q_names)
-  q = "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='ztp-day2-automation'}[5m]))"
-  query_thanos(route, q, "ztp-day2-automation", token, end_ts, duration, sub_report_dir, "net-xmt-ztp-day2", "ztp-day2-automation Network Transmit Throughput", "NET", w, h, q_names)
-  q = "sum(kube_pod_status_phase{phase!='Succeeded', phase!='Failed', namespace='ztp-day2-automation'})"
-  query_thanos(route, q, "non-terminated pods", token, end_ts, duration, sub_report_dir, "nonterm-pods-ztp-day2", "Non-terminated pods across ztp-day2-automation namespace", "Count", w, h, q_names)
-  return q_names
-
-
-def query_thanos(route, query, series_label, token, end_ts, duration, directory, fname, g_title, y_unit, g_width, g_height, q_names, resolution="1m"):
-  logger.info("Querying data for {}".format(fname))
-  if fname in q_names:
-    logger.error("Query name already exists")
-    sys.exit(1)
-  q_names[fname] = g_title
-
+def init_renderer():
+  # Kaleido 1.x starts a browser per write_image unless a sync server is running, 0.2.x keeps its own process
+  try:
+    import kaleido
+    if hasattr(kaleido, "start_sync_server"):
+      kaleido.start_sync_server(silence_warnings=True)
+  except ImportError:
+    pass
+
+
+def render_graph(directory, fname, g_title, y_title, g_width, g_height):
+  df = read_results("{}/csv/{}.csv".format(directory, fname), ["datetime"], index_col=0)
+  series_to_plot = [column for column in df.columns if column != "datetime"]
+  # Plot datetime as a string to avoid plotly conversion issues
+  df["datetime"] = pd.to_datetime(df["datetime"]).dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+  l = {"value" : y_title, "datetime": "Time (UTC)"}
+  fig_cluster_node = px.line(df, x="datetime", y=series_to_plot, labels=l, width=g_width, height=g_height)
+  fig_cluster_node.update_layout(title=g_title, legend_orientation="v")
+  fig_cluster_node.write_image("{}/{}.png".format(directory, fname))
+
+
+def render_graphs(report_dir, g_width, g_height, workers):
+  logger.info("Rendering graphs from {}/graphs.json".format(report_dir))
+  with open("{}/graphs.json".format(report_dir), "r") as graphs_file:
+    graphs_data = json.load(graphs_file)
+  # Render processes are spawned rather than forked from a process that ran query threads
+  with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+      initializer=init_renderer) as render_executor:
+    futures = {render_executor.submit(render_graph, os.path.join(report_dir, graph["section"]), graph["fname"],
+        graph["title"], graph["y_title"], g_width, g_height): graph["fname"] for graph in graphs_data["graphs"]}
+    wait(futures)
+  for future in futures:
+    if future.exception() is not None:
+      logger.error("Graph {} render failed: {}".format(futures[future], future.exception()))
+  generate_report_html(report_dir, graphs_data["report_data"])
+
+
+def run_request(route, token, end_ts, duration, report_dir, request):
+  # Runs one planned request and writes the result of each catalog query it serves
+  names = ", ".join(q["name"] for q in request["queries"])
+  logger.info("Querying data for {}".format(names))
+  rc, result = fetch_query(route, request["expr"], token, end_ts, duration, request["resolution"])
+  if rc != 0:
+    logger.error("Query {} failed".format(names))
+    return
+  for entry in request["queries"]:
+    entry_result = result
+    if entry["pod_pattern"] is not None:
+      pod_re = re.compile(entry["pod_pattern"])
+      entry_result = [m for m in result if pod_re.fullmatch(m["metric"].get("pod", ""))]
+    write_query(os.path.join(report_dir, entry["section"]), entry, entry_result)
+  logger.info("Completed querying data for {}".format(names))
+
+
+def fetch_chunk(route, query, token, start_ts, end_ts, step):
+  # Returns rc and the decoded series of one range query chunk, served from query_cache when cached
+  if query_cache is not None:
+    series = query_cache.get(route, query, start_ts, end_ts, step)
+    if series is not None:
+      return 0, series
+  rc, result = query_range(route, query, token, start_ts, end_ts, step)
+  if rc != 0:
+    return rc, []
+  series = decode_series(result)
+  if query_cache is not None:
+    query_cache.put(route, query, start_ts, end_ts, step, series)
+  return 0, series
+
+
+def fetch_query(route, query, token, end_ts, duration, resolution):
+  # Range query over the whole window in chunks fetched in parallel, each chunk starts one step after the prior one ends
+  # The window excludes its start like the [duration:resolution] subquery it replaces
+  step = duration_seconds(resolution)
+  start_ts = end_ts - duration_seconds(duration) + step
+  logger.info("Query: {} start: {} end: {} step: {}s".format(query, start_ts, end_ts, step))
+  chunk_futures = []
+  chunk_start = start_ts
+  while chunk_start <= end_ts:
+    chunk_end = min(end_ts, chunk_start + query_chunk_seconds - step)
+    chunk_futures.append(fetch_executor.submit(fetch_chunk, route, query, token, chunk_start, chunk_end, step))
+    chunk_start = chunk_end + step
+
+  # Stitch each series back together across chunks by its labels
+  stitched = OrderedDict()
+  for future in chunk_futures:
+    rc, chunk_series = future.result()
+    if rc != 0:
+      return rc, []
+    for metric in chunk_series:
+      key = tuple(sorted(metric["metric"].items()))
+      if key not in stitched:
+        stitched[key] = {"metric": metric["metric"], "values": []}
+      stitched[key]["values"].append(metric["values"])
+  for metric in stitched.values():
+    metric["values"] = np.concatenate(metric["values"])
+  return 0, list(stitched.values())
+
+
+def write_query(directory, entry, result):
+  fname = entry["name"]
+  y_unit = entry["unit"]
   if y_unit == "CPU":
     y_title = "CPU (Cores)"
   elif y_unit == "MEM":
@@ -1402,119 +269,37 @@ def query_thanos(route, query, series_label, token, end_ts, duration, directory,
   else:
     y_title = y_unit
 
-  # Determine query offset from end timestamp
-  offset = calculate_query_offset(end_ts)
+  logger.debug("Length of returned result data for {}: {}".format(fname, len(result)))
+  if len(result) == 0:
+    logger.warning("Empty data returned from query {}".format(fname))
+    return
+  df, series = decode_matrix(result, entry["series_label"], UNIT_SCALE.get(y_unit, 1.0))
+  logger.debug("Decoded {} series with {} timestamps".format(len(series), len(df)))
+
+  # Filter series list to only include columns that actually exist in the DataFrame
+  series_to_plot = [s for s in series if s in df.columns]
 
-  if offset == 0:
-    query_complete = query + "[" + duration + ":" + resolution + "]"
+  if len(series_to_plot) == 0:
+    logger.warning("No valid series to plot after merge")
   else:
-    query_complete = query + "[" + duration + ":" + resolution + "] offset " + str(int(offset)) + "m"
-  logger.info("Query: {}".format(query_complete))
-  # Use POST body so the query is form-encoded; putting it in the URL unencoded breaks
-  # complex queries (spaces, quotes, slashes, regex) and can return empty results.
-  query_endpoint = "{}/api/v1/query".format(route)
-  headers = {"Authorization": "Bearer {}".format(token)}
-  payload = {"query": query_complete}
-  query_data = requests.post(query_endpoint, headers=headers, data=payload, verify=False)
+    csv_dir = os.path.join(directory, "csv")
+    stats_dir = os.path.join(directory, "stats")
 
-  if query_data.status_code == 200:
-    qd_json = query_data.json()
-    # print("qd_json: {}".format(json.dumps(qd_json, indent=4)))
-    if ("data" in qd_json) and ("result" in qd_json["data"]):
-      logger.debug("Length of returned result data: {}".format(len(qd_json["data"]["result"])))
+    # Write graph and stats file
+    with open("{}/{}.stats".format(stats_dir, fname), "a") as stats_file:
+      stats_file.write("Unit: {}\n".format(y_title))
+      with pd.option_context("display.max_columns", None, "display.width", 240):
+        stats_file.write(str(df.describe(percentiles=[.25, .5, .75, .95, .99])))
+    df.to_csv("{}/{}.csv".format(csv_dir, fname))
+    write_results("{}/{}.csv".format(csv_dir, fname), df, {"section": entry["section"], "name": fname,
+        "title": entry["title"], "unit": y_title, "query": entry["expr"], "series_label": entry["series_label"]},
+        ["datetime"])
 
-      if len(qd_json["data"]["result"]) == 0:
-        logger.warning("Empty data returned from query")
-      else:
-        # Build list of DataFrames, one per metric, then merge them
-        dfs = []
-        series = []
-
-        for metric in qd_json["data"]["result"]:
-          # Create datetime series for this metric
-          metric_datetime = [datetime.fromtimestamp(x[0], tz=timezone.utc) for x in metric["values"]]
-
-          # Determine the series name
-          if series_label not in metric["metric"]:
-            metric_name = series_label
-            logger.debug("Num of values: {}".format(len(metric["values"])))
-          else:
-            metric_name = metric["metric"][series_label]
-            logger.debug("{}: {}, Num of values: {}".format(series_label, metric_name, len(metric["values"])))
-
-          # Convert values based on unit
-          if y_unit == "MEM":
-            bytes_to_gib = 1024 * 1024 * 1024
-            metric_values = [float(x[1]) / bytes_to_gib for x in metric["values"]]
-          elif y_unit == "NET":
-            # Prometheus irate() returns bytes/s; convert to megabits per second (Mbps)
-            bytes_to_mbps = 1_000_000 / 8
-            metric_values = [float(x[1]) / bytes_to_mbps for x in metric["values"]]
-          elif y_unit == "DISK_USAGE":
-            bytes_to_gb = 1000 * 1000 * 1000
-            metric_values = [float(x[1]) / bytes_to_gb for x in metric["values"]]
-          elif y_unit == "DISK_TPUT_MB":
-            bytes_to_mb = 1000 * 1000
-            metric_values = [float(x[1]) / bytes_to_mb for x in metric["values"]]
-          else:
-            metric_values = [float(x[1]) for x in metric["values"]]
-
-          # Create a DataFrame for this metric
-          metric_df = pd.DataFrame({
-            "datetime": metric_datetime,
-            metric_name: metric_values
-          })
-          dfs.append(metric_df)
-          series.append(metric_name)
-
-        # Merge all DataFrames on datetime using outer join to handle different lengths
-        df = dfs[0]
-        for metric_df in dfs[1:]:
-          df = pd.merge(df, metric_df, on="datetime", how="outer")
-        # Sort by datetime after merge if we merged multiple DataFrames
-        if len(dfs) > 1:
-          df = df.sort_values("datetime").reset_index(drop=True)
-        
-        # Ensure datetime column is properly formatted for plotly
-        if "datetime" in df.columns:
-          df["datetime"] = pd.to_datetime(df["datetime"])
-
-        # Filter series list to only include columns that actually exist in the DataFrame
-        series_to_plot = [s for s in series if s in df.columns]
-
-        if len(series_to_plot) == 0:
-          logger.warning("No valid series to plot after merge")
-        else:
-          csv_dir = os.path.join(directory, "csv")
-          stats_dir = os.path.join(directory, "stats")
-
-          # Write graph and stats file
-          with open("{}/{}.stats".format(stats_dir, fname), "a") as stats_file:
-            stats_file.write("Unit: {}\n".format(y_title))
-            with pd.option_context("display.max_columns", None, "display.width", 240):
-              stats_file.write(str(df.describe(percentiles=[.25, .5, .75, .95, .99])))
-          df.to_csv("{}/{}.csv".format(csv_dir, fname))
-
-          # Create a copy for plotting with datetime as string to avoid plotly conversion issues
-          df_plot = df.copy()
-          if "datetime" in df_plot.columns:
-            df_plot["datetime"] = df_plot["datetime"].dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-          l = {"value" : y_title, "datetime": "Time (UTC)"}
-          fig_cluster_node = px.line(df_plot, x="datetime", y=series_to_plot, labels=l, width=g_width, height=g_height)
-          fig_cluster_node.update_layout(title=g_title, legend_orientation="v")
-          fig_cluster_node.write_image("{}/{}.png".format(directory, fname))
-
-      logger.info("Completed querying and graphing data")
-
-    else:
-      logger.error("Missing data/results field(s) from query result: {}".format(qd_json))
-  else:
-    logger.error("Query Post status returned: {}".format(query_data.status_code))
-    logger.error("Query response: \n{}".format(query_data.text.rstrip()))
+    with graphs_lock:
+      graphs.append({"section": os.path.basename(directory), "fname": fname, "title": entry["title"], "y_title": y_title})
 
 
-def generate_report_html(report_dir, report_data):
+def generate_report_html(report_dir, report_data, with_graphs=True):
   logger.info("Generating report html file")
   with open("{}/report.html".format(report_dir), "w") as html_file:
     html_file.write("<html>\n")
@@ -1530,10 +315,12 @@ def generate_report_html(report_dir, report_data):
       html_file.write("<h2 id='{0}'>{0} section</h2>\n".format(section))
       for dp in report_data[section]:
         html_file.write("{} - {} | \n".format(report_data[section][dp], dp))
-        html_file.write("<a href='{0}/{1}.png'>graph</a> | \n".format(section, dp))
+        if with_graphs:
+          html_file.write("<a href='{0}/{1}.png'>graph</a> | \n".format(section, dp))
         html_file.write("<a href='{0}/stats/{1}.stats'>stats</a> | \n".format(section, dp))
         html_file.write("<a href='{0}/csv/{1}.csv'>csv</a><br>\n".format(section, dp))
-        html_file.write("<a href='{0}/{1}.png'><img src='{0}/{1}.png' width='700' height='500'></a><br>\n".format(section,dp))
+        if with_graphs:
+          html_file.write("<a href='{0}/{1}.png'><img src='{0}/{1}.png' width='700' height='500'></a><br>\n".format(section,dp))
     html_file.write("</body>\n")
     html_file.write("</html>\n")
   logger.info("Finished generating report html file")
@@ -1579,6 +366,27 @@ def main():
   # Directory to place graphs
   parser.add_argument("results_directory", type=str, help="The location to place graphs and stats files")
 
+  # Concurrency
+  parser.add_argument("--query-concurrency", type=int, default=8,
+                      help="Number of queries run against thanos-querier at once")
+  parser.add_argument("--query-chunk-hours", type=int, default=6,
+                      help="Hours of each range query chunk, chunks of a query are fetched in parallel")
+  parser.add_argument("--render-workers", type=int, default=4, help="Number of processes rendering graphs")
+
+  # Query cache
+  parser.add_argument("--cache-dir", type=str, default="",
+                      help="Directory caching query results, defaults to .query-cache in results_directory")
+  parser.add_argument("--cache-size-mb", type=int, default=1024,
+                      help="Size bound of the query cache, least recently used results are evicted, 0 disables it")
+  parser.add_argument("--refresh", action="store_true", default=False,
+                      help="Ignore cached query results and query thanos again, refreshing the cache")
+
+  # Graph stage
+  parser.add_argument("--no-graphs", action="store_true", default=False,
+                      help="Only query and write csv and stats files, graphs can be rendered later with --render-only")
+  parser.add_argument("--render-only", action="store_true", default=False,
+                      help="Render graphs of a prior analysis, results_directory is that analysis directory")
+
   parser.add_argument("-d", "--debug", action="store_true", default=False, help="Set log level debug")
   cliargs = parser.parse_args()
 
@@ -1588,6 +396,11 @@ def main():
 
   logger.info("Analyze Prometheus")
 
+  if cliargs.render_only:
+    render_graphs(cliargs.results_directory, cliargs.width, cliargs.height, cliargs.render_workers)
+    logger.info("Took {}s".format(round(time.time() - start_time, 1)))
+    return 0
+
   w = cliargs.width
   h = cliargs.height
 
@@ -1646,87 +459,53 @@ def main():
     report_file.write("Query duration: {}\n".format(q_duration))
     report_file.write("Query route: {}\n".format(route))
 
-  report_data = OrderedDict()
-
-  # Query prometheus and build data structure to help build report html file
-  report_data["cluster"] = cluster_queries(report_dir, route, token, q_end_ts, q_duration, w, h, namespaces)
-  report_data["node"] = node_queries(report_dir, route, token, q_end_ts, q_duration, w, h, namespaces)
-  report_data["etcd"] = etcd_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  report_data["resource"] = resource_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  report_data["base-ocp"] = base_ocp_queries(report_dir, route, token, q_end_ts, q_duration, w, h, version)
-  report_data["core-ocp"] = core_ocp_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  # ACM + ACM related namespaces
-  if "open-cluster-management" in namespaces:
-    logger.info("open-cluster-management namespace found, querying for acm metrics")
-    report_data["acm-mce-complete"] = acm_mce_complete_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-    report_data["acm-complete"] = acm_complete_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-    report_data["acm"] = acm_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  if "multicluster-engine" in namespaces:
-    logger.info("multicluster-engine namespace found, querying for mce metrics")
-    report_data["mce-complete"] = mce_complete_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-    report_data["mce"] = mce_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  # "Other" ACM Namespaces
-  if "open-cluster-management-hub" in namespaces:
-    logger.info("open-cluster-management-hub namespace found, querying for acm hub metrics")
-    report_data["acm-hub"] = acm_hub_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  if "open-cluster-management-observability" in namespaces:
-    logger.info("open-cluster-management-observability namespace found, querying for acm observability metrics")
-    report_data["acm-observability"] = acm_observability_queries(report_dir, route, token, q_end_ts, q_duration, w, h, namespaces)
-  if "open-cluster-management-agent" in namespaces:
-    logger.info("open-cluster-management-agent namespace found, querying for acm agent metrics")
-    report_data["acm-agent"] = acm_agent_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  # "Other" MCE Namespaces
-  if "hive" in namespaces:
-    logger.info("hive namespace found, querying for hive metrics")
-    report_data["hive"] = hive_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  if "hypershift" in namespaces:
-    logger.info("hypershift namespace found, querying for hypershift metrics")
-    report_data["hypershift"] = hypershift_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-    report_data["hypershift-uwm"] = hypershift_uwm_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
+  global query_executor, fetch_executor, query_chunk_seconds, query_cache
+  session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=cliargs.query_concurrency))
+  query_executor = ThreadPoolExecutor(max_workers=cliargs.query_concurrency, thread_name_prefix="query")
+  fetch_executor = ThreadPoolExecutor(max_workers=cliargs.query_concurrency, thread_name_prefix="fetch")
+  query_chunk_seconds = cliargs.query_chunk_hours * 60 * 60
+  if cliargs.cache_size_mb > 0:
+    cache_dir = cliargs.cache_dir
+    if cache_dir == "":
+      cache_dir = os.path.join(cliargs.results_directory, ".query-cache")
+    query_cache = QueryCache(cache_dir, cliargs.cache_size_mb * 1024 * 1024, cliargs.refresh)
+
+  # Plan the catalog queries from the namespaces present and run them, report_data helps build the report html file
+  present = set(namespaces)
+  variables = {"BASE_OCP_NAMESPACES": namespace_selector(get_base_ocp_namespaces(version))}
+  # When TALM is installed via OLM subscription it runs in openshift-operators alongside other
+  # operators, so filter by pod name to isolate TALM metrics
   if detect_talm_csv(cliargs.kubeconfig):
     logger.info("TALM CSV detected in openshift-operators, querying for talm metrics with pod filter")
-    report_data["talm"] = talm_queries(report_dir, route, token, q_end_ts, q_duration, w, h, "openshift-operators")
+    present.add("talm")
+    variables["TALM_SELECTOR"] = "namespace='openshift-operators',pod=~'cluster-group-upgrades-.*'"
   elif "openshift-cluster-group-upgrades" in namespaces:
-    logger.info("openshift-cluster-group-upgrades namespace found, querying for talm metrics")
-    report_data["talm"] = talm_queries(report_dir, route, token, q_end_ts, q_duration, w, h, "openshift-cluster-group-upgrades")
-  if "openshift-gitops-operator" in namespaces:
-    logger.info("openshift-gitops-operator namespace found, querying for gitops metrics")
-    report_data["gitops"] = gitops_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  if "openshift-local-storage" in namespaces:
-    logger.info("openshift-local-storage namespace found, querying for lso metrics")
-    report_data["lso"] = lso_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  if "openshift-storage" in namespaces:
-    logger.info("openshift-storage namespace found, querying for odf metrics")
-    report_data["odf"] = odf_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  if "openshift-adp" in namespaces:
-    logger.info("openshift-adp namespace found, querying for adp metrics")
-    report_data["adp"] = adp_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  # Minio is a "workload" running on hub clusters to provide object storage for the cluster
-  if "minio" in namespaces:
-    logger.info("minio namespace found, querying for minio metrics")
-    report_data["minio"] = minio_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  # Multi Cluster Global Hub Queries
-  if "multicluster-global-hub" in namespaces:
-    logger.info("multicluster-global-hub namespace found, querying for mcgh metrics")
-    report_data["mcgh"] = mcgh_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  # AAP Queries
-  if "ansible-automation-platform" in namespaces:
-    logger.info("ansible-automation-platform namespace found, querying for aap metrics")
-    report_data["aap"] = aap_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-  # ACM with AAP without EDA (ZTP Day2 Automation)
-  if "ztp-day2-automation" in namespaces:
-    logger.info("ztp-day2-automation namespace found, querying for ztp day2 metrics")
-    report_data["ztp-day2"] = ztp_day2_queries(report_dir, route, token, q_end_ts, q_duration, w, h)
-
-  generate_report_html(report_dir, report_data)
+    present.add("talm")
+    variables["TALM_SELECTOR"] = "namespace='openshift-cluster-group-upgrades'"
+  report_data, planned = plan_queries(present, variables)
+  for section in report_data:
+    make_report_directories(os.path.join(report_dir, section))
+  for request in planned:
+    query_futures.append(query_executor.submit(run_request, route, token, q_end_ts, q_duration, report_dir, request))
+
+  logger.info("Waiting on {} query requests".format(len(query_futures)))
+  wait(query_futures)
+  for future in query_futures:
+    if future.exception() is not None:
+      logger.error("Query failed: {}".format(future.exception()))
+  query_executor.shutdown()
+  fetch_executor.shutdown()
+  logger.info("Queries took {}s".format(round(time.time() - start_time, 1)))
+  if query_cache is not None:
+    logger.info("Query cache hits: {} misses: {}".format(query_cache.hits, query_cache.misses))
+
+  with open("{}/graphs.json".format(report_dir), "w") as graphs_file:
+    json.dump({"report_data": report_data, "graphs": graphs}, graphs_file, indent=2)
+
+  if cliargs.no_graphs:
+    generate_report_html(report_dir, report_data, False)
+  else:
+    render_graphs(report_dir, w, h, cliargs.render_workers)
 
   end_time = time.time()
   logger.info("Took {}s".format(round(end_time - start_time, 1)))
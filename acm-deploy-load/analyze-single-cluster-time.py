@@ -22,6 +22,7 @@ from datetime import datetime
 from datetime import timedelta
 import json
 from utils.command import command
+from utils.kube import get_client
 from utils.output import log_write
 import logging
 from pathlib import Path
@@ -111,14 +112,12 @@ def main():
     ici_data = json.loads(output)
 
   # Get BareMetalHost data
-  oc_cmd = ["oc", "get", "baremetalhost", "-n", cliargs.cluster, "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  rc, bmh_data = get_client().list("metal3.io/v1alpha1", "baremetalhosts", cliargs.cluster, retries=3)
   if rc != 0:
-    logger.error("analyze-cluster-time, oc get baremetalhost rc: {}".format(rc))
+    logger.error("analyze-cluster-time, list baremetalhosts rc: {}".format(rc))
     sys.exit(1)
   with open("{}/bmh.json".format(raw_data_dir), "w") as data_file:
-    data_file.write(output)
-  bmh_data = json.loads(output)
+    json.dump(bmh_data, data_file)
 
   # Get ManagedCluster data
   oc_cmd = ["oc", "get", "managedcluster", cliargs.cluster, "-o", "json"]
@@ -141,14 +140,12 @@ def main():
   cgu_data = json.loads(output)
 
   # Get Policy data
-  oc_cmd = ["oc", "get", "policy", "-n", cliargs.cluster, "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  rc, policy_data = get_client().list("policy.open-cluster-management.io/v1", "policies", cliargs.cluster, retries=3)
   if rc != 0:
-    logger.error("analyze-cluster-time, oc get policies rc: {}".format(rc))
+    logger.error("analyze-cluster-time, list policies rc: {}".format(rc))
     sys.exit(1)
   with open("{}/policies.json".format(raw_data_dir), "w") as data_file:
-    data_file.write(output)
-  policy_data = json.loads(output)
+    json.dump(policy_data, data_file)
 
 
   if cliargs.method == "agent":
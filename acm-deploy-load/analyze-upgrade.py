@@ -28,9 +28,14 @@ import os
 from pathlib import Path
 import sys
 import time
-from utils.command import command
+from utils.kube import get_client
 from utils.output import assemble_stats
 from utils.output import log_write
+from utils.results import convert_csv
+from utils.spoke_collector import add_collector_arguments
+from utils.spoke_collector import resuming
+from utils.spoke_collector import SpokeCollector
+from utils.spoke_collector import spoke_request
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(threadName)s : %(message)s")
@@ -73,6 +78,7 @@ def main():
                     help="Set raw data directory for offline processing. Empty finds last directory")
   parser.add_argument("-s", "--display-summary", action="store_true", default=False, help="Display summerized data")
   parser.add_argument("-b", "--display-batch", action="store_true", default=False, help="Display CGU batch data")
+  add_collector_arguments(parser)
   parser.add_argument("-d", "--debug", action="store_true", default=False, help="Set log level debug")
   cliargs = parser.parse_args()
 
@@ -89,7 +95,7 @@ def main():
 
   ts = datetime.now().strftime("%Y%m%d-%H%M%S")
   raw_data_dir = "{}/upgrade-{}".format(cliargs.results_directory, ts)
-  if cliargs.offline_process:
+  if cliargs.offline_process or resuming(cliargs):
     if cliargs.raw_data_directory == "":
       # Detect last raw data directory
       dir_scan = sorted([ f.path for f in os.scandir(cliargs.results_directory) if f.is_dir() and "upgrade" in f.path ])
@@ -112,14 +118,12 @@ def main():
 
   cgus = OrderedDict()
 
-  if not cliargs.offline_process:
-    oc_cmd = ["oc", "get", "clustergroupupgrade", "-n", "ztp-platform-upgrade", "-o", "json"]
-    rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  if not cliargs.offline_process and not resuming(cliargs):
+    rc = get_client().write_list("{}/cgus.json".format(raw_data_dir), "ran.openshift.io/v1alpha1", "clustergroupupgrades",
+        "ztp-platform-upgrade", retries=3)
     if rc != 0:
-      logger.error("analyze-upgrade, oc get clustergroupupgrade rc: {}".format(rc))
+      logger.error("analyze-upgrade, list clustergroupupgrades rc: {}".format(rc))
       sys.exit(1)
-    with open("{}/cgus.json".format(raw_data_dir), "w") as cgu_data_file:
-      cgu_data_file.write(output)
 
   with open("{}/cgus.json".format(raw_data_dir), "r") as cgu_data_file:
     cgu_data = json.load(cgu_data_file)
@@ -128,6 +132,21 @@ def main():
     logger.error("No CGUs to analyze")
     sys.exit(1)
 
+  # Collect every cluster's raw data concurrently first, the analysis below only reads raw_data_dir
+  if not cliargs.offline_process:
+    clusters = sorted(set(cluster for item in cgu_data["items"] if "startedAt" in item["status"]["status"]
+                          for batch in item["status"]["remediationPlan"] for cluster in batch))
+    # Operator csvs are only needed of clusters that completed the platform upgrade
+    spoke_requests = [spoke_request("cv", "config.openshift.io/v1", "clusterversions", "version")]
+    if not cliargs.no_operator_csvs:
+      spoke_requests.append(spoke_request("csv", "operators.coreos.com/v1alpha1", "clusterserviceversions",
+          when=lambda fetched: fetched["cv"] is not None and any(
+              entry["version"] == cliargs.platform_upgrade and entry["state"] == "Completed"
+              for entry in fetched["cv"].get("status", {}).get("history", []))))
+    SpokeCollector(cliargs.kubeconfigs, raw_data_dir, spoke_requests, cliargs.concurrency,
+                   cliargs.spoke_timeout).collect(clusters, cliargs.resume, cliargs.retry_unreachable,
+                                                  cliargs.stale_after)
+
   for item in cgu_data["items"]:
     cgu_name = item["metadata"]["name"]
     cgu_creation_ts = item["metadata"]["creationTimestamp"]
@@ -168,16 +187,6 @@ def main():
           csv_operator_last_update_time = ""
           csv_operator_duration = ""
           csv_upgrade_duration = ""
-          kubeconfig = "{}/{}/kubeconfig".format(cliargs.kubeconfigs, cluster)
-
-          if not cliargs.offline_process:
-            oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "clusterversion", "version", "-o", "json"]
-            rc, output = command(oc_cmd, False, retries=2, no_log=True)
-            if rc != 0:
-              logger.error("analyze-upgrade, oc get clusterversion rc: {}".format(rc))
-              output = ""
-            with open("{}/{}-cv.json".format(raw_data_dir, cluster), "w") as cv_data_file:
-              cv_data_file.write(output)
 
           if os.stat("{}/{}-cv.json".format(raw_data_dir, cluster)).st_size == 0:
             cv_data = ""
@@ -239,15 +248,6 @@ def main():
 
               # Cluster had completed, check operators
               if not cliargs.no_operator_csvs:
-                if not cliargs.offline_process:
-                  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "clusterserviceversions", "-A", "-o", "json"]
-                  rc, output = command(oc_cmd, False, retries=2, no_log=True)
-                  if rc != 0:
-                    logger.error("analyze-upgrade, oc get clusterserviceversions rc: {}".format(rc))
-                    output = ""
-                  with open("{}/{}-csv.json".format(raw_data_dir, cluster), "w") as csv_data_file:
-                    csv_data_file.write(output)
-
                 if os.stat("{}/{}-csv.json".format(raw_data_dir, cluster)).st_size == 0:
                   csv_data = ""
                 else:
@@ -317,6 +317,8 @@ def main():
               csv_upgrade_duration))
     else:
       logger.warning("No startedAt field in CGU: {}".format(cgu_name))
+  convert_csv(upgrade_csv_file, datetime_columns=["platform_startedTime", "platform_completionTime",
+      "operator_creationTimestamp", "operator_lastUpdateTime"], dtype={"cgu": str, "name": str, "state": str})
 
   if len(cgus) == 0:
     logger.error("No CGUs had data to analyze")
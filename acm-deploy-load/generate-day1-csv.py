@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+#
+# Generate the day1.csv consumed by report-per-cluster.py from installed AgentClusterInstalls on a hub cluster
+#
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import logging
+import os
+import requests
+from requests.adapters import HTTPAdapter
+import sys
+import time
+import urllib3
+from utils.kube import get_client
+
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(threadName)s : %(message)s")
+logger = logging.getLogger("acm-deploy-load")
+logging.Formatter.converter = time.gmtime
+
+day1_columns = [
+  "name",
+  "cluster_name",
+  "aci_creation",
+  "aci_installed",
+  "assisted_cluster_registration",
+  "assisted_host_registration",
+  "assisted_installed",
+  "bmh_provision_start",
+  "bmh_provision_end",
+  "managedcluster_imported"
+]
+
+# Assisted service events are fetched with their own pooled session, the events URLs are presigned and need no token
+session = requests.Session()
+
+
+def condition_time(item, condition_type, status=""):
+  for condition in item.get("status", {}).get("conditions", []) or []:
+    if condition["type"] == condition_type and (status == "" or condition["status"] == status):
+      return condition.get("lastTransitionTime", "")
+  return ""
+
+
+def list_items(client, api_version, resource, retries):
+  # Yields every item of a cluster wide list one page at a time, exits on a failed page
+  for rc, page in client.list_pages(api_version, resource, retries=retries):
+    if rc != 0:
+      logger.error("generate-day1-csv, list {} rc: {}".format(resource, rc))
+      sys.exit(1)
+    yield from page["items"]
+
+
+def fetch_events(events_url, retries):
+  # Returns the assisted cluster registration and installed times and the host registration time per host id
+  events = {"cluster_registration": "", "installed": "", "host_registration": {}}
+  if events_url == "":
+    return events
+  event_list = None
+  for attempt in range(retries):
+    try:
+      response = session.get(events_url, verify=False, timeout=60)
+      if response.status_code == 200:
+        event_list = response.json()
+        break
+      logger.warning("Events {} status: {}".format(events_url, response.status_code))
+    except (requests.exceptions.RequestException, ValueError) as e:
+      logger.warning("Events {} failed: {}".format(events_url, e))
+    time.sleep(attempt + 1)
+  if event_list is None:
+    logger.error("Unable to fetch events: {}".format(events_url))
+    return events
+  for event in event_list:
+    name = event.get("name", "")
+    if name == "cluster_registration_succeeded" and events["cluster_registration"] == "":
+      events["cluster_registration"] = event["event_time"]
+    elif name == "cluster_installation_completed" and events["installed"] == "":
+      events["installed"] = event["event_time"]
+    elif name == "host_registration_succeeded" and event.get("host_id", "") not in events["host_registration"]:
+      events["host_registration"][event.get("host_id", "")] = event["event_time"]
+  return events
+
+
+def main():
+  start_time = time.time()
+
+  parser = argparse.ArgumentParser(
+      description="Generate day1.csv of per-host install timestamps for report-per-cluster.py",
+      prog="generate-day1-csv.py", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("results_directory", type=str, nargs="?", default="",
+                      help="Directory to write day1-<timestamp>.csv into, otherwise the csv is written to stdout")
+  parser.add_argument("--kubeconfig", type=str, default="", help="Hub cluster kubeconfig, defaults to $KUBECONFIG")
+  parser.add_argument("-c", "--concurrency", type=int, default=32,
+                      help="Number of assisted service events URLs fetched concurrently")
+  parser.add_argument("--retries", type=int, default=3, help="Attempts per list page and events URL")
+  cliargs = parser.parse_args()
+
+  client = get_client(cliargs.kubeconfig)
+  session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=cliargs.concurrency))
+  session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=cliargs.concurrency))
+  urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+  # Each kind is listed once for the whole hub and joined in memory by namespace and hostname
+  logger.info("Listing agentclusterinstalls")
+  acis = []
+  for item in list_items(client, "extensions.hive.openshift.io/v1beta1", "agentclusterinstalls", cliargs.retries):
+    aci_installed = condition_time(item, "Completed", "True")
+    if aci_installed == "":
+      continue
+    acis.append({
+      "name": item["metadata"]["name"],
+      "namespace": item["metadata"]["namespace"],
+      "creation": item["metadata"]["creationTimestamp"],
+      "installed": aci_installed,
+      "events_url": item.get("status", {}).get("debugInfo", {}).get("eventsURL", "")
+    })
+  acis.sort(key=lambda aci: aci["name"])
+  logger.info("Found {} installed agentclusterinstalls".format(len(acis)))
+
+  logger.info("Listing agents")
+  agents = {}
+  for item in list_items(client, "agent-install.openshift.io/v1beta1", "agents", cliargs.retries):
+    agents.setdefault(item["metadata"]["namespace"], []).append(
+        (item["metadata"]["name"], item.get("spec", {}).get("hostname", "")))
+
+  logger.info("Listing baremetalhosts")
+  bmh_provision = {}
+  for item in list_items(client, "metal3.io/v1alpha1", "baremetalhosts", cliargs.retries):
+    provision = (item.get("status", {}).get("operationHistory", {}) or {}).get("provision", {}) or {}
+    bmh_provision[(item["metadata"]["namespace"], item["metadata"]["name"])] = (
+        provision.get("start") or "", provision.get("end") or "")
+
+  logger.info("Listing managedclusters")
+  mc_imported = {}
+  for item in list_items(client, "cluster.open-cluster-management.io/v1", "managedclusters", cliargs.retries):
+    mc_imported[item["metadata"]["name"]] = condition_time(item, "ManagedClusterImportSucceeded")
+
+  output_file = sys.stdout
+  if cliargs.results_directory != "":
+    if not os.path.isdir(cliargs.results_directory):
+      logger.error("Directory not found: {}".format(cliargs.results_directory))
+      sys.exit(1)
+    day1_csv_file = "{}/day1-{}.csv".format(cliargs.results_directory, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    logger.info("Writing CSV: {}".format(day1_csv_file))
+    output_file = open(day1_csv_file, "w")
+
+  # Events are fetched concurrently, rows are written in cluster name order as each cluster's events arrive
+  hosts = 0
+  output_file.write("{}\n".format(",".join(day1_columns)))
+  with ThreadPoolExecutor(max_workers=cliargs.concurrency) as events_executor:
+    for aci, events in zip(acis, events_executor.map(
+        lambda aci: fetch_events(aci["events_url"], cliargs.retries), acis)):
+      for host_id, hostname in sorted(agents.get(aci["namespace"], [])):
+        provision_start, provision_end = bmh_provision.get((aci["namespace"], hostname), ("", ""))
+        output_file.write("{}\n".format(",".join([
+            hostname, aci["name"], aci["creation"], aci["installed"], events["cluster_registration"],
+            events["host_registration"].get(host_id, ""), events["installed"], provision_start, provision_end,
+            mc_imported.get(aci["name"], "")])))
+        hosts += 1
+  if output_file is not sys.stdout:
+    output_file.close()
+  logger.info("Wrote {} hosts of {} clusters".format(hosts, len(acis)))
+
+  end_time = time.time()
+  logger.info("Took {}s".format(round(end_time - start_time, 1)))
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 #
-# Generate overlay comparison graphs from two acm-deploy-load / acm-telco-core-load
+# Generate overlay comparison graphs from two or more acm-deploy-load / acm-telco-core-load
 # Prometheus analysis directories.
 #
 #  Copyright 2026 Red Hat
@@ -18,17 +18,23 @@
 #  limitations under the License.
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import glob
 import logging
 import math
+import multiprocessing
 import os
 import re
+import string
 import sys
 import time
 from datetime import datetime, timezone
 
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+
+from utils.results import read_results
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(message)s")
 logger = logging.getLogger("graph-acm-compare")
@@ -153,11 +159,12 @@ DEPLOY_DEFS = {
     },
 }
 
-COLORS = {"a": "#2563eb", "b": "#c2410c"}
-DEPLOY_COLORS = {
-    "a_applied": "#1e3a5f", "a_milestone": "#60a5fa",
-    "b_applied": "#7f1d1d", "b_milestone": "#c2410c",
-}
+# One color per result in argument order, the first two match the original A/B comparison
+RUN_COLORS = [
+    "#2563eb", "#c2410c", "#059669", "#7c3aed", "#db2777",
+    "#ca8a04", "#0891b2", "#4b5563", "#65a30d", "#9f1239",
+]
+MILESTONE_DASHES = ["dash", "dot", "dashdot"]
 
 PHASE_COLORS = ["#dbeafe", "#fef9c3", "#dcfce7"]
 PHASE_LABELS = {
@@ -256,17 +263,10 @@ def phases_to_elapsed(phases, t0):
     return result
 
 
-def read_csv(path):
-    df = pd.read_csv(path, index_col=0)
-    df["datetime"] = pd.to_datetime(df["datetime"], utc=True)
-    return df
 
 
-def to_elapsed_minutes(df):
-    t0 = df["datetime"].iloc[0]
-    df = df.copy()
-    df["minutes"] = (df["datetime"] - t0).dt.total_seconds() / 60
-    return df, t0
+def read_csv(path):
+    return read_results(path, ["datetime"], index_col=0)
 
 
 def get_series(df, agg):
@@ -282,137 +282,146 @@ def get_series(df, agg):
 
 
 def read_monitor_csv(path):
-    df = pd.read_csv(path)
+    df = read_results(path, ["date"])
     df["datetime"] = pd.to_datetime(df["date"], utc=True)
     df = df.drop(columns=["date"])
     return df
 
 
-DEPLOY_ALL_COLORS = {
-    "a": ["#1e3a5f", "#1d4ed8", "#60a5fa", "#bfdbfe"],
-    "b": ["#7f1d1d", "#991b1b", "#c2410c", "#ea580c"],
-}
+def load_run(result_dir, analysis_dir, label, metrics):
+    """Load one result onto an elapsed-time axis shared by all of its metrics.
+
+    Each metric CSV is read once and reduced to a single aggregated, scaled column.
+    The columns are joined on timestamp and all times, including the phases and
+    monitor data, are converted to minutes from the start of the first phase, or
+    from the earliest sample when report.txt has no phases.
+    """
+    columns = {}
+    for metric in metrics:
+        gdef = GRAPH_DEFS[metric]
+        path = os.path.join(analysis_dir, gdef["csv"])
+        if not os.path.isfile(path):
+            logger.warning("CSV not found, skipping {} for {}: {}".format(metric, label, path))
+            continue
+        df = read_csv(path)
+        series = get_series(df, gdef["agg"]) * gdef.get("scale", 1)
+        series.index = df["datetime"]
+        columns[metric] = series
+    # A result lacking every metric still gets a timestamp index for the minutes column
+    frame = pd.DataFrame(columns, index=None if columns else pd.DatetimeIndex([], tz="UTC")).sort_index()
+
+    monitor = None
+    monitor_csv = os.path.join(result_dir, "monitor_data.csv")
+    if os.path.isfile(monitor_csv):
+        monitor = read_monitor_csv(monitor_csv)
+    else:
+        logger.warning("monitor_data.csv not found for {}: {}".format(label, monitor_csv))
 
+    phases = parse_phases(os.path.join(result_dir, "report.txt"))
+    if phases:
+        t0 = phases[0][2]
+    else:
+        starts = []
+        if len(frame) > 0:
+            starts.append(frame.index[0])
+        if monitor is not None and len(monitor) > 0:
+            starts.append(monitor["datetime"].iloc[0])
+        t0 = min(starts) if starts else datetime.now(timezone.utc)
+    frame.insert(0, "minutes", (frame.index - t0).total_seconds() / 60)
+    if monitor is not None:
+        monitor["minutes"] = (monitor["datetime"] - t0).dt.total_seconds() / 60
 
-def generate_deploy_graph(metric, result_dir_a, result_dir_b, label_a, label_b,
-                          output_path, width, height, phases_a=None, phases_b=None):
-    ddef = DEPLOY_DEFS[metric]
-    csv_a = os.path.join(result_dir_a, "monitor_data.csv")
-    csv_b = os.path.join(result_dir_b, "monitor_data.csv")
+    logger.info("Loaded {}: {} metrics, {} phases from {}".format(label, len(columns), len(phases), analysis_dir))
+    return {
+        "label": label,
+        "frame": frame,
+        "monitor": monitor,
+        "phases": phases_to_elapsed(phases, t0),
+    }
 
-    if not os.path.isfile(csv_a):
-        logger.warning("monitor_data.csv not found, skipping {}: {}".format(metric, csv_a))
-        return False
-    if not os.path.isfile(csv_b):
-        logger.warning("monitor_data.csv not found, skipping {}: {}".format(metric, csv_b))
-        return False
 
-    df_a, t0_a = to_elapsed_minutes(read_monitor_csv(csv_a))
-    df_b, t0_b = to_elapsed_minutes(read_monitor_csv(csv_b))
+def run_color(index):
+    return RUN_COLORS[index % len(RUN_COLORS)]
 
-    fig = go.Figure()
 
-    if phases_a or phases_b:
-        pa = phases_to_elapsed(phases_a, t0_a) if phases_a else []
-        pb = phases_to_elapsed(phases_b, t0_b) if phases_b else []
-        add_phase_annotations(fig, pa, pb, label_a, label_b)
+def runs_title(title, runs):
+    if len(runs) <= 3:
+        return "{} — {}".format(title, " vs ".join(run["label"] for run in runs))
+    return "{} — {} Results".format(title, len(runs))
 
-    b_dash = "1px 1px"
-    is_combined = "milestone_cols" in ddef
 
+def deploy_x_range(runs):
     # Dynamically trim x-axis to focus on deploy activity:
     # - Keep 30 min of idle before the earliest deploy start (trim only if idle > 30 min)
     # - Keep 60 min of soak after the latest soak start (trim only if soak > 60 min)
-    # - Never trim the deploy phase — use the union of both results' deploy windows
-    x_range = None
-    if phases_a or phases_b:
-        pa = phases_to_elapsed(phases_a, t0_a) if phases_a else []
-        pb = phases_to_elapsed(phases_b, t0_b) if phases_b else []
-        max_data_minutes = max(df_a["minutes"].max(), df_b["minutes"].max())
-        deploy_starts = []
-        soak_starts = []
-        soak_durations = []
-        for phases_elapsed in [pa, pb]:
-            for num, _, start_min, end_min in phases_elapsed:
-                if num == "2":
-                    deploy_starts.append(start_min)
-                elif num == "3":
-                    soak_starts.append(start_min)
-                    soak_durations.append(end_min - start_min)
-
-        x_min = 0
-        x_max = max_data_minutes
-        if deploy_starts and min(deploy_starts) > 30:
-            x_min = min(deploy_starts) - 30
-        if soak_starts and soak_durations and max(soak_durations) > 60:
-            x_max = max(soak_starts) + 60
-        if x_min > 0 or x_max < max_data_minutes:
-            x_range = [x_min, x_max]
+    # - Never trim the deploy phase — use the union of all results' deploy windows
+    if not any(run["phases"] for run in runs):
+        return None
+    max_data_minutes = max(run["monitor"]["minutes"].max() for run in runs)
+    deploy_starts = []
+    soak_starts = []
+    soak_durations = []
+    for run in runs:
+        for num, _, start_min, end_min in run["phases"]:
+            if num == "2":
+                deploy_starts.append(start_min)
+            elif num == "3":
+                soak_starts.append(start_min)
+                soak_durations.append(end_min - start_min)
+
+    x_min = 0
+    x_max = max_data_minutes
+    if deploy_starts and min(deploy_starts) > 30:
+        x_min = min(deploy_starts) - 30
+    if soak_starts and soak_durations and max(soak_durations) > 60:
+        x_max = max(soak_starts) + 60
+    if x_min > 0 or x_max < max_data_minutes:
+        return [x_min, x_max]
+    return None
+
+
+def generate_deploy_graph(metric, runs, width, height):
+    ddef = DEPLOY_DEFS[metric]
+    runs = [run for run in runs if run["monitor"] is not None]
+    if not runs:
+        logger.warning("No monitor_data.csv found, skipping {}".format(metric))
+        return None
+
+    fig = go.Figure()
+    add_phase_annotations(fig, runs)
 
+    is_combined = "milestone_cols" in ddef
     if is_combined:
         milestones = ddef["milestone_cols"]
-        a_colors = DEPLOY_ALL_COLORS["a"]
-        b_colors = DEPLOY_ALL_COLORS["b"]
-
-        fig.add_trace(go.Scatter(
-            x=df_a["minutes"], y=df_a["cluster_applied"], mode="lines",
-            name="{} Applied".format(label_a),
-            line=dict(color=a_colors[0], width=2),
-        ))
-        for i, (col, label) in enumerate(milestones):
-            fig.add_trace(go.Scatter(
-                x=df_a["minutes"], y=df_a[col], mode="lines",
-                name="{} {}".format(label_a, label),
-                line=dict(color=a_colors[i + 1], width=1.5),
-            ))
+    else:
+        milestones = [(ddef["milestone_col"], ddef["milestone_label"])]
 
+    # Each result keeps one color, applied and the milestones are told apart by dash
+    for i, run in enumerate(runs):
+        df = run["monitor"]
         fig.add_trace(go.Scatter(
-            x=df_b["minutes"], y=df_b["cluster_applied"], mode="lines",
-            name="{} Applied".format(label_b),
-            line=dict(color=b_colors[0], width=2, dash=b_dash),
+            x=df["minutes"], y=df["cluster_applied"], mode="lines",
+            name="{} Applied".format(run["label"]),
+            line=dict(color=run_color(i), width=2),
         ))
-        for i, (col, label) in enumerate(milestones):
+        for j, (col, label) in enumerate(milestones):
             fig.add_trace(go.Scatter(
-                x=df_b["minutes"], y=df_b[col], mode="lines",
-                name="{} {}".format(label_b, label),
-                line=dict(color=b_colors[i + 1], width=1.5, dash=b_dash),
+                x=df["minutes"], y=df[col], mode="lines",
+                name="{} {}".format(run["label"], label),
+                line=dict(color=run_color(i), width=1.5, dash=MILESTONE_DASHES[j % len(MILESTONE_DASHES)]),
             ))
-    else:
-        milestone_col = ddef["milestone_col"]
-        milestone_label = ddef["milestone_label"]
-
-        fig.add_trace(go.Scatter(
-            x=df_a["minutes"], y=df_a["cluster_applied"], mode="lines",
-            name="{} Applied".format(label_a),
-            line=dict(color=DEPLOY_COLORS["a_applied"], width=2),
-        ))
-        fig.add_trace(go.Scatter(
-            x=df_a["minutes"], y=df_a[milestone_col], mode="lines",
-            name="{} {}".format(label_a, milestone_label),
-            line=dict(color=DEPLOY_COLORS["a_milestone"], width=1.5),
-        ))
-        fig.add_trace(go.Scatter(
-            x=df_b["minutes"], y=df_b["cluster_applied"], mode="lines",
-            name="{} Applied".format(label_b),
-            line=dict(color=DEPLOY_COLORS["b_applied"], width=2, dash=b_dash),
-        ))
-        fig.add_trace(go.Scatter(
-            x=df_b["minutes"], y=df_b[milestone_col], mode="lines",
-            name="{} {}".format(label_b, milestone_label),
-            line=dict(color=DEPLOY_COLORS["b_milestone"], width=1.5, dash=b_dash),
-        ))
 
-    title = "{} — {} vs {}".format(ddef["title"], label_a, label_b)
     layout = dict(
-        title=title,
+        title=runs_title(ddef["title"], runs),
         yaxis_title="# Clusters",
         width=width,
         height=height,
         **LAYOUT_DEFAULTS,
     )
+    x_range = deploy_x_range(runs)
     if x_range:
         layout["xaxis"] = dict(**LAYOUT_DEFAULTS["xaxis"], range=x_range)
-    if is_combined:
+    if is_combined or len(runs) > 2:
         layout["legend"] = dict(
             orientation="v",
             yanchor="top",
@@ -424,24 +433,28 @@ def generate_deploy_graph(metric, result_dir_a, result_dir_b, label_a, label_b,
         layout["margin"] = dict(l=70, r=200, t=80, b=75)
 
     fig.update_layout(**layout)
-
-    fig.write_image(output_path)
-    logger.info("Wrote: {}".format(output_path))
-    return True
+    return fig
 
 
-def add_phase_annotations(fig, phases_a_elapsed, phases_b_elapsed, label_a, label_b):
-    """Add phase annotations for both results.
+def add_phase_annotations(fig, runs):
+    """Add phase annotations for every result.
 
-    Result A: full-height shaded regions with labels at top.
-    Result B: thin bar along the bottom with labels.
-    Legend entries explain which shading belongs to which result.
+    First result: full-height shaded regions with labels at top.
+    Other results: one thin bar each along the bottom, stacked in result order.
+    A key in the corner explains which shading belongs to which result.
     """
+    runs = [run for run in runs if run["phases"]]
+    if not runs:
+        return
+
+    key = "Shading: {}".format(runs[0]["label"])
+    if len(runs) > 1:
+        key += "<br>Bottom bars (bottom up): {}".format(", ".join(run["label"] for run in runs[1:]))
     # Phase shading key — bottom-right corner
     fig.add_annotation(
         x=1.0, xref="paper", xanchor="right",
         y=0.0, yref="paper", yanchor="bottom",
-        text="Shading: {}<br>Bottom bar: {}".format(label_a, label_b),
+        text=key,
         showarrow=False,
         font=dict(size=10, color="#374151"),
         bgcolor="rgba(255,255,255,0.85)",
@@ -450,7 +463,7 @@ def add_phase_annotations(fig, phases_a_elapsed, phases_b_elapsed, label_a, labe
         borderpad=4,
     )
 
-    for num, label, start_min, end_min in phases_a_elapsed:
+    for num, label, start_min, end_min in runs[0]["phases"]:
         color = PHASE_COLORS[int(num) % len(PHASE_COLORS) - 1]
         fig.add_vrect(
             x0=start_min, x1=end_min,
@@ -470,59 +483,38 @@ def add_phase_annotations(fig, phases_a_elapsed, phases_b_elapsed, label_a, labe
         )
 
     PHASE_COLORS_B = ["#93c5fd", "#fde047", "#86efac"]
-    for num, _, start_min, end_min in phases_b_elapsed:
-        color = PHASE_COLORS_B[int(num) % len(PHASE_COLORS_B) - 1]
-        fig.add_shape(
-            type="rect",
-            x0=start_min, x1=end_min,
-            y0=0, y1=0.05, yref="paper",
-            fillcolor=color, opacity=0.9,
-            layer="above", line_width=0,
-        )
-        fig.add_vline(
-            x=start_min, line_dash="dot", line_color="#d1d5db", line_width=0.8,
-        )
-
-
-def generate_graph(metric, dir_a, dir_b, label_a, label_b, output_path,
-                   width, height, phases_a=None, phases_b=None):
+    bar_height = 0.05 if len(runs) == 2 else 0.03
+    for i, run in enumerate(runs[1:]):
+        for num, _, start_min, end_min in run["phases"]:
+            color = PHASE_COLORS_B[int(num) % len(PHASE_COLORS_B) - 1]
+            fig.add_shape(
+                type="rect",
+                x0=start_min, x1=end_min,
+                y0=i * bar_height, y1=(i + 1) * bar_height, yref="paper",
+                fillcolor=color, opacity=0.9,
+                layer="above", line_width=0,
+            )
+            fig.add_vline(
+                x=start_min, line_dash="dot", line_color="#d1d5db", line_width=0.8,
+            )
+
+
+def generate_graph(metric, runs, width, height):
     gdef = GRAPH_DEFS[metric]
-    csv_a = os.path.join(dir_a, gdef["csv"])
-    csv_b = os.path.join(dir_b, gdef["csv"])
-
-    if not os.path.isfile(csv_a):
-        logger.warning("CSV not found, skipping {}: {}".format(metric, csv_a))
-        return False
-    if not os.path.isfile(csv_b):
-        logger.warning("CSV not found, skipping {}: {}".format(metric, csv_b))
-        return False
-
-    df_a, t0_a = to_elapsed_minutes(read_csv(csv_a))
-    df_b, t0_b = to_elapsed_minutes(read_csv(csv_b))
-
-    series_a = get_series(df_a, gdef["agg"])
-    series_b = get_series(df_b, gdef["agg"])
-
-    scale = gdef.get("scale")
-    if scale:
-        series_a = series_a * scale
-        series_b = series_b * scale
+    runs = [run for run in runs if metric in run["frame"].columns]
+    if not runs:
+        logger.warning("No results have {}, skipping".format(metric))
+        return None
 
     fig = go.Figure()
+    add_phase_annotations(fig, runs)
 
-    if phases_a or phases_b:
-        pa = phases_to_elapsed(phases_a, t0_a) if phases_a else []
-        pb = phases_to_elapsed(phases_b, t0_b) if phases_b else []
-        add_phase_annotations(fig, pa, pb, label_a, label_b)
-
-    fig.add_trace(go.Scatter(
-        x=df_a["minutes"], y=series_a, mode="lines", name=label_a,
-        line=dict(color=COLORS["a"], width=1.5),
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_b["minutes"], y=series_b, mode="lines", name=label_b,
-        line=dict(color=COLORS["b"], width=1.5),
-    ))
+    for i, run in enumerate(runs):
+        df = run["frame"]
+        fig.add_trace(go.Scatter(
+            x=df["minutes"], y=df[metric], mode="lines", name=run["label"],
+            line=dict(color=run_color(i), width=1.5), connectgaps=True,
+        ))
 
     if "hline" in gdef:
         fig.add_hline(
@@ -531,9 +523,8 @@ def generate_graph(metric, dir_a, dir_b, label_a, label_b, output_path,
             annotation_font_color="#dc2626", annotation_font_size=11,
         )
 
-    title = "{} — {} vs {}".format(gdef["title"], label_a, label_b)
     fig.update_layout(
-        title=title,
+        title=runs_title(gdef["title"], runs),
         yaxis_title=gdef["yaxis"],
         width=width,
         height=height,
@@ -541,36 +532,52 @@ def generate_graph(metric, dir_a, dir_b, label_a, label_b, output_path,
     )
 
     if gdef.get("memory"):
-        max_val = max(series_a.max(), series_b.max())
+        max_val = max(run["frame"][metric].max() for run in runs)
         major, minor = memory_ticks(max_val)
         fig.update_yaxes(
             dtick=major,
             tick0=0,
             minor=dict(dtick=minor, showgrid=True, gridcolor="#f3f4f6", gridwidth=1),
         )
+    return fig
+
+
+def init_renderer():
+    # Kaleido 1.x starts a browser per write_image unless a sync server is running, 0.2.x keeps its own process
+    try:
+        import kaleido
+        if hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(silence_warnings=True)
+    except ImportError:
+        pass
+
 
-    fig.write_image(output_path)
-    logger.info("Wrote: {}".format(output_path))
-    return True
+def render_figure(fig_json, output_path):
+    pio.from_json(fig_json).write_image(output_path)
+    return output_path
 
 
 def main():
     start_time = time.time()
 
     parser = argparse.ArgumentParser(
-        description="Generate overlay comparison graphs from two test results",
+        description="Generate overlay comparison graphs from two or more test results",
+        epilog="The x axis of each result is minutes from the start of its first phase in report.txt, or from its "
+               "earliest sample when report.txt has no phases, so every metric and the monitor data of a result share "
+               "one origin. Graphs from earlier versions measured each csv from its own first sample, so curves may "
+               "be shifted relative to them.",
         prog="graph-acm-compare.py",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
 
-    parser.add_argument("result_dir_a", type=str,
-        help="Result directory for result A (top-level, e.g., results/20260718-...)")
-    parser.add_argument("result_dir_b", type=str,
-        help="Result directory for result B")
-    parser.add_argument("--label-a", type=str, default="Result A",
-        help="Display label for result A")
-    parser.add_argument("--label-b", type=str, default="Result B",
-        help="Display label for result B")
+    parser.add_argument("result_dirs", type=str, nargs="+",
+        help="Result directories to compare (top-level, e.g., results/20260718-...)")
+    parser.add_argument("-l", "--labels", type=str, nargs="+", default=[],
+        help="Display label per result directory, defaults to Result A, Result B, ...")
+    parser.add_argument("--label-a", type=str, default="",
+        help="Display label for the first result")
+    parser.add_argument("--label-b", type=str, default="",
+        help="Display label for the second result")
     parser.add_argument("-o", "--output-dir", type=str, default=".",
         help="Directory to write PNG files")
     parser.add_argument("-p", "--prefix", type=str, default="comparison",
@@ -583,61 +590,79 @@ def main():
         help="Graph width in pixels")
     parser.add_argument("-t", "--height", type=int, default=600,
         help="Graph height in pixels")
+    parser.add_argument("--render-workers", type=int, default=4,
+        help="Number of processes rendering graphs")
 
     cliargs = parser.parse_args()
 
-    for d in [cliargs.result_dir_a, cliargs.result_dir_b]:
+    if len(cliargs.result_dirs) < 2:
+        logger.error("At least two result directories are required")
+        sys.exit(1)
+    if cliargs.labels and len(cliargs.labels) != len(cliargs.result_dirs):
+        logger.error("Got {} labels for {} result directories".format(len(cliargs.labels), len(cliargs.result_dirs)))
+        sys.exit(1)
+    labels = cliargs.labels or ["Result {}".format(string.ascii_uppercase[i % 26]) for i in
+                                range(len(cliargs.result_dirs))]
+    if cliargs.label_a:
+        labels[0] = cliargs.label_a
+    if cliargs.label_b:
+        labels[1] = cliargs.label_b
+
+    analysis_dirs = []
+    for d, label in zip(cliargs.result_dirs, labels):
         if not os.path.isdir(d):
             logger.error("Directory not found: {}".format(d))
             sys.exit(1)
+        analysis_dir = find_deploy_pa(d)
+        if not analysis_dir:
+            logger.error("No deploy-pa / acm-telco-load-hub directory found in: {}".format(d))
+            sys.exit(1)
+        logger.info("{} analysis dir: {}".format(label, analysis_dir))
+        analysis_dirs.append(analysis_dir)
 
-    dir_a = find_deploy_pa(cliargs.result_dir_a)
-    dir_b = find_deploy_pa(cliargs.result_dir_b)
-    if not dir_a:
-        logger.error("No deploy-pa / acm-telco-load-hub directory found in: {}".format(cliargs.result_dir_a))
-        sys.exit(1)
-    if not dir_b:
-        logger.error("No deploy-pa / acm-telco-load-hub directory found in: {}".format(cliargs.result_dir_b))
-        sys.exit(1)
-    logger.info("Result A analysis dir: {}".format(dir_a))
-    logger.info("Result B analysis dir: {}".format(dir_b))
-
-    phases_a = parse_phases(os.path.join(cliargs.result_dir_a, "report.txt"))
-    phases_b = parse_phases(os.path.join(cliargs.result_dir_b, "report.txt"))
-    if phases_a:
-        logger.info("Parsed {} phases from result A".format(len(phases_a)))
-    if phases_b:
-        logger.info("Parsed {} phases from result B".format(len(phases_b)))
+    # Every result is loaded once, all graphs are built from the loaded frames
+    with ThreadPoolExecutor(max_workers=len(cliargs.result_dirs)) as load_executor:
+        runs = list(load_executor.map(load_run, cliargs.result_dirs, analysis_dirs, labels,
+                                      [cliargs.metrics] * len(labels)))
 
     os.makedirs(cliargs.output_dir, exist_ok=True)
 
-    generated = 0
+    figures = []
     for metric in cliargs.metrics:
-        output_path = os.path.join(cliargs.output_dir, "{}-{}.png".format(cliargs.prefix, metric))
         try:
-            if generate_graph(metric, dir_a, dir_b, cliargs.label_a, cliargs.label_b,
-                              output_path, cliargs.width, cliargs.height,
-                              phases_a=phases_a, phases_b=phases_b):
-                generated += 1
+            fig = generate_graph(metric, runs, cliargs.width, cliargs.height)
+            if fig is not None:
+                figures.append(("resource", metric, fig))
         except Exception:
             logger.exception("Failed to generate graph for metric: {}".format(metric))
-
-    deploy_generated = 0
     for dmetric in DEPLOY_DEFS:
-        output_path = os.path.join(cliargs.output_dir, "{}-{}.png".format(cliargs.prefix, dmetric))
         try:
-            if generate_deploy_graph(dmetric, cliargs.result_dir_a, cliargs.result_dir_b,
-                                     cliargs.label_a, cliargs.label_b,
-                                     output_path, cliargs.width, cliargs.height,
-                                     phases_a=phases_a, phases_b=phases_b):
-                deploy_generated += 1
+            fig = generate_deploy_graph(dmetric, runs, cliargs.width, cliargs.height)
+            if fig is not None:
+                figures.append(("deploy", dmetric, fig))
         except Exception:
             logger.exception("Failed to generate deploy graph: {}".format(dmetric))
 
+    # Render processes are spawned rather than forked from a process that ran load threads
+    generated = {"resource": 0, "deploy": 0}
+    with ProcessPoolExecutor(max_workers=cliargs.render_workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_renderer) as render_executor:
+        futures = {}
+        for kind, metric, fig in figures:
+            output_path = os.path.join(cliargs.output_dir, "{}-{}.png".format(cliargs.prefix, metric))
+            futures[render_executor.submit(render_figure, fig.to_json(), output_path)] = (kind, metric)
+        for future in as_completed(futures):
+            kind, metric = futures[future]
+            if future.exception() is not None:
+                logger.error("Failed to render graph {}: {}".format(metric, future.exception()))
+                continue
+            logger.info("Wrote: {}".format(future.result()))
+            generated[kind] += 1
+
     elapsed = time.time() - start_time
-    total = generated + deploy_generated
-    logger.info("Generated {} graphs ({} resource, {} deploy) in {:.1f}s".format(
-        total, generated, deploy_generated, elapsed))
+    total = generated["resource"] + generated["deploy"]
+    logger.info("Generated {} graphs ({} resource, {} deploy) from {} results in {:.1f}s".format(
+        total, generated["resource"], generated["deploy"], len(runs), elapsed))
 
 
 if __name__ == "__main__":
@@ -20,7 +20,6 @@ import argparse
 from datetime import datetime, timezone
 import json
 import logging
-import pandas as pd
 import pathlib
 import plotly as py
 import plotly.figure_factory as ff
@@ -28,6 +27,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 import sys
 import time
+from utils.results import read_results
 
 # TODO:
 # Produce concurrency workload graph
@@ -85,7 +85,7 @@ def main():
     logger.error("File not found: {}".format(md_csv_file))
     sys.exit(1)
 
-  df = pd.read_csv(md_csv_file)
+  df = read_results(md_csv_file)
 
   cluster_inited = df["cluster_init"].values[-1]
   cluster_completed = df["cluster_install_completed"].values[-1]
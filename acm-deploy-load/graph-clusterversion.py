@@ -17,9 +17,6 @@
 #  limitations under the License.
 
 import argparse
-from collections import OrderedDict
-from csv import reader
-from datetime import datetime
 from datetime import timedelta
 import logging
 import os
@@ -31,6 +28,10 @@ import plotly.graph_objects as go
 import plotly.express as px
 import sys
 import time
+from utils.results import read_results
+from utils.results import write_results
+from utils.timeline import minute_counts
+from utils.timeline import minute_index
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(threadName)s : %(message)s")
@@ -70,94 +71,45 @@ def main():
   logger.info("Graphs will be placed in this directory: {}".format(results_directory))
   logger.info("Base graph name: {}".format(base_file_name))
 
-  # Find start/end time for csv file and all recorded clusterversions
-  clusterversions = OrderedDict()
-  csv_start_time = ""
-  csv_end_time = ""
-  with open(cliargs.data_file, "r") as cluster_cv_csv:
-    csv_reader = reader(cluster_cv_csv)
-    # Remove the csv header first
-    header = next(csv_reader)
-    if header != None:
-      for row in csv_reader:
-        if row[2].lower() == "completed":
-          row_starttime = datetime.strptime(row[3], "%Y-%m-%dT%H:%M:%SZ").replace(second=0, microsecond=0)
-          row_endtime = datetime.strptime(row[4], "%Y-%m-%dT%H:%M:%SZ").replace(second=0, microsecond=0) + timedelta(minutes=1)
-
-          # Determine the start and end times of the csv file
-          if csv_start_time == "":
-            csv_start_time = row_starttime
-          else:
-            if row_starttime < csv_start_time:
-              # The row start time is earlier than the saved start time
-              csv_start_time = row_starttime
-          if csv_end_time == "":
-            csv_end_time = row_endtime
-          else:
-            if row_endtime > csv_end_time:
-              # The row end time is later than the saved end time
-              csv_end_time = row_endtime
-
-          if row[1] not in clusterversions:
-            clusterversions[row[1]] = {"start": row_starttime, "end": row_endtime}
-          else:
-            if row_starttime < clusterversions[row[1]]["start"]:
-              clusterversions[row[1]]["start"] = row_starttime
-            if row_endtime > clusterversions[row[1]]["end"]:
-              clusterversions[row[1]]["end"] = row_endtime
-        else:
-          logger.info("Partially updated cluster ({} :: {}) is not included in graphs".format(row[0], row[1]))
+  # Read the results once, partially completed upgrades are not included in the graphs at this time
+  cv_df = read_results(cliargs.data_file, ["startedTime", "completionTime"],
+      dtype={"name": str, "version": str, "state": str})
+  completed = cv_df["state"].astype(str).str.lower() == "completed"
+  for row in cv_df[~completed].itertuples(index=False):
+    logger.info("Partially updated cluster ({} :: {}) is not included in graphs".format(row.name, row.version))
+  cv_df = cv_df[completed]
+  if len(cv_df) == 0:
+    logger.error("No completed clusterversions found in: {}".format(cliargs.data_file))
+    sys.exit(1)
+
+  # Each cluster occupies the 1 minute buckets from its started minute through the minute after its completion
+  versions = cv_df["version"].to_numpy()
+  row_starttimes = cv_df["startedTime"].dt.floor("min")
+  row_endtimes = cv_df["completionTime"].dt.floor("min") + timedelta(minutes=1)
+
+  # Start/end time of each recorded clusterversion, in order of appearance
+  clusterversions = pd.DataFrame({"version": versions, "start": row_starttimes.to_numpy(),
+      "end": row_endtimes.to_numpy()}).groupby("version", sort=False).agg({"start": "min", "end": "max"})
 
   # Subtract/Add buffer minutes to the start/end time stamps
-  csv_start_time = csv_start_time - timedelta(minutes=cliargs.buffer_minutes)
-  csv_end_time = csv_end_time + timedelta(minutes=cliargs.buffer_minutes)
+  csv_start_time = row_starttimes.min() - timedelta(minutes=cliargs.buffer_minutes)
+  csv_end_time = row_endtimes.max() + timedelta(minutes=cliargs.buffer_minutes)
 
-  # Create 1 minute buckets
-  data_buckets = OrderedDict()
+  # Count the updating clusters of each version in 1 minute buckets
   bucket_count = int((csv_end_time - csv_start_time).total_seconds() / 60) + 1
-  for i in range(bucket_count):
-    data_bk_ts = csv_start_time + timedelta(minutes=i)
-    data_buckets[data_bk_ts] = OrderedDict()
-    for version in clusterversions:
-      data_buckets[data_bk_ts][version] = 0
-
-  # Populate buckets by reading the original csv a 2nd time
-  with open(cliargs.data_file, "r") as cluster_cv_csv:
-    csv_reader = reader(cluster_cv_csv)
-    # Remove the csv header first
-    header = next(csv_reader)
-    if header != None:
-      for row in csv_reader:
-        # Partially completed upgrades are not included in the graphs at this time
-        if row[2].lower() == "completed":
-          row_version = row[1]
-          row_starttime = (datetime.strptime(row[3], "%Y-%m-%dT%H:%M:%SZ")).replace(second=0, microsecond=0)
-          row_endtime = (datetime.strptime(row[4], "%Y-%m-%dT%H:%M:%SZ") + timedelta(minutes=1)).replace(second=0, microsecond=0)
-          bucket_count = int((row_endtime - row_starttime).total_seconds() / 60) + 1
-          for i in range(bucket_count):
-            data_bk_ts = row_starttime + timedelta(minutes=i)
-            data_buckets[data_bk_ts][row_version] += 1
-
-  # Write the new samples csv file which contains:
-  # datetime, ver1_updating_count, ver2_updating_count, ver3_updating_count ...
-  with open(samples_csv_file, "w") as csv_file:
-    # Write the header first
-    csv_file.write("datetime")
-    for version in clusterversions:
-      csv_file.write(",{}".format(version))
-    csv_file.write("\n")
-    # Write the row
-    for sample in data_buckets:
-      csv_file.write("{}".format(sample.strftime("%Y-%m-%dT%H:%M:%SZ")))
-      for version in clusterversions:
-        csv_file.write(",{}".format(data_buckets[sample][version]))
-      csv_file.write("\n")
-
-  # Have pandas read in the samples csv for graphs
-  df = pd.read_csv(samples_csv_file)
+  version_codes = pd.Index(clusterversions.index).get_indexer(versions)
+  counts = minute_counts(minute_index(row_starttimes, csv_start_time), minute_index(row_endtimes, csv_start_time),
+      bucket_count, version_codes, len(clusterversions))
+
+  # Samples contain: datetime, ver1_updating_count, ver2_updating_count, ver3_updating_count ...
+  df = pd.DataFrame(counts, columns=list(clusterversions.index))
+  df.insert(0, "datetime", pd.date_range(csv_start_time, periods=bucket_count, freq="min"))
+  df.to_csv(samples_csv_file, index=False, date_format="%Y-%m-%dT%H:%M:%SZ")
+  write_results(samples_csv_file, df, datetime_columns=["datetime"])
+  df.index = pd.DatetimeIndex(df["datetime"].to_numpy())
 
   title_upgrade = "Upgrade Graph - All clusterversions"
-  y_upgrade = [version for version in clusterversions]
+  y_upgrade = list(clusterversions.index)
   l = {"value" : "# clusters", "date" : ""}
 
   logger.info("Creating Graph - {}".format(upgrade_graph_file_path))
@@ -165,13 +117,10 @@ def main():
   fig_graph.update_layout(title=title_upgrade, legend_orientation="v")
   fig_graph.write_image(upgrade_graph_file_path)
 
-  for version in clusterversions:
-    version_st = clusterversions[version]["start"] - timedelta(minutes=cliargs.buffer_minutes)
-    version_et = clusterversions[version]["end"] + timedelta(minutes=cliargs.buffer_minutes)
-
-    df['Datetime'] = pd.to_datetime(df['datetime'], format='%Y-%m-%dT%H:%M:%SZ')
-    df = df.set_index(pd.DatetimeIndex(df['Datetime']))
-    df_version = df.loc[str(version_st): str(version_et)]
+  for version in clusterversions.index:
+    version_st = clusterversions.loc[version, "start"] - timedelta(minutes=cliargs.buffer_minutes)
+    version_et = clusterversions.loc[version, "end"] + timedelta(minutes=cliargs.buffer_minutes)
+    df_version = df.loc[version_st: version_et]
 
     version_graph_file_path = "{}/{}-{}.png".format(results_directory, base_file_name, version)
     title_upgrade = "Upgrade Graph - {}".format(version)
@@ -17,9 +17,6 @@
 #  limitations under the License.
 
 import argparse
-from collections import OrderedDict
-from csv import reader
-from datetime import datetime
 from datetime import timedelta
 import logging
 import os
@@ -31,6 +28,10 @@ import plotly.graph_objects as go
 import plotly.express as px
 import sys
 import time
+from utils.results import read_results
+from utils.results import write_results
+from utils.timeline import minute_counts
+from utils.timeline import minute_index
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(threadName)s : %(message)s")
@@ -72,111 +73,57 @@ def main():
   logger.info("Graphs will be placed in this directory: {}".format(results_directory))
   logger.info("Base graph name: {}".format(base_file_name))
 
-  # Find start/end time for csv file and all completed clusters in the inspected batches
-  batches = OrderedDict()
-  csv_start_time = ""
-  csv_end_time = ""
-  with open(cliargs.data_file, "r") as cluster_cv_csv:
-    csv_reader = reader(cluster_cv_csv)
-    # Remove the csv header first
-    header = next(csv_reader)
-    if header != None:
-      for row in csv_reader:
-        batch = row[1]
-        if batch in cliargs.batches:
-          if row[8] != "":
-            row_starttime = datetime.strptime(row[4], "%Y-%m-%dT%H:%M:%SZ").replace(second=0, microsecond=0)
-            row_endtime = datetime.strptime(row[8], "%Y-%m-%dT%H:%M:%SZ").replace(second=0, microsecond=0) + timedelta(minutes=1)
-
-            # Determine the start and end times of the csv file
-            if csv_start_time == "":
-              csv_start_time = row_starttime
-            else:
-              if row_starttime < csv_start_time:
-                # The row start time is earlier than the saved start time
-                csv_start_time = row_starttime
-            if csv_end_time == "":
-              csv_end_time = row_endtime
-            else:
-              if row_endtime > csv_end_time:
-                # The row end time is later than the saved end time
-                csv_end_time = row_endtime
-
-            if batch not in batches:
-              batches[batch] = {"start": row_starttime, "end": row_endtime}
-            else:
-              if row_starttime < batches[batch]["start"]:
-                batches[batch]["start"] = row_starttime
-              if row_endtime > batches[batch]["end"]:
-                batches[batch]["end"] = row_endtime
-          else:
-            logger.info("Incomplete cluster {} upgrade (Status: {}) in batch {} is not included in graphs".format(row[2], row[3], batch))
-        # else:
-        #   logger.info("Cluster timings not inspected due to batch {} not include in {}".format(batch, cliargs.batches))
+  # Read the results once, only completed clusters in the inspected batches are graphed
+  upgrade_df = read_results(cliargs.data_file, ["platform_startedTime", "platform_completionTime",
+      "operator_creationTimestamp", "operator_lastUpdateTime"], dtype={"cgu": str, "name": str, "state": str})
+  upgrade_df["batch"] = upgrade_df["batch"].astype(str)
+  upgrade_df = upgrade_df[upgrade_df["batch"].isin(cliargs.batches)]
+  completed = upgrade_df["operator_lastUpdateTime"].notna()
+  for row in upgrade_df[~completed].itertuples(index=False):
+    logger.info("Incomplete cluster {} upgrade (Status: {}) in batch {} is not included in graphs".format(
+        row.name, row.state, row.batch))
+  upgrade_df = upgrade_df[completed]
+  if len(upgrade_df) == 0:
+    logger.error("No completed cluster upgrades found in batches {}: {}".format(cliargs.batches, cliargs.data_file))
+    sys.exit(1)
+
+  # A cluster occupies the platform buckets from its platform started through completed minute, then the operator
+  # buckets after that through the minute after its operators completed
+  row_batches = upgrade_df["batch"].to_numpy()
+  row_platform_starttimes = upgrade_df["platform_startedTime"].dt.floor("min")
+  row_platform_endtimes = upgrade_df["platform_completionTime"].dt.floor("min")
+  row_operator_endtimes = upgrade_df["operator_lastUpdateTime"].dt.floor("min") + timedelta(minutes=1)
 
+  # Start/end time of each batch, in order of appearance
+  batches = pd.DataFrame({"batch": row_batches, "start": row_platform_starttimes.to_numpy(),
+      "end": row_operator_endtimes.to_numpy()}).groupby("batch", sort=False).agg({"start": "min", "end": "max"})
 
   # Subtract/Add buffer minutes to the start/end time stamps
-  csv_start_time = csv_start_time - timedelta(minutes=cliargs.buffer_minutes)
-  csv_end_time = csv_end_time + timedelta(minutes=cliargs.buffer_minutes)
+  csv_start_time = row_platform_starttimes.min() - timedelta(minutes=cliargs.buffer_minutes)
+  csv_end_time = row_operator_endtimes.max() + timedelta(minutes=cliargs.buffer_minutes)
 
-  # Create 1 minute buckets
-  data_buckets = OrderedDict()
+  # Count the upgrading clusters of each batch and phase in 1 minute buckets, a phase that ends before it starts
+  # occupies no buckets
   bucket_count = int((csv_end_time - csv_start_time).total_seconds() / 60) + 1
-  for i in range(bucket_count):
-    data_bk_ts = csv_start_time + timedelta(minutes=i)
-    data_buckets[data_bk_ts] = OrderedDict()
-    for batch in batches:
-      data_buckets[data_bk_ts]["batch_{}_platform".format(batch)] = 0
-      data_buckets[data_bk_ts]["batch_{}_operator".format(batch)] = 0
-
-  # for ts in data_buckets:
-  #   logger.info("TS: {}, Data: {}".format(ts, data_buckets[ts]))
-
-  # Populate buckets by reading the original csv a 2nd time
-  with open(cliargs.data_file, "r") as cluster_cv_csv:
-    csv_reader = reader(cluster_cv_csv)
-    # Remove the csv header first
-    header = next(csv_reader)
-    if header != None:
-      for row in csv_reader:
-        batch = row[1]
-        if batch in cliargs.batches:
-          if row[8] != "":
-            row_platform_starttime = (datetime.strptime(row[4], "%Y-%m-%dT%H:%M:%SZ")).replace(second=0, microsecond=0)
-            row_platform_endtime = (datetime.strptime(row[5], "%Y-%m-%dT%H:%M:%SZ")).replace(second=0, microsecond=0)
-            row_operator_endtime = (datetime.strptime(row[8], "%Y-%m-%dT%H:%M:%SZ") + timedelta(minutes=1)).replace(second=0, microsecond=0)
-            platform_bucket_count = int((row_platform_endtime - row_platform_starttime).total_seconds() / 60) + 1
-            operator_bucket_count = int((row_operator_endtime - row_platform_endtime).total_seconds() / 60) + 1
-            for i in range(platform_bucket_count):
-              data_bk_ts = row_platform_starttime + timedelta(minutes=i)
-              data_buckets[data_bk_ts]["batch_{}_platform".format(batch)] += 1
-            for i in range(1, operator_bucket_count):
-              data_bk_ts = row_platform_endtime + timedelta(minutes=(i))
-              data_buckets[data_bk_ts]["batch_{}_operator".format(batch)] += 1
-
-  # Write the new samples csv file which contains:
-  # datetime, batch_0_platform, batch_0_operator, batch_1_platform ...
-  with open(samples_csv_file, "w") as csv_file:
-    # Write the header first
-    csv_file.write("datetime")
-    for batch in batches:
-      csv_file.write(",batch_{}_platform".format(batch))
-      csv_file.write(",batch_{}_operator".format(batch))
-    csv_file.write("\n")
-    # Write the row
-    for sample in data_buckets:
-      csv_file.write("{}".format(sample.strftime("%Y-%m-%dT%H:%M:%SZ")))
-      for batch in batches:
-        csv_file.write(",{}".format(data_buckets[sample]["batch_{}_platform".format(batch)]))
-        csv_file.write(",{}".format(data_buckets[sample]["batch_{}_operator".format(batch)]))
-      csv_file.write("\n")
-
-  # Have pandas read in the samples csv for graphs
-  df = pd.read_csv(samples_csv_file)
-
-  title_upgrade = "Cluster Upgrade Graph - Batches {}".format(",".join(batches.keys()))
+  batch_codes = pd.Index(batches.index).get_indexer(row_batches)
+  platform_start = minute_index(row_platform_starttimes, csv_start_time)
+  platform_end = minute_index(row_platform_endtimes, csv_start_time)
+  operator_end = minute_index(row_operator_endtimes, csv_start_time)
+  platform_counts = minute_counts(platform_start, platform_end, bucket_count, batch_codes, len(batches))
+  operator_counts = minute_counts(platform_end + 1, operator_end, bucket_count, batch_codes, len(batches))
+
+  # Samples contain: datetime, batch_0_platform, batch_0_operator, batch_1_platform ...
+  df = pd.DataFrame({"datetime": pd.date_range(csv_start_time, periods=bucket_count, freq="min")})
+  for code, batch in enumerate(batches.index):
+    df["batch_{}_platform".format(batch)] = platform_counts[:, code]
+    df["batch_{}_operator".format(batch)] = operator_counts[:, code]
+  df.to_csv(samples_csv_file, index=False, date_format="%Y-%m-%dT%H:%M:%SZ")
+  write_results(samples_csv_file, df, datetime_columns=["datetime"])
+  df.index = pd.DatetimeIndex(df["datetime"].to_numpy())
+
+  title_upgrade = "Cluster Upgrade Graph - Batches {}".format(",".join(batches.index))
   y_upgrade = []
-  for batch in batches:
+  for batch in batches.index:
     y_upgrade.append("batch_{}_platform".format(batch))
     y_upgrade.append("batch_{}_operator".format(batch))
 
@@ -187,13 +134,10 @@ def main():
   fig_cluster.update_layout(title=title_upgrade, legend_orientation="v")
   fig_cluster.write_image(upgrade_graph_file_path)
 
-  for batch in batches:
-    batch_st = batches[batch]["start"] - timedelta(minutes=cliargs.buffer_minutes)
-    batch_et = batches[batch]["end"] + timedelta(minutes=cliargs.buffer_minutes)
-
-    df['Datetime'] = pd.to_datetime(df['datetime'], format='%Y-%m-%dT%H:%M:%SZ')
-    df = df.set_index(pd.DatetimeIndex(df['Datetime']))
-    df_batch = df.loc[str(batch_st): str(batch_et)]
+  for batch in batches.index:
+    batch_st = batches.loc[batch, "start"] - timedelta(minutes=cliargs.buffer_minutes)
+    batch_et = batches.loc[batch, "end"] + timedelta(minutes=cliargs.buffer_minutes)
+    df_batch = df.loc[batch_st: batch_et]
 
     batch_graph_file_path = "{}/{}-{}.png".format(results_directory, base_file_name, batch)
     title_upgrade = "Upgrade Graph Batch {}".format(batch)
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+#
+# Index acm-deploy-load results directories into a SQLite catalog and query or compare runs from it
+#
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import argparse
+from datetime import datetime, timezone
+import glob
+import json
+import logging
+import numpy as np
+import os
+from prettytable import PrettyTable
+import re
+import sqlite3
+import sys
+import time
+from utils.results import read_results
+
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s : %(levelname)s : %(threadName)s : %(message)s")
+logger = logging.getLogger("acm-deploy-load")
+logging.Formatter.converter = time.gmtime
+
+# One row per run and per run aggregates, a run is a results directory holding a report.txt or versions.json. Each
+# run keeps the signature of the files it was indexed from so update only re-indexes new or changed runs.
+schema = [
+  "CREATE TABLE IF NOT EXISTS runs (run TEXT PRIMARY KEY, path TEXT, signature TEXT, start_ts REAL, end_ts REAL, "
+  "acm_version TEXT, mce_version TEXT, hub_version TEXT, deploy_version TEXT, test_version TEXT, aap_version TEXT, "
+  "wan_emulation TEXT)",
+  "CREATE TABLE IF NOT EXISTS phases (run TEXT, phase INTEGER, label TEXT, start_ts REAL, end_ts REAL)",
+  "CREATE TABLE IF NOT EXISTS monitor (run TEXT, metric TEXT, final REAL, peak REAL)",
+  "CREATE TABLE IF NOT EXISTS transitions (run TEXT, state TEXT, count INTEGER, p50 REAL, p95 REAL, p99 REAL, "
+  "max REAL)",
+  "CREATE TABLE IF NOT EXISTS prometheus (run TEXT, analysis TEXT, section TEXT, name TEXT, series INTEGER, "
+  "mean REAL, p95 REAL, max REAL)",
+]
+run_tables = ["runs", "phases", "monitor", "transitions", "prometheus"]
+version_keys = ["acm_version", "mce_version", "hub_version", "deploy_version", "test_version", "aap_version",
+                "wan_emulation"]
+
+phase_re = re.compile(r"\* Phase (\d+) \(([^)]+)\): (\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z) to "
+                      r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)")
+time_re = re.compile(r"\* (Start|End) Time: (\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)")
+# analyze-prometheus names its directories <prefix>-<YYYYmmdd-HHMMSS>
+analysis_re = re.compile(r"^(.+)-\d{8}-\d{6}$")
+
+
+def to_ts(timestamp):
+  return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+def analysis_csvs(analysis_dir):
+  # The (section, name, csv) of each graph of a prometheus analysis, analyses written before graphs.json existed are
+  # scanned for their csv files instead
+  graphs_file = os.path.join(analysis_dir, "graphs.json")
+  if os.path.exists(graphs_file):
+    with open(graphs_file, "r") as g_file:
+      graphs = json.load(g_file)["graphs"]
+    return [(graph["section"], graph["fname"],
+             os.path.join(analysis_dir, graph["section"], "csv", "{}.csv".format(graph["fname"]))) for graph in graphs]
+  return [(os.path.basename(os.path.dirname(os.path.dirname(csv_file))), os.path.splitext(os.path.basename(csv_file))[0],
+           csv_file) for csv_file in sorted(glob.glob(os.path.join(analysis_dir, "*", "csv", "*.csv")))]
+
+
+def run_signature(run_dir):
+  # Modification times of everything indexed from a run, a run whose signature changed is indexed again
+  paths = [os.path.join(run_dir, name) for name in ["versions.json", "report.txt", "monitor_data.csv",
+           "cluster_transitions.csv"]]
+  paths.extend(glob.glob(os.path.join(run_dir, "*", "graphs.json")))
+  paths.extend(glob.glob(os.path.join(run_dir, "*", "*", "csv")))
+  return ",".join("{}:{}".format(os.path.basename(os.path.dirname(p)) + "/" + os.path.basename(p),
+                  int(os.path.getmtime(p))) for p in sorted(paths) if os.path.exists(p))
+
+
+def find_runs(results_directory):
+  runs = []
+  for run_dir in sorted(glob.glob(os.path.join(results_directory, "*"))):
+    if os.path.isdir(run_dir) and (os.path.exists(os.path.join(run_dir, "report.txt")) or
+                                   os.path.exists(os.path.join(run_dir, "versions.json"))):
+      runs.append(run_dir)
+  return runs
+
+
+def percentile_row(values):
+  if len(values) == 0:
+    return 0, None, None, None, None
+  return (len(values), float(np.percentile(values, 50)), float(np.percentile(values, 95)),
+          float(np.percentile(values, 99)), float(np.max(values)))
+
+
+def index_run(db, run_dir):
+  run = os.path.basename(run_dir)
+  for table in run_tables:
+    db.execute("DELETE FROM {} WHERE run = ?".format(table), (run,))
+
+  versions = {}
+  versions_file = os.path.join(run_dir, "versions.json")
+  if os.path.exists(versions_file):
+    with open(versions_file, "r") as v_file:
+      versions = json.load(v_file)
+
+  start_ts = None
+  end_ts = None
+  report_file = os.path.join(run_dir, "report.txt")
+  if os.path.exists(report_file):
+    with open(report_file, "r") as r_file:
+      for line in r_file:
+        m = time_re.search(line)
+        if m:
+          if m.group(1) == "Start":
+            start_ts = to_ts(m.group(2))
+          else:
+            end_ts = to_ts(m.group(2))
+        m = phase_re.search(line)
+        if m:
+          db.execute("INSERT INTO phases VALUES (?, ?, ?, ?, ?)",
+                     (run, int(m.group(1)), m.group(2), to_ts(m.group(3)), to_ts(m.group(4))))
+
+  db.execute("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+             [run, os.path.abspath(run_dir), run_signature(run_dir), start_ts, end_ts] +
+             [versions.get(key) for key in version_keys])
+
+  # Final and peak value of each monitor counter
+  md_csv_file = os.path.join(run_dir, "monitor_data.csv")
+  if os.path.exists(md_csv_file):
+    df = read_results(md_csv_file)
+    if len(df) > 0:
+      counters = df.drop(columns=["date"]).select_dtypes("number")
+      db.executemany("INSERT INTO monitor VALUES (?, ?, ?, ?)",
+                     [(run, column, float(counters[column].iloc[-1]), float(counters[column].max()))
+                      for column in counters.columns])
+
+  # Seconds from applied until each later state per cluster
+  ct_csv_file = os.path.join(run_dir, "cluster_transitions.csv")
+  if os.path.exists(ct_csv_file):
+    df = read_results(ct_csv_file, ["timestamp"])
+    if len(df) > 0:
+      ts = df.pivot_table(index="cluster", columns="state", values="timestamp", aggfunc="min")
+      if "applied" in ts.columns:
+        for state in ts.columns:
+          if state == "applied":
+            continue
+          latencies = (ts[state] - ts["applied"]).dt.total_seconds().dropna().values
+          db.execute("INSERT INTO transitions VALUES (?, ?, ?, ?, ?, ?, ?)", (run, state) + percentile_row(latencies))
+
+  # Prometheus analyses, each series column summed per sample before taking stats
+  analysis_dirs = set(os.path.dirname(path) for path in glob.glob(os.path.join(run_dir, "*", "graphs.json")))
+  analysis_dirs.update(os.path.dirname(os.path.dirname(path)) for path in glob.glob(os.path.join(run_dir, "*", "*", "csv")))
+  for analysis_dir in sorted(analysis_dirs):
+    m = analysis_re.match(os.path.basename(analysis_dir))
+    analysis = m.group(1) if m else os.path.basename(analysis_dir)
+    rows = []
+    for section, fname, csv_file in analysis_csvs(analysis_dir):
+      if not os.path.exists(csv_file):
+        continue
+      df = read_results(csv_file, index_col=0)
+      series = df.drop(columns=["datetime"], errors="ignore").select_dtypes("number")
+      if len(series.columns) == 0:
+        continue
+      total = series.sum(axis=1, min_count=1).dropna()
+      if len(total) == 0:
+        continue
+      rows.append((run, analysis, section, fname, len(series.columns), float(total.mean()),
+                   float(np.percentile(total, 95)), float(total.max())))
+    db.executemany("INSERT INTO prometheus VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def update_index(db, results_directory):
+  indexed = {row[0]: row[1] for row in db.execute("SELECT run, signature FROM runs")}
+  updated = 0
+  for run_dir in find_runs(results_directory):
+    run = os.path.basename(run_dir)
+    if indexed.get(run) == run_signature(run_dir):
+      continue
+    logger.info("Indexing {}".format(run_dir))
+    index_run(db, run_dir)
+    db.commit()
+    updated += 1
+  logger.info("Indexed {} new or changed runs, {} runs in index".format(
+      updated, db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]))
+
+
+def select_runs(db, runs, last):
+  if len(runs) > 0:
+    return runs
+  rows = db.execute("SELECT run FROM runs ORDER BY start_ts IS NULL, start_ts DESC, run DESC LIMIT ?", (last,))
+  return [row[0] for row in rows][::-1]
+
+
+def metric_value(db, run, metric, stat):
+  # Metric is monitor:<counter>, transition:<state> or prometheus:<analysis>/<section>/<name>
+  kind, _, name = metric.partition(":")
+  if kind == "monitor":
+    column = "peak" if stat == "max" else "final"
+    row = db.execute("SELECT {} FROM monitor WHERE run = ? AND metric = ?".format(column), (run, name)).fetchone()
+  elif kind == "transition":
+    column = stat if stat in ["p50", "p95", "p99", "max", "count"] else "p95"
+    row = db.execute("SELECT {} FROM transitions WHERE run = ? AND state = ?".format(column), (run, name)).fetchone()
+  elif kind == "prometheus":
+    analysis, section, fname = name.split("/")
+    column = stat if stat in ["mean", "p95", "max", "series"] else "mean"
+    row = db.execute("SELECT {} FROM prometheus WHERE run = ? AND analysis = ? AND section = ? AND name = ?".format(
+        column), (run, analysis, section, fname)).fetchone()
+  else:
+    logger.error("Unknown metric kind: {}".format(metric))
+    sys.exit(1)
+  if row is None or row[0] is None:
+    return ""
+  return round(row[0], 3)
+
+
+def main():
+  start_time = time.time()
+
+  parser = argparse.ArgumentParser(
+      description="Index acm-deploy-load results into a SQLite catalog and query or compare runs",
+      prog="results-index.py", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser.add_argument("-r", "--results-directory", type=str, default="results",
+                      help="Directory holding one results directory per run")
+  parser.add_argument("--db", type=str, default="", help="Index database, defaults to index.db in results directory")
+  parser.add_argument("--no-update", action="store_true", default=False,
+                      help="Query the index as is without scanning for new runs")
+
+  subparsers = parser.add_subparsers(dest="action")
+  subparsers.add_parser("update", help="Index new or changed runs", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser_runs = subparsers.add_parser("runs", help="List indexed runs with versions and phases",
+                                      formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser_trend = subparsers.add_parser("trend", help="Show metrics across runs",
+                                       formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser_compare = subparsers.add_parser("compare", help="Compare every indexed metric across runs side by side",
+                                         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+  parser_sql = subparsers.add_parser("sql", help="Run a SQL query against the index",
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+  parser_runs.add_argument("-l", "--last", type=int, default=30, help="Number of most recent runs")
+  parser_trend.add_argument("-l", "--last", type=int, default=30, help="Number of most recent runs")
+  parser_trend.add_argument("--runs", nargs="*", default=[], help="Runs to show instead of the most recent")
+  parser_trend.add_argument("-m", "--metric", action="append", default=[],
+                            help="monitor:<counter>, transition:<state> or prometheus:<analysis>/<section>/<name>")
+  parser_trend.add_argument("-s", "--stat", type=str, default="p95",
+                            help="Statistic, transitions: count/p50/p95/p99/max, prometheus: mean/p95/max/series, "
+                            "monitor: max for peak otherwise final")
+  parser_compare.add_argument("runs", nargs="+", help="Runs to compare")
+  parser_compare.add_argument("-a", "--analysis", type=str, default="",
+                              help="Only compare prometheus results of this analysis, ex phase2-cluster-deployment")
+  parser_compare.add_argument("-s", "--stat", type=str, default="p95", help="Statistic as with trend")
+  parser_sql.add_argument("query", type=str, help="SQL query, tables: " + ", ".join(run_tables))
+
+  parser.set_defaults(action="update")
+  cliargs = parser.parse_args()
+
+  db_file = cliargs.db
+  if db_file == "":
+    db_file = os.path.join(cliargs.results_directory, "index.db")
+  db = sqlite3.connect(db_file)
+  for statement in schema:
+    db.execute(statement)
+
+  if not cliargs.no_update:
+    update_index(db, cliargs.results_directory)
+
+  if cliargs.action == "runs":
+    tab = PrettyTable(["run", "start", "acm", "hub ocp", "deployed ocp", "installed", "p95 install (s)", "phases"])
+    for run in select_runs(db, [], cliargs.last):
+      row = db.execute("SELECT start_ts, acm_version, hub_version, deploy_version FROM runs WHERE run = ?",
+                       (run,)).fetchone()
+      start = datetime.fromtimestamp(row[0], tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ") if row[0] else ""
+      phases = " ".join("{}:{}s".format(p[0], round(p[1])) for p in db.execute(
+          "SELECT phase, end_ts - start_ts FROM phases WHERE run = ? ORDER BY phase", (run,)))
+      tab.add_row([run, start, row[1], row[2], row[3], metric_value(db, run, "monitor:cluster_install_completed", ""),
+                   metric_value(db, run, "transition:completed", "p95"), phases])
+    print(tab)
+  elif cliargs.action == "trend":
+    if len(cliargs.metric) == 0:
+      logger.error("Set at least one --metric")
+      sys.exit(1)
+    tab = PrettyTable(["run"] + cliargs.metric)
+    for run in select_runs(db, cliargs.runs, cliargs.last):
+      tab.add_row([run] + [metric_value(db, run, metric, cliargs.stat) for metric in cliargs.metric])
+    print(tab)
+  elif cliargs.action == "compare":
+    runs = cliargs.runs
+    placeholders = ",".join("?" * len(runs))
+    missing = set(runs) - set(row[0] for row in db.execute(
+        "SELECT run FROM runs WHERE run IN ({})".format(placeholders), runs))
+    if len(missing) > 0:
+      logger.error("Runs not in index: {}".format(", ".join(sorted(missing))))
+      sys.exit(1)
+    metrics = ["monitor:{}".format(row[0]) for row in db.execute(
+        "SELECT DISTINCT metric FROM monitor WHERE run IN ({}) ORDER BY rowid".format(placeholders), runs)]
+    metrics.extend("transition:{}".format(row[0]) for row in db.execute(
+        "SELECT DISTINCT state FROM transitions WHERE run IN ({}) ORDER BY rowid".format(placeholders), runs))
+    metrics.extend("prometheus:{}/{}/{}".format(*row) for row in db.execute(
+        "SELECT DISTINCT analysis, section, name FROM prometheus WHERE run IN ({}) AND analysis LIKE ? "
+        "ORDER BY analysis, section, name".format(placeholders), runs + [cliargs.analysis or "%"]))
+    tab = PrettyTable(["metric"] + runs)
+    tab.align["metric"] = "l"
+    for phase in db.execute("SELECT DISTINCT phase, label FROM phases WHERE run IN ({}) ORDER BY phase".format(
+        placeholders), runs).fetchall():
+      durations = {row[0]: round(row[1]) for row in db.execute(
+          "SELECT run, end_ts - start_ts FROM phases WHERE phase = ? AND run IN ({})".format(placeholders),
+          [phase[0]] + runs)}
+      tab.add_row(["phase {} {} (s)".format(*phase)] + [durations.get(run, "") for run in runs])
+    for metric in metrics:
+      tab.add_row([metric] + [metric_value(db, run, metric, cliargs.stat) for run in runs])
+    print(tab)
+  elif cliargs.action == "sql":
+    cursor = db.execute(cliargs.query)
+    tab = PrettyTable([column[0] for column in cursor.description])
+    for row in cursor:
+      tab.add_row(row)
+    print(tab)
+  db.close()
+
+  end_time = time.time()
+  logger.info("Took {}s".format(round(end_time - start_time, 1)))
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -13,9 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from utils.command import command
+from utils.kube import get_client
 import base64
-import json
 import logging
 import time
 import sys
@@ -28,13 +27,12 @@ def detect_aap_instance(kubeconfig, dry_run=False):
   if dry_run:
     logger.info("Dry-run: assuming AAP instance exists")
     return True
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "ansibleautomationplatform",
-      "-n", "ansible-automation-platform", "-o", "jsonpath={.items[0].metadata.name}"]
-  rc, output = command(oc_cmd, False, no_log=True)
-  if rc != 0 or not output.strip():
+  rc, aap_data = get_client(kubeconfig).list("aap.ansible.com/v1alpha1", "ansibleautomationplatforms",
+      "ansible-automation-platform")
+  if rc != 0 or len(aap_data["items"]) == 0:
     logger.info("No AnsibleAutomationPlatform instance found")
     return False
-  logger.info("AnsibleAutomationPlatform instance found: {}".format(output.strip()))
+  logger.info("AnsibleAutomationPlatform instance found: {}".format(aap_data["items"][0]["metadata"]["name"]))
   return True
 
 
@@ -43,12 +41,11 @@ def get_aap_version(kubeconfig, dry_run=False):
   if dry_run:
     logger.info("Dry-run: assuming AAP installed")
     return "aap-operator (dry-run)"
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "csv", "-n", "ansible-automation-platform", "-o", "json"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  rc, csv_data = get_client(kubeconfig).list("operators.coreos.com/v1alpha1", "clusterserviceversions",
+      "ansible-automation-platform")
   if rc != 0:
     logger.warning("AnsibleAutomationPlatform CSV lookup failed (rc: {}), assuming not installed".format(rc))
     return ""
-  csv_data = json.loads(output)
   for item in csv_data.get("items", []):
     name = item.get("metadata", {}).get("name", "")
     if name.startswith("aap-operator"):
@@ -125,13 +122,11 @@ def get_mce_version(kubeconfig, dry_run=False):
   logger.info("Getting MultiClusterEngine version")
   if dry_run:
     return "mce (dry-run)"
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "multiclusterengine", "multiclusterengine",
-      "-o", "jsonpath={.status.currentVersion}"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  rc, mce_data = get_client(kubeconfig).get("multicluster.openshift.io/v1", "multiclusterengines", "multiclusterengine")
   if rc != 0:
     logger.warning("MultiClusterEngine not found (rc: {})".format(rc))
     return ""
-  version = output.strip()
+  version = mce_data.get("status", {}).get("currentVersion", "")
   logger.info("MultiClusterEngine version: {}".format(version))
   return version
 
@@ -140,25 +135,22 @@ def get_mch_version(kubeconfig, dry_run=False):
   logger.info("Getting MultiClusterHub version")
   if dry_run:
     return "mch (dry-run)"
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "multiclusterhub", "multiclusterhub",
-      "-n", "open-cluster-management", "-o", "jsonpath={.status.currentVersion}"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  rc, mch_data = get_client(kubeconfig).get("operator.open-cluster-management.io/v1", "multiclusterhubs",
+      "multiclusterhub", "open-cluster-management")
   if rc != 0:
     logger.warning("MultiClusterHub not found (rc: {}), ACM may not be installed".format(rc))
     return ""
-  version = output.strip()
+  version = mch_data.get("status", {}).get("currentVersion", "")
   logger.info("MultiClusterHub version: {}".format(version))
   return version
 
 
 def get_ocp_namespace_list(kubeconfig):
   logger.info("Getting OCP namespace list")
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "namespace", "-o", "json"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  rc, namespace_data = get_client(kubeconfig).list("v1", "namespaces")
   if rc != 0:
-    logger.error("oc get namespace rc: {}".format(rc))
+    logger.error("List namespaces rc: {}".format(rc))
     sys.exit(1)
-  namespace_data = json.loads(output)
   namespaces = [item["metadata"]["name"] for item in namespace_data["items"]]
   return namespaces
 
@@ -166,12 +158,10 @@ def get_ocp_namespace_list(kubeconfig):
 def get_ocp_version(kubeconfig):
   logger.info("Getting OCP version")
   version = {}
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "clusterversion", "version", "-o", "json"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  rc, cv_data = get_client(kubeconfig).get("config.openshift.io/v1", "clusterversions", "version")
   if rc != 0:
-    logger.error("oc get clusterversion version rc: {}".format(rc))
+    logger.error("Get clusterversion version rc: {}".format(rc))
     sys.exit(1)
-  cv_data = json.loads(output)
 
   # Prefer the first Completed entry in history; fall back to desired
   version_string = ""
@@ -199,20 +189,19 @@ def get_prometheus_token(kubeconfig, ocp_version):
   if ocp_version["major"] == 4 and ocp_version["minor"] > 10:
     # 4.11 requires us to create the token instead of find it in a secret
     # --duration=24h could be passed to get a token for longer duration
-    oc_cmd = ["oc", "--kubeconfig", kubeconfig, "create", "token", "prometheus-k8s", "-n", "openshift-monitoring"]
-    rc, output = command(oc_cmd, False, no_log=True)
+    token_request = {"apiVersion": "authentication.k8s.io/v1", "kind": "TokenRequest", "spec": {}}
+    rc, token_data = get_client(kubeconfig).create("v1", "serviceaccounts", token_request, "openshift-monitoring",
+        "prometheus-k8s", "token")
     if rc != 0:
-      logger.error("oc create token prometheus-k8s -n openshift-monitoring rc: {}".format(rc))
-      output = ""
-    return output
+      logger.error("Create token prometheus-k8s -n openshift-monitoring rc: {}".format(rc))
+      return ""
+    return token_data["status"]["token"]
   elif ocp_version["major"] == 4 and ocp_version["minor"] <= 10:
     # 4.10 and below the token is located in a secret
-    oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "serviceaccount", "prometheus-k8s", "-n", "openshift-monitoring", "-o", "json"]
-    rc, output = command(oc_cmd, False, no_log=True)
+    rc, prom_sa_data = get_client(kubeconfig).get("v1", "serviceaccounts", "prometheus-k8s", "openshift-monitoring")
     if rc != 0:
-      logger.error("oc get serviceaccount prometheus-k8s -n openshift-monitoring rc: {}".format(rc))
+      logger.error("Get serviceaccount prometheus-k8s -n openshift-monitoring rc: {}".format(rc))
       return ""
-    prom_sa_data = json.loads(output)
 
     for secret_name in prom_sa_data["secrets"]:
       if "token" in secret_name["name"]:
@@ -223,12 +212,10 @@ def get_prometheus_token(kubeconfig, ocp_version):
       logger.error("Unable to identify prometheus token name")
       return ""
 
-    oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "secret", prom_token_name, "-n", "openshift-monitoring", "-o", "json"]
-    rc, output = command(oc_cmd, False, no_log=True)
+    rc, prom_secret_data = get_client(kubeconfig).get("v1", "secrets", prom_token_name, "openshift-monitoring")
     if rc != 0:
-      logger.error("oc get secret {} -n openshift-monitoring rc: {}".format(prom_token_name, rc))
+      logger.error("Get secret {} -n openshift-monitoring rc: {}".format(prom_token_name, rc))
       return ""
-    prom_secret_data = json.loads(output)
 
     token = (base64.b64decode(prom_secret_data["data"]["token"])).decode("utf-8")
     if token == "":
@@ -238,23 +225,28 @@ def get_prometheus_token(kubeconfig, ocp_version):
 
 
 def get_thanos_querier_route(kubeconfig):
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "route", "thanos-querier", "-n", "openshift-monitoring", "-o", "jsonpath={.spec.host}"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  rc, route_data = get_client(kubeconfig).get("route.openshift.io/v1", "routes", "thanos-querier", "openshift-monitoring")
   if rc != 0:
-    logger.error("oc get route thanos-querier -n openshift-monitoring rc: {}".format(rc))
+    logger.error("Get route thanos-querier -n openshift-monitoring rc: {}".format(rc))
     return ""
 
-  if "thanos-querier" in output:
-    return "https://{}".format(output)
+  host = route_data.get("spec", {}).get("host", "")
+  if "thanos-querier" in host:
+    return "https://{}".format(host)
   else:
     logger.error("Failed to find route for thanos-querier")
     return ""
 
 
 def validate_kubeconfig(kubeconfig):
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "whoami"]
-  rc, output = command(oc_cmd, False, no_log=True)
+  try:
+    client = get_client(kubeconfig)
+  except Exception as e:
+    # Unreadable or malformed kubeconfigs and failed exec credential plugins or unsupported auth-providers
+    logger.error("Kubeconfig validation failed ({}): {}".format(e, kubeconfig))
+    sys.exit(1)
+  rc, user_data = client.get("user.openshift.io/v1", "users", "~")
   if rc != 0:
-    logger.error("Kubeconfig validation failed (oc whoami rc: {}): {}".format(rc, kubeconfig))
+    logger.error("Kubeconfig validation failed (whoami rc: {}): {}".format(rc, kubeconfig))
     sys.exit(1)
-  logger.info("Kubeconfig validated, connected as: {}".format(output.strip()))
+  logger.info("Kubeconfig validated, connected as: {}".format(user_data["metadata"]["name"]))
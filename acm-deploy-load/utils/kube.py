@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Kubernetes API client that reads a kubeconfig once and reuses a pooled HTTPS session per cluster.
+# Helpers follow the command() convention and return (rc, data) where rc 0 is success, otherwise the
+# HTTP status code or 1 when the API server could not be reached.
+
+import atexit
+import base64
+from datetime import datetime
+import json
+import logging
+import os
+import requests
+from requests.adapters import HTTPAdapter
+import subprocess
+import tempfile
+from threading import Lock
+import time
+import urllib3
+import yaml
+
+logger = logging.getLogger("acm-deploy-load")
+
+# Number of pooled connections kept per cluster
+pool_maxsize = 32
+
+# Seconds to wait on the API server for a non-watch request
+request_timeout = 120
+
+# Seconds an exec credential plugin may run, and how long before its credential expires it is run again
+exec_timeout = 60
+exec_refresh_seconds = 60
+
+# Objects requested per page when listing, bounds memory by page size instead of collection size
+list_limit = 500
+
+# Accept headers asking the API server to project objects instead of returning them whole, a server that
+# can not project falls back to full objects. Metadata projection returns only object metadata, table
+# projection returns the printer columns of each object alongside its metadata.
+list_projections = {
+  "metadata": "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json",
+  "table": "application/json;as=Table;g=meta.k8s.io;v=v1,application/json"
+}
+watch_projections = {
+  "metadata": "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json",
+  "table": "application/json;as=Table;g=meta.k8s.io;v=v1,application/json"
+}
+
+_clients = {}
+_clients_lock = Lock()
+_temp_files = []
+
+
+@atexit.register
+def _remove_temp_files():
+  for temp_file in _temp_files:
+    if os.path.isfile(temp_file):
+      os.remove(temp_file)
+
+
+def _data_file(data, decode=True):
+  # requests only accepts certificates and keys as file paths, kubeconfig data is base64 and exec credentials are PEM
+  with tempfile.NamedTemporaryFile(mode="wb", prefix="kube-", delete=False) as temp_file:
+    temp_file.write(base64.b64decode(data) if decode else data.encode())
+  os.chmod(temp_file.name, 0o600)
+  _temp_files.append(temp_file.name)
+  return temp_file.name
+
+
+def default_kubeconfig():
+  # Same resolution as oc when --kubeconfig is not passed
+  if os.environ.get("KUBECONFIG", "") != "":
+    return os.environ["KUBECONFIG"].split(os.pathsep)[0]
+  return os.path.join(os.path.expanduser("~"), ".kube", "config")
+
+
+def get_client(kubeconfig=""):
+  """Return the shared client for a kubeconfig, creating it on first use."""
+  if kubeconfig == "":
+    kubeconfig = default_kubeconfig()
+  with _clients_lock:
+    if kubeconfig not in _clients:
+      _clients[kubeconfig] = KubeClient(kubeconfig)
+    return _clients[kubeconfig]
+
+
+def close_client(kubeconfig):
+  """Close and forget the client of a kubeconfig, used when visiting many clusters once each."""
+  with _clients_lock:
+    client = _clients.pop(kubeconfig, None)
+  if client is not None:
+    client.session.close()
+
+
+def table_items(table, column_names=None):
+  """Flatten Table rows into their metadata objects with the printed columns under "columns" by column name."""
+  if column_names is None:
+    column_names = [column["name"] for column in table.get("columnDefinitions", [])]
+  items = []
+  for row in table.get("rows") or []:
+    item = row.get("object") or {"metadata": {}}
+    item["columns"] = dict(zip(column_names, row["cells"]))
+    items.append(item)
+  return items
+
+
+def api_path(api_version, resource, namespace="", name="", subresource=""):
+  if "/" in api_version:
+    path = "/apis/{}".format(api_version)
+  else:
+    path = "/api/{}".format(api_version)
+  if namespace != "":
+    path = "{}/namespaces/{}".format(path, namespace)
+  path = "{}/{}".format(path, resource)
+  if name != "":
+    path = "{}/{}".format(path, name)
+  if subresource != "":
+    path = "{}/{}".format(path, subresource)
+  return path
+
+
+class KubeClient():
+  def __init__(self, kubeconfig):
+    self.kubeconfig = kubeconfig
+    with open(kubeconfig, "r") as kc_file:
+      kc_data = yaml.safe_load(kc_file)
+
+    context_name = kc_data.get("current-context", "")
+    contexts = {item["name"]: item["context"] for item in kc_data.get("contexts", [])}
+    clusters = {item["name"]: item["cluster"] for item in kc_data.get("clusters", [])}
+    users = {item["name"]: item["user"] for item in kc_data.get("users", [])}
+    if context_name not in contexts:
+      context_name = list(contexts)[0]
+    cluster = clusters[contexts[context_name]["cluster"]]
+    user = users.get(contexts[context_name].get("user", ""), {})
+
+    self.server = cluster["server"].rstrip("/")
+    self.session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    self.session.mount("https://", adapter)
+    self.session.mount("http://", adapter)
+
+    if cluster.get("insecure-skip-tls-verify", False):
+      self.session.verify = False
+      urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    elif "certificate-authority-data" in cluster:
+      self.session.verify = _data_file(cluster["certificate-authority-data"])
+    elif "certificate-authority" in cluster:
+      self.session.verify = cluster["certificate-authority"]
+
+    if "client-certificate-data" in user and "client-key-data" in user:
+      self.session.cert = (_data_file(user["client-certificate-data"]), _data_file(user["client-key-data"]))
+    elif "client-certificate" in user and "client-key" in user:
+      self.session.cert = (user["client-certificate"], user["client-key"])
+    if "token" in user:
+      self.session.headers["Authorization"] = "Bearer {}".format(user["token"])
+    elif "tokenFile" in user:
+      with open(user["tokenFile"], "r") as token_file:
+        self.session.headers["Authorization"] = "Bearer {}".format(token_file.read().strip())
+
+    # Exec credential plugins are run now and again before their credential expires or after a 401, the
+    # credential generation lets concurrent 401s share one run
+    self.exec_config = user.get("exec")
+    self.exec_cluster = cluster
+    self.credential_expiry = None
+    self.credential_generation = 0
+    self.credential_lock = Lock()
+    if self.exec_config is not None:
+      self._refresh_credential(self.credential_generation)
+    elif "auth-provider" in user:
+      provider = user["auth-provider"]
+      if provider.get("name") == "oidc" and provider.get("config", {}).get("id-token", "") != "":
+        self.session.headers["Authorization"] = "Bearer {}".format(provider["config"]["id-token"])
+      else:
+        raise ValueError("Kubeconfig {} auth-provider {} is not supported, use a token, client certificate or exec "
+            "credentials".format(kubeconfig, provider.get("name", "")))
+
+    self.resources = {}
+    self.resources_lock = Lock()
+    logger.debug("Kube client for {} connecting to {}".format(kubeconfig, self.server))
+
+  def _exec_credential(self):
+    # Runs the exec credential plugin as oc does and returns the status of the ExecCredential it prints
+    command = os.path.expanduser(self.exec_config["command"])
+    if os.sep in command and not os.path.isabs(command):
+      command = os.path.join(os.path.dirname(os.path.abspath(self.kubeconfig)), command)
+    exec_info = {"apiVersion": self.exec_config["apiVersion"], "kind": "ExecCredential", "spec": {"interactive": False}}
+    if self.exec_config.get("provideClusterInfo", False):
+      exec_info["spec"]["cluster"] = {key: self.exec_cluster[key] for key in
+          ("server", "certificate-authority-data", "insecure-skip-tls-verify") if key in self.exec_cluster}
+    env = dict(os.environ)
+    for item in self.exec_config.get("env") or []:
+      env[item["name"]] = item["value"]
+    env["KUBERNETES_EXEC_INFO"] = json.dumps(exec_info)
+    try:
+      process = subprocess.run([command] + (self.exec_config.get("args") or []), env=env, stdout=subprocess.PIPE,
+          stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, universal_newlines=True, timeout=exec_timeout)
+    except (OSError, subprocess.TimeoutExpired) as e:
+      raise RuntimeError("Kubeconfig {} exec credential plugin {} failed: {}".format(self.kubeconfig, command, e))
+    if process.returncode != 0:
+      raise RuntimeError("Kubeconfig {} exec credential plugin {} rc: {} {}".format(
+          self.kubeconfig, command, process.returncode, process.stderr.strip()))
+    try:
+      return json.loads(process.stdout)["status"]
+    except (ValueError, KeyError) as e:
+      raise RuntimeError("Kubeconfig {} exec credential plugin {} returned no ExecCredential status: {}".format(
+          self.kubeconfig, command, e))
+
+  def _refresh_credential(self, generation):
+    # Runs the exec credential plugin unless another thread already refreshed the credential
+    with self.credential_lock:
+      if generation != self.credential_generation:
+        return
+      status = self._exec_credential()
+      if status.get("token", "") != "":
+        self.session.headers["Authorization"] = "Bearer {}".format(status["token"])
+      if status.get("clientCertificateData", "") != "" and status.get("clientKeyData", "") != "":
+        self.session.cert = (_data_file(status["clientCertificateData"], decode=False),
+            _data_file(status["clientKeyData"], decode=False))
+      self.credential_expiry = None
+      if status.get("expirationTimestamp", "") != "":
+        self.credential_expiry = datetime.fromisoformat(status["expirationTimestamp"].replace("Z", "+00:00")).timestamp()
+      self.credential_generation += 1
+      logger.debug("Kubeconfig {} exec credential refreshed, expires {}".format(
+          self.kubeconfig, status.get("expirationTimestamp", "never")))
+
+  def request(self, method, path, params=None, body=None, headers=None, retries=1, retry_backoff=True, stream=False,
+      timeout=request_timeout):
+    if self.exec_config is None:
+      return self._send(method, path, params, body, headers, retries, retry_backoff, stream, timeout)
+    generation = self.credential_generation
+    if self.credential_expiry is not None and time.time() >= self.credential_expiry - exec_refresh_seconds:
+      try:
+        self._refresh_credential(generation)
+      except RuntimeError as e:
+        logger.error(e)
+      generation = self.credential_generation
+    rc, response = self._send(method, path, params, body, headers, retries, retry_backoff, stream, timeout)
+    if rc == 401:
+      # The exec credential was revoked or expired early, run the plugin again and retry once
+      try:
+        self._refresh_credential(generation)
+      except RuntimeError as e:
+        logger.error(e)
+        return rc, response
+      response.close()
+      rc, response = self._send(method, path, params, body, headers, retries, retry_backoff, stream, timeout)
+    return rc, response
+
+  def _send(self, method, path, params, body, headers, retries, retry_backoff, stream, timeout):
+    tries = 1
+    while tries <= retries:
+      if tries > 1 and retry_backoff:
+        time.sleep(1 * (tries - 1))
+      logger.debug("Request({}): {} {}{}".format(tries, method, self.server, path))
+      try:
+        response = self.session.request(method, "{}{}".format(self.server, path), params=params, data=body,
+            headers=headers, stream=stream, timeout=timeout)
+      except requests.exceptions.RequestException as e:
+        logger.warning("Request({}): {} {} failed: {}".format(tries, method, path, e))
+        response = None
+      tries += 1
+      if response is not None and (response.status_code < 500 or tries > retries):
+        break
+    if response is None:
+      return 1, None
+    if response.status_code >= 300:
+      logger.debug("Request: {} {} status: {} {}".format(method, path, response.status_code, response.text[:2500]))
+      return response.status_code, response
+    return 0, response
+
+  def _json(self, rc, response):
+    if rc != 0 or response is None:
+      return rc, {}
+    try:
+      return 0, response.json()
+    except ValueError:
+      logger.warning("Kube JSONDecodeError: {}".format(response.text[:2500]))
+      return 1, {}
+
+  def get(self, api_version, resource, name, namespace="", subresource="", retries=1, dry_run=False,
+      timeout=request_timeout):
+    path = api_path(api_version, resource, namespace, name, subresource)
+    if dry_run:
+      logger.info("Dry-run: GET {}".format(path))
+      return 0, {}
+    return self._json(*self.request("GET", path, retries=retries, timeout=timeout))
+
+  def list_pages(self, api_version, resource, namespace="", label_selector="", field_selector="", limit=list_limit,
+      retries=1, dry_run=False, projection="", timeout=request_timeout):
+    """Yield (rc, page) for each page of a list, a failed page is yielded with its rc and ends the list.
+
+    With a projection the page items are the projected objects, table rows are flattened by table_items().
+    """
+    path = api_path(api_version, resource, namespace)
+    if dry_run:
+      logger.info("Dry-run: GET {}".format(path))
+      yield 0, {"metadata": {}, "items": []}
+      return
+    params = {"limit": str(limit)}
+    if label_selector != "":
+      params["labelSelector"] = label_selector
+    if field_selector != "":
+      params["fieldSelector"] = field_selector
+    headers = None
+    if projection != "":
+      headers = {"Accept": list_projections[projection]}
+      if projection == "table":
+        params["includeObject"] = "Metadata"
+    while True:
+      rc, response = self.request("GET", path, params=params, headers=headers, retries=retries, timeout=timeout)
+      if rc == 410 and "continue" in params:
+        # The continue token expired, resume from the inconsistent continue token the server offers if any
+        rc, status = self._json(0, response)
+        if status.get("metadata", {}).get("continue", "") != "":
+          logger.warning("List {} continue token expired, continuing from an inconsistent snapshot".format(resource))
+          params["continue"] = status["metadata"]["continue"]
+          continue
+        rc = 410
+      rc, page = self._json(rc, response)
+      if rc != 0:
+        yield rc, page
+        return
+      if page.get("kind") == "Table":
+        page["items"] = table_items(page)
+      yield 0, page
+      if page.get("metadata", {}).get("continue", "") == "":
+        return
+      params["continue"] = page["metadata"]["continue"]
+
+  def list(self, api_version, resource, namespace="", label_selector="", field_selector="", retries=1, dry_run=False,
+      timeout=request_timeout):
+    """Return the whole list in one document, fetched in pages."""
+    list_data = {"metadata": {}, "items": []}
+    for rc, page in self.list_pages(api_version, resource, namespace, label_selector, field_selector,
+        retries=retries, dry_run=dry_run, timeout=timeout):
+      if rc != 0:
+        return rc, {}
+      list_data["metadata"] = page.get("metadata", {})
+      list_data["items"].extend(page["items"])
+    return 0, list_data
+
+  def write_list(self, list_file, api_version, resource, namespace="", label_selector="", retries=1):
+    """Write a list to a file as {"items": [...]} one page at a time, returns rc."""
+    with open(list_file, "w") as l_file:
+      l_file.write("{\"items\": [")
+      first = True
+      for rc, page in self.list_pages(api_version, resource, namespace, label_selector, retries=retries):
+        if rc != 0:
+          return rc
+        for item in page["items"]:
+          if not first:
+            l_file.write(",")
+          l_file.write(json.dumps(item))
+          first = False
+      l_file.write("]}\n")
+    return 0
+
+  def create(self, api_version, resource, body, namespace="", name="", subresource="", retries=1, dry_run=False):
+    path = api_path(api_version, resource, namespace, name, subresource)
+    if dry_run:
+      logger.info("Dry-run: POST {}".format(path))
+      return 0, {}
+    return self._json(*self.request("POST", path, body=json.dumps(body),
+        headers={"Content-Type": "application/json"}, retries=retries))
+
+  def resource_for(self, api_version, kind):
+    # Resolves a kind to its plural resource name and scope through API discovery, cached per group version
+    with self.resources_lock:
+      # A kind missing from the cache may belong to a CRD established since, so discovery is repeated once
+      if api_version not in self.resources or kind not in self.resources[api_version]:
+        rc, discovery = self._json(*self.request("GET", api_path(api_version, "").rstrip("/"), retries=3))
+        if rc != 0:
+          return "", False
+        self.resources[api_version] = {}
+        for item in discovery.get("resources", []):
+          if "/" not in item["name"]:
+            self.resources[api_version][item["kind"]] = (item["name"], item["namespaced"])
+      return self.resources[api_version].get(kind, ("", False))
+
+  def apply(self, manifest, field_manager="acm-deploy-load", force=True, retries=1, dry_run=False):
+    """Server-side apply a single object."""
+    resource, namespaced = self.resource_for(manifest["apiVersion"], manifest["kind"])
+    if resource == "":
+      logger.error("Unable to resolve resource for {} {}".format(manifest["apiVersion"], manifest["kind"]))
+      return 1, {}
+    namespace = manifest["metadata"].get("namespace", "default") if namespaced else ""
+    path = api_path(manifest["apiVersion"], resource, namespace, manifest["metadata"]["name"])
+    if dry_run:
+      logger.info("Dry-run: PATCH {}".format(path))
+      return 0, {}
+    params = {"fieldManager": field_manager, "force": "true" if force else "false"}
+    return self._json(*self.request("PATCH", path, params=params, body=json.dumps(manifest),
+        headers={"Content-Type": "application/apply-patch+yaml"}, retries=retries))
+
+  def apply_file(self, manifest_file, field_manager="acm-deploy-load", retries=1, dry_run=False):
+    """Server-side apply every object in a (multi-document) yaml file."""
+    with open(manifest_file, "r") as m_file:
+      manifests = [manifest for manifest in yaml.safe_load_all(m_file) if manifest]
+    for manifest in manifests:
+      rc, _ = self.apply(manifest, field_manager, retries=retries, dry_run=dry_run)
+      if rc != 0:
+        logger.error("Apply {} {}/{} from {} rc: {}".format(manifest["kind"], manifest["metadata"].get("namespace", ""),
+            manifest["metadata"]["name"], manifest_file, rc))
+        return rc
+    return 0
+
+  def watch(self, api_version, resource, namespace="", resource_version="", timeout_seconds=300, projection=""):
+    """Yield watch events, an ERROR event carries the failure code (410 requires a relist)."""
+    params = {"watch": "1", "allowWatchBookmarks": "true", "timeoutSeconds": str(timeout_seconds)}
+    if resource_version != "":
+      params["resourceVersion"] = resource_version
+    headers = None
+    if projection != "":
+      headers = {"Accept": watch_projections[projection]}
+      if projection == "table":
+        params["includeObject"] = "Metadata"
+    rc, response = self.request("GET", api_path(api_version, resource, namespace), params=params, headers=headers,
+        stream=True, timeout=(30, timeout_seconds + 30))
+    if rc != 0:
+      yield {"type": "ERROR", "object": {"code": rc}}
+      return
+    # Table events after the first may omit the column definitions
+    column_names = None
+    try:
+      for line in response.iter_lines():
+        if line:
+          event = json.loads(line)
+          if event["object"].get("kind") == "Table":
+            if event["object"].get("columnDefinitions"):
+              column_names = [column["name"] for column in event["object"]["columnDefinitions"]]
+            items = table_items(event["object"], column_names)
+            if len(items) > 0:
+              event["object"] = items[0]
+          yield event
+    except requests.exceptions.RequestException as e:
+      logger.warning("Watch {} interrupted: {}".format(resource, e))
+    finally:
+      response.close()
@@ -157,6 +157,9 @@ def generate_deploy_load_report(start_time, end_time, deploy_start_time, deploy_
           cliargs.batch, cliargs.interval, str(timedelta(seconds=cliargs.interval))))
       log_write(report, "   * Cluster range: {} to {}".format(cliargs.start, cliargs.end))
       log_write(report, "   * Clusters per ZTP argoCD application: {}".format(cliargs.clusters_per_app))
+      if "gitops" not in cliargs.method:
+        log_write(report, "   * Clusters applied concurrently: {}{}".format(
+            cliargs.apply_parallelism, " (server-side apply)" if cliargs.server_side_apply else ""))
       log_write(report, "   * Actual intervals: {}".format(total_intervals))
       if cliargs.skip_wait_install:
         log_write(report, "  * Skip waiting for cluster install completion")
@@ -185,6 +188,8 @@ def generate_deploy_load_report(start_time, end_time, deploy_start_time, deploy_
     log_write(report, " * Phase 3 / Soak Baseline (End delay): {}s :: {}".format(
         cliargs.end_delay, str(timedelta(seconds=cliargs.end_delay))))
     log_write(report, " * Monitor interval: {}s".format(cliargs.monitor_interval))
+    if cliargs.monitor_adaptive:
+      log_write(report, " * Monitor adaptive interval: {}s to {}s".format(cliargs.monitor_interval_min, cliargs.monitor_interval_max))
     if versions["wan_emulation"]:
       log_write(report, " * Wan Emulation: {}".format(versions["wan_emulation"]))
     log_write(report, "Workload Phases")
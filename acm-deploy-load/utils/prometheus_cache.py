@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import json
+import logging
+import numpy as np
+import os
+import tempfile
+from threading import Lock
+import time
+
+
+logger = logging.getLogger("acm-deploy-load")
+
+# Data this close to now may still be ingested by thanos, range queries ending later are not cached
+CACHE_SETTLE_SECONDS = 10 * 60
+
+# Eviction brings the cache down to this fraction of max_bytes, so it scans the directory again only after the writes
+# that follow have filled the difference
+CACHE_EVICT_TO = 0.9
+
+
+# Content addressed cache of decoded range query results. Each entry is a compressed npz file of timestamp and value
+# columns with the per series point counts and labels, named by the hash of (route, query, start, end, step). The cache
+# size is kept in memory and entries are evicted least recently used first once a write grows it past max_bytes.
+class QueryCache():
+  def __init__(self, directory, max_bytes, refresh=False):
+    self.directory = directory
+    self.max_bytes = max_bytes
+    self.refresh = refresh
+    self.lock = Lock()
+    self.hits = 0
+    self.misses = 0
+    if not os.path.exists(directory):
+      os.makedirs(directory)
+    self.size = sum(size for _, size, _ in self._entries())
+
+  def path(self, route, query, start_ts, end_ts, step):
+    key = json.dumps([route, query, start_ts, end_ts, step])
+    return os.path.join(self.directory, "{}.npz".format(hashlib.sha256(key.encode()).hexdigest()))
+
+  def get(self, route, query, start_ts, end_ts, step):
+    # Returns the cached series list or None, --refresh always misses so results are fetched and rewritten
+    path = self.path(route, query, start_ts, end_ts, step)
+    if self.refresh or not os.path.exists(path):
+      with self.lock:
+        self.misses += 1
+      return None
+    # Another fetch thread may evict the entry at any point, a vanished entry is a miss
+    try:
+      with np.load(path, allow_pickle=False) as entry:
+        points = np.stack([entry["timestamps"], entry["values"]], axis=1)
+        lengths = entry["lengths"]
+        labels = json.loads(str(entry["labels"]))
+    except FileNotFoundError:
+      with self.lock:
+        self.misses += 1
+      return None
+    except (OSError, ValueError, KeyError) as e:
+      logger.warning("Discarding unreadable cache entry {}: {}".format(path, e))
+      try:
+        os.remove(path)
+      except FileNotFoundError:
+        pass
+      with self.lock:
+        self.misses += 1
+      return None
+    # Touch the entry so eviction sees it as recently used, the series are already loaded if it was just evicted
+    try:
+      os.utime(path)
+    except FileNotFoundError:
+      pass
+    with self.lock:
+      self.hits += 1
+    return [{"metric": metric, "values": values} for metric, values in
+            zip(labels, np.split(points, np.cumsum(lengths)[:-1]))]
+
+  def put(self, route, query, start_ts, end_ts, step, series):
+    if end_ts > time.time() - CACHE_SETTLE_SECONDS:
+      return
+    path = self.path(route, query, start_ts, end_ts, step)
+    points = np.concatenate([s["values"] for s in series]) if series else np.empty((0, 2))
+    # Write to a temporary file and rename so concurrent readers never see a partial entry
+    fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as tmp_file:
+      np.savez_compressed(tmp_file, timestamps=points[:, 0], values=points[:, 1],
+                          lengths=np.array([len(s["values"]) for s in series], dtype=np.int64),
+                          labels=np.array(json.dumps([s["metric"] for s in series])))
+    size = os.path.getsize(tmp_path)
+    with self.lock:
+      try:
+        size -= os.path.getsize(path)
+      except FileNotFoundError:
+        pass
+      os.replace(tmp_path, path)
+      self.size += size
+      evict = self.size > self.max_bytes
+    if evict:
+      self.evict()
+
+  def _entries(self):
+    # (mtime, size, name) of every entry on disk
+    entries = []
+    for name in os.listdir(self.directory):
+      if not name.endswith(".npz"):
+        continue
+      try:
+        st = os.stat(os.path.join(self.directory, name))
+      except FileNotFoundError:
+        # Discarded by a concurrent get
+        continue
+      entries.append((st.st_mtime, st.st_size, name))
+    return entries
+
+  def evict(self):
+    # Rescans the directory, which also corrects the in-memory size for entries discarded or written by others
+    with self.lock:
+      entries = self._entries()
+      total = sum(size for _, size, _ in entries)
+      for _, size, name in sorted(entries):
+        if total <= self.max_bytes * CACHE_EVICT_TO:
+          break
+        try:
+          os.remove(os.path.join(self.directory, name))
+        except FileNotFoundError:
+          pass
+        total -= size
+      self.size = total
@@ -0,0 +1,952 @@
+#!/usr/bin/env python3
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Catalog of the prometheus queries analyze-prometheus runs, and the planner turning it into the requests of a run.
+#
+# Each section of the report lists its queries as query(name, PromQL, series label, title, unit). A query with a gate
+# only runs when the gate namespace is present, and each section is gated the same way in SECTIONS. $VARIABLES in the
+# PromQL are substituted at plan time with values only known at runtime (OCP version, TALM install).
+
+from collections import OrderedDict
+import logging
+import re
+
+logger = logging.getLogger("acm-deploy-load")
+
+
+def query(name, expr, series_label, title, unit, gate=None, resolution="1m"):
+  return {"name": name, "expr": expr, "series_label": series_label, "title": title, "unit": unit, "gate": gate,
+          "resolution": resolution}
+
+
+def namespace_selector(namespaces):
+  return "namespace=~'" + "|".join(namespaces) + "'"
+
+
+# Report sections in report order and the namespace gating each, None always queries the section. The talm gate is
+# present when TALM is detected in openshift-operators or its own namespace.
+SECTIONS = OrderedDict([
+  ("cluster", None),
+  ("node", None),
+  ("etcd", None),
+  ("resource", None),
+  ("base-ocp", None),
+  ("core-ocp", None),
+  # ACM + ACM related namespaces
+  ("acm-mce-complete", "open-cluster-management"),
+  ("acm-complete", "open-cluster-management"),
+  ("acm", "open-cluster-management"),
+  ("mce-complete", "multicluster-engine"),
+  ("mce", "multicluster-engine"),
+  # "Other" ACM Namespaces
+  ("acm-hub", "open-cluster-management-hub"),
+  ("acm-observability", "open-cluster-management-observability"),
+  ("acm-agent", "open-cluster-management-agent"),
+  # "Other" MCE Namespaces
+  ("hive", "hive"),
+  ("hypershift", "hypershift"),
+  ("hypershift-uwm", "hypershift"),
+  ("talm", "talm"),
+  ("gitops", "openshift-gitops-operator"),
+  ("lso", "openshift-local-storage"),
+  ("odf", "openshift-storage"),
+  ("adp", "openshift-adp"),
+  # Minio is a "workload" running on hub clusters to provide object storage for the cluster
+  ("minio", "minio"),
+  # Multi Cluster Global Hub Queries
+  ("mcgh", "multicluster-global-hub"),
+  # AAP Queries
+  ("aap", "ansible-automation-platform"),
+  # ACM with AAP without EDA (ZTP Day2 Automation)
+  ("ztp-day2", "ztp-day2-automation"),
+])
+
+ACM_AGENT_NAMESPACES = namespace_selector([
+  "open-cluster-management-addon-observability",
+  "open-cluster-management-agent",
+  "open-cluster-management-agent-addon"
+])
+ACM_COMPLETE_NAMESPACES = namespace_selector([
+  "open-cluster-management",
+  "open-cluster-management-agent",
+  "open-cluster-management-agent-addon",
+  "open-cluster-management-hub",
+  "open-cluster-management-observability"
+])
+ACM_COMPLETE_NO_OBS_NAMESPACES = namespace_selector([
+  "open-cluster-management",
+  "open-cluster-management-agent",
+  "open-cluster-management-agent-addon",
+  "open-cluster-management-hub"
+])
+ACM_MCE_COMPLETE_NAMESPACES = namespace_selector([
+  "hive",
+  "hypershift",
+  "multicluster-engine",
+  "open-cluster-management",
+  "open-cluster-management-agent",
+  "open-cluster-management-agent-addon",
+  "open-cluster-management-hub",
+  "open-cluster-management-observability",
+  "openshift-user-workload-monitoring"
+])
+GITOPS_NAMESPACES = namespace_selector([
+  "openshift-gitops-operator",
+  "openshift-gitops"
+])
+MCE_COMPLETE_NAMESPACES = namespace_selector([
+  "hive",
+  "hypershift",
+  "multicluster-engine",
+  "openshift-user-workload-monitoring"
+])
+
+# Opinionated list of OCP Namespaces to collect prometheus data on
+CORE_OCP_NAMESPACES = [
+  "openshift-apiserver",
+  "openshift-console",
+  "openshift-controller-manager",
+  "openshift-etcd",
+  "openshift-ingress",
+  "openshift-kni-infra",
+  "openshift-kube-apiserver",
+  "openshift-kube-controller-manager",
+  "openshift-kube-scheduler",
+  "openshift-machine-api",
+  "openshift-monitoring",
+  "openshift-ovn-kubernetes"
+]
+
+
+def core_ocp_catalog():
+  queries = []
+  for ns in CORE_OCP_NAMESPACES:
+    queries.append(query("cpu-{}".format(ns), "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='" + ns + "'})", ns, "{} CPU Cores Usage".format(ns), "CPU"))
+    queries.append(query("mem-{}".format(ns), "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='" + ns + "'})", ns, "{} Memory Usage".format(ns), "MEM"))
+    # queries.append(query("net-rcv-{}".format(ns), "sum(irate(container_network_receive_bytes_total{cluster='',namespace='" + ns + "'}[5m]))", ns, "{} Network Receive Throughput".format(ns), "NET"))
+    # queries.append(query("net-xmt-{}".format(ns), "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='" + ns + "'}[5m]))", ns, "{} Network Transmit Throughput".format(ns), "NET"))
+
+    # split by pods in the namespaces
+    queries.append(query("cpu-{}-pod".format(ns), "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='" + ns + "'})", "pod", "{} CPU Cores Usage".format(ns), "CPU"))
+    queries.append(query("mem-{}-pod".format(ns), "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='" + ns + "'})", "pod", "{} Memory Usage".format(ns), "MEM"))
+
+    # Volume space used by openshift-monitoring, just monitoring for now
+    if ns == "openshift-monitoring":
+      queries.append(query("pvc-{}".format(ns), "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='" + ns + "'})", "persistentvolumeclaim", "{} Volume Usage".format(ns), "DISK_USAGE"))
+
+  queries.append(query("pod-restarts", "(sum by (container) (kube_pod_container_status_restarts_total) > 3)", "container", "Pod Restarts > 3", "Count"))
+  return queries
+
+
+CATALOG = {}
+
+CATALOG["aap"] = [
+  # Interesting AAP Objects:
+  # query("aap-aj", "apiserver_storage_objects{resource='ansiblejobs.tower.ansible.com'}", "instance", "AnsibleJob Objects", "Count"),
+
+  # AAP Namespace
+  query("cpu-aap", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform'})", "ansible-automation-platform", "ansible-automation-platform CPU Cores Usage", "CPU"),
+  query("mem-aap", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform'})", "ansible-automation-platform", "ansible-automation-platform Memory Usage", "MEM"),
+  query("net-rcv-aap", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='ansible-automation-platform'}[5m]))", "ansible-automation-platform", "ansible-automation-platform Network Receive Throughput", "NET"),
+  query("net-xmt-aap", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='ansible-automation-platform'}[5m]))", "ansible-automation-platform", "ansible-automation-platform Network Transmit Throughput", "NET"),
+
+  # AAP Operator pods
+  query("cpu-aap-gateway-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-gateway-operator-controller-manager-.*'})", "pod", "AAP Gateway Operator CPU Cores Usage", "CPU"),
+  query("mem-aap-gateway-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-gateway-operator-controller-manager-.*'})", "pod", "AAP Gateway Operator Memory Usage", "MEM"),
+  query("cpu-aap-ac-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'automation-controller-operator-controller-manager-.*'})", "pod", "AAP Automation Controller Operator CPU Cores Usage", "CPU"),
+  query("mem-aap-ac-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'automation-controller-operator-controller-manager-.*'})", "pod", "AAP Automation Controller Operator Memory Usage", "MEM"),
+  query("cpu-aap-ah-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'automation-hub-operator-controller-manager-.*'})", "pod", "AAP Automation Hub Operator CPU Cores Usage", "CPU"),
+  query("mem-aap-ah-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'automation-hub-operator-controller-manager-.*'})", "pod", "AAP Automation Hub Operator Memory Usage", "MEM"),
+  query("cpu-aap-eda-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'eda-server-operator-controller-manager-.*'})", "pod", "AAP EDA Operator CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'eda-server-operator-controller-manager-.*'})", "pod", "AAP EDA Operator Memory Usage", "MEM"),
+
+  query("cpu-aap-lightspeed-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'ansible-lightspeed-operator-controller-manager-.*'})", "pod", "AAP Lightspeed Operator CPU Cores Usage", "CPU"),
+  query("mem-aap-lightspeed-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'ansible-lightspeed-operator-controller-manager-.*'})", "pod", "AAP Lightspeed Operator Memory Usage", "MEM"),
+  query("cpu-aap-resource-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'resource-operator-controller-manager-.*'})", "pod", "AAP Resource Operator CPU Cores Usage", "CPU"),
+  query("mem-aap-resource-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'resource-operator-controller-manager-.*'})", "pod", "AAP Resource Operator Memory Usage", "MEM"),
+
+  # AAP Postgres and Redis Pod
+  query("cpu-aap-postgres", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-postgres-.*'})", "pod", "AAP Postgres CPU Cores Usage", "CPU"),
+  query("mem-aap-postgres", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-postgres-.*'})", "pod", "AAP Postgres Memory Usage", "MEM"),
+
+  query("cpu-aap-redis", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-redis-.*'})", "pod", "AAP Redis CPU Cores Usage", "CPU"),
+  query("mem-aap-redis", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-redis-.*'})", "pod", "AAP Redis Memory Usage", "MEM"),
+
+  # AAP Automation Controller pods
+  query("cpu-aap-ac-task", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-controller-task-.*'})", "pod", "AAP Controller Task CPU Cores Usage", "CPU"),
+  query("mem-aap-ac-task", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-controller-task-.*'})", "pod", "AAP Controller Task Memory Usage", "MEM"),
+  query("cpu-aap-ac-web", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-controller-web-.*'})", "pod", "AAP Controller Web CPU Cores Usage", "CPU"),
+  query("mem-aap-ac-web", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-controller-web-.*'})", "pod", "AAP Controller Web Memory Usage", "MEM"),
+
+  # AAP Automation Hub pods
+  query("cpu-aap-ah-api", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-api-.*'})", "pod", "AAP Hub Api CPU Cores Usage", "CPU"),
+  query("mem-aap-ah-api", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-api-.*'})", "pod", "AAP Hub Api Memory Usage", "MEM"),
+  query("cpu-aap-ah-content", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-content-.*'})", "pod", "AAP Hub Content CPU Cores Usage", "CPU"),
+  query("mem-aap-ah-content", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-content-.*'})", "pod", "AAP Hub Content Memory Usage", "MEM"),
+  query("cpu-aap-ah-redis", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-redis-.*'})", "pod", "AAP Hub Redis CPU Cores Usage", "CPU"),
+  query("mem-aap-ah-redis", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-redis-.*'})", "pod", "AAP Hub Redis Memory Usage", "MEM"),
+  query("cpu-aap-ah-web", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-web-.*'})", "pod", "AAP Hub Web CPU Cores Usage", "CPU"),
+  query("mem-aap-ah-web", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-web-.*'})", "pod", "AAP Hub Web Memory Usage", "MEM"),
+  query("cpu-aap-ah-worker", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-hub-worker-.*'})", "pod", "AAP Hub Worker CPU Cores Usage", "CPU"),
+  query("mem-aap-ah-worker", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-hub-worker-.*'})", "pod", "AAP Hub Worker Memory Usage", "MEM"),
+
+  # AAP EDA pods
+  query("cpu-aap-eda-activation-worker", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-activation-worker-.*'})", "pod", "EDA Activation Worker CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-activation-worker", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-activation-worker-.*'})", "pod", "EDA Activation Worker Memory Usage", "MEM"),
+  query("cpu-aap-eda-api", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-api-.*'})", "pod", "EDA Api CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-api", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-api-.*'})", "pod", "EDA Api Memory Usage", "MEM"),
+  query("cpu-aap-eda-default-worker", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-default-worker-.*'})", "pod", "EDA Default Worker CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-default-worker", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-default-worker-.*'})", "pod", "EDA Default Worker Memory Usage", "MEM"),
+  query("cpu-aap-eda-event-stream", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-event-stream-.*'})", "pod", "EDA Event Stream CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-event-stream", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-event-stream-.*'})", "pod", "EDA Event Stream Memory Usage", "MEM"),
+  query("cpu-aap-eda-scheduler", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'aap-eda-scheduler-.*'})", "pod", "EDA Scheduler CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-scheduler", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'aap-eda-scheduler-.*'})", "pod", "EDA Scheduler Memory Usage", "MEM"),
+
+  # AAP EDA Activation Job pods
+  query("cpu-aap-eda-activation-jobs", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'activation-job-.*'})", "pod", "EDA Activation Jobs CPU Cores Usage", "CPU"),
+  query("mem-aap-eda-activation-jobs", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'activation-job-.*'})", "pod", "EDA Activation Jobs Memory Usage", "MEM"),
+
+  # AAP Automation Job pods
+  query("cpu-aap-automation-jobs", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ansible-automation-platform',pod=~'automation-job-.*'})", "pod", "AAP Automation Jobs CPU Cores Usage", "CPU"),
+  query("mem-aap-automation-jobs", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='ansible-automation-platform',pod=~'automation-job-.*'})", "pod", "AAP Automation Jobs Memory Usage", "MEM"),
+]
+
+CATALOG["adp"] = [
+  # ADP openshift-adp Namespace CPU/Memory/Network
+  query("cpu-adp", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-adp'})", "openshift-adp", "OpenShift ADP CPU Cores Usage", "CPU"),
+  query("mem-adp", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-adp'})", "openshift-adp", "OpenShift ADP Memory Usage", "MEM"),
+  query("net-rcv-adp", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-adp'}[5m]))", "openshift-adp", "OpenShift ADP Network Receive Throughput", "NET"),
+  query("net-xmt-adp", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-adp'}[5m]))", "openshift-adp", "OpenShift ADP Network Transmit Throughput", "NET"),
+
+  # ADP pods
+  query("cpu-adp-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-adp'})", "pod", "OpenShift ADP Pod CPU Cores Usage", "CPU"),
+  query("mem-adp-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-adp'})", "pod", "OpenShift ADP Pod Memory Usage", "MEM"),
+]
+
+# ACM - open-cluster-management-agent and open-cluster-management-agent-addon namespaces only
+CATALOG["acm-agent"] = [
+  query("cpu-acm-agent", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ACM_AGENT_NAMESPACES + "})", "open-cluster-management-agent + addons", "ACM Agent+Addons CPU Cores Usage", "CPU"),
+  query("mem-acm-agent", "sum(container_memory_working_set_bytes{cluster='',container!=''," + ACM_AGENT_NAMESPACES + "})", "open-cluster-management-agent + addons", "ACM Agent+Addons Memory Usage", "MEM"),
+  query("net-rcv-acm-agent", "sum(irate(container_network_receive_bytes_total{cluster=''," + ACM_AGENT_NAMESPACES + "}[5m]))", "open-cluster-management-agent + addons", "ACM Agent+Addons Network Receive Throughput", "NET"),
+  query("net-xmt-acm-agent", "sum(irate(container_network_transmit_bytes_total{cluster=''," + ACM_AGENT_NAMESPACES + "}[5m]))", "open-cluster-management-agent + addons", "ACM Agent+Addons Network Transmit Throughput", "NET"),
+
+  # ACM open-cluster-management-agent pods
+  query("cpu-acm-agent-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-agent'})", "pod", "ACM Agent Pods CPU Cores Usage", "CPU"),
+  query("mem-acm-agent-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-agent'})", "pod", "ACM Agent Pods Memory Usage", "MEM"),
+
+  # ACM open-cluster-management-agent-addon pods
+  query("cpu-acm-agent-addon-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-agent-addon'})", "pod", "ACM Agent Addon Pods CPU Cores Usage", "CPU"),
+  query("mem-acm-agent-addon-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-agent-addon'})", "pod", "ACM Agent Addon Pods Memory Usage", "MEM"),
+
+  # ACM open-cluster-management-addon-observability pods
+  query("cpu-acm-addon-obs-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-addon-observability'})", "pod", "ACM Addon Observability Pods CPU Cores Usage", "CPU"),
+  query("mem-acm-addon-obs-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-addon-observability'})", "pod", "ACM Addon Observability Pods Memory Usage", "MEM"),
+]
+
+# ACM - Complete (Opininated list of Hub ACM Namespaces)
+CATALOG["acm-complete"] = [
+  query("cpu-acm-complete", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ACM_COMPLETE_NAMESPACES + "})", "ACM Complete", "ACM Complete CPU Cores Usage", "CPU"),
+  query("mem-acm-complete", "sum(container_memory_working_set_bytes{cluster='',container!=''," + ACM_COMPLETE_NAMESPACES + "})", "ACM Complete", "ACM Complete Memory Usage", "MEM"),
+  query("net-rcv-acm-complete", "sum(irate(container_network_receive_bytes_total{cluster=''," + ACM_COMPLETE_NAMESPACES + "}[5m]))", "ACM Complete", "ACM Complete Network Receive Throughput", "NET"),
+  query("net-xmt-acm-complete", "sum(irate(container_network_transmit_bytes_total{cluster=''," + ACM_COMPLETE_NAMESPACES + "}[5m]))", "ACM Complete", "ACM Complete Network Transmit Throughput", "NET"),
+
+  # Remove "open-cluster-management-observability" namespace from acm_namespaces list
+  query("cpu-acm-complete-no-obs", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ACM_COMPLETE_NO_OBS_NAMESPACES + "})", "ACM Complete", "ACM Complete (No Observability) CPU Cores Usage", "CPU"),
+  query("mem-acm-complete-no-obs", "sum(container_memory_working_set_bytes{cluster='',container!=''," + ACM_COMPLETE_NO_OBS_NAMESPACES + "})", "ACM Complete", "ACM Complete (No Observability) Memory Usage", "MEM"),
+  query("net-rcv-acm-complete-no-obs", "sum(irate(container_network_receive_bytes_total{cluster=''," + ACM_COMPLETE_NO_OBS_NAMESPACES + "}[5m]))", "ACM Complete", "ACM Complete (No Observability) Network Receive Throughput", "NET"),
+  query("net-xmt-acm-complete-no-obs", "sum(irate(container_network_transmit_bytes_total{cluster=''," + ACM_COMPLETE_NO_OBS_NAMESPACES + "}[5m]))", "ACM Complete", "ACM Complete (No Observability) Network Transmit Throughput", "NET"),
+]
+
+# ACM - open-cluster-management-hub namespace only
+CATALOG["acm-hub"] = [
+  # ACM open-cluster-management-hub namespace CPU/Memory/Network
+  query("cpu-acm-ocm", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-hub'})", "open-cluster-management-hub", "ACM open-cluster-management-hub CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-hub'})", "open-cluster-management-hub", "ACM open-cluster-management-hub Memory Usage", "MEM"),
+  query("net-rcv-acm-ocm", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))", "open-cluster-management-hub", "ACM open-cluster-management-hub Network Receive Throughput", "NET"),
+  query("net-xmt-acm-ocm", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))", "open-cluster-management-hub", "ACM open-cluster-management-hub Network Transmit Throughput", "NET"),
+
+  # ACM open-cluster-management-hub pods
+  query("cpu-acm-hub-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-hub'})", "pod", "ACM Hub NS Pods CPU Cores Usage", "CPU"),
+  query("mem-acm-hub-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-hub'})", "pod", "ACM Hub NS Pods Memory Usage", "MEM"),
+  query("net-rcv-acm-hub-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))", "pod", "ACM Hub NS Pods Network Receive Throughput", "NET"),
+  query("net-xmt-acm-hub-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-hub'}[5m]))", "pod", "ACM Hub NS Pods Network Transmit Throughput", "NET"),
+]
+
+# ACM & MCE Complete (Complete cost of ACM which includes MCE and additional MCE namespaces)
+CATALOG["acm-mce-complete"] = [
+  query("cpu-acm-mce-complete", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + ACM_MCE_COMPLETE_NAMESPACES + "})", "ACM & MCE Complete", "ACM & MCE Complete CPU Cores Usage", "CPU"),
+  query("mem-acm-mce-complete", "sum(container_memory_working_set_bytes{cluster='',container!=''," + ACM_MCE_COMPLETE_NAMESPACES + "})", "ACM & MCE Complete", "ACM & MCE Complete Memory Usage", "MEM"),
+  query("net-rcv-acm-mce-complete", "sum(irate(container_network_receive_bytes_total{cluster=''," + ACM_MCE_COMPLETE_NAMESPACES + "}[5m]))", "ACM & MCE Complete", "ACM & MCE Complete Network Receive Throughput", "NET"),
+  query("net-xmt-acm-mce-complete", "sum(irate(container_network_transmit_bytes_total{cluster=''," + ACM_MCE_COMPLETE_NAMESPACES + "}[5m]))", "ACM & MCE Complete", "ACM & MCE Complete Network Transmit Throughput", "NET"),
+]
+
+# ACM - open-cluster-management-observability namespace only
+CATALOG["acm-observability"] = [
+  # ACM Observability CPU/Memory/Network
+  query("cpu-acm-obs", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-observability'})", "open-cluster-management-observability", "ACM Observability CPU Cores Usage", "CPU"),
+  query("mem-acm-obs", "sum(container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management-observability'})", "open-cluster-management-observability", "ACM Observability Memory Usage", "MEM"),
+  query("net-rcv-acm-obs", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))", "open-cluster-management-observability'", "ACM Observability Network Receive Throughput", "NET"),
+  query("net-xmt-acm-obs", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))", "open-cluster-management-observability'", "ACM Observability Network Transmit Throughput", "NET"),
+
+  # ACM Observability pods
+  query("cpu-acm-obs-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management-observability'})", "pod", "ACM Observability Pod CPU Cores Usage", "CPU"),
+  query("mem-acm-obs-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management-observability'})", "pod", "ACM Observability Pod Memory Usage", "MEM"),
+  query("net-rcv-acm-obs-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))", "pod", "ACM Observability Pod Network Receive Throughput", "NET"),
+  query("net-xmt-acm-obs-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management-observability'}[5m]))", "pod", "ACM Observability Pod Network Transmit Throughput", "NET"),
+
+  # Major OBS Resource Consumer (Thanos Receive Default)
+  query("mem-acm-obs-rcv-total", "sum(container_memory_working_set_bytes{cluster='',namespace='open-cluster-management-observability', pod=~'observability-thanos-receive-default.*', container!=''})", "Thanos Receive Default ", "ACM Observability Receiver Memory Usage", "MEM"),
+  query("mem-acm-obs-rcv-pod", "sum by (pod) (container_memory_working_set_bytes{cluster='',namespace='open-cluster-management-observability', pod=~'observability-thanos-receive-default.*', container!=''})", "pod", "ACM Observability Receiver Memory Usage", "MEM"),
+
+  # Volume Space used by OBS
+  query("pvc-obs", "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='open-cluster-management-observability'})", "persistentvolumeclaim", "ACM Observability Volume Usage", "DISK_USAGE"),
+
+  # NooBaa bucket used by ACM Observability Thanos object storage
+  query("noobaa-obs-bucket-used", "NooBaa_bucket_used_bytes{bucket_name=~'acm-observability-thanos.*'}", "bucket_name", "ACM Observability NooBaa Bucket Used", "DISK_USAGE", gate="openshift-storage"),
+]
+
+# ACM - open-cluster-management namespace only
+CATALOG["acm"] = [
+  # Interesting ACM objects
+  query("acm-mc", "apiserver_storage_objects{resource='managedclusters.cluster.open-cluster-management.io'}", "instance", "Managedcluster Objects", "Count"),
+  query("acm-mcaddons", "apiserver_storage_objects{resource='managedclusteraddons.addon.open-cluster-management.io'}", "instance", "Managedclusteraddons Objects", "Count"),
+  query("acm-policies", "apiserver_storage_objects{resource='policies.policy.open-cluster-management.io'}", "instance", "Policy Objects", "Count"),
+  query("acm-placementrules", "apiserver_storage_objects{resource='placementrules.apps.open-cluster-management.io'}", "instance", "Placementrules Objects", "Count"),
+  query("acm-placementbindings", "apiserver_storage_objects{resource='placementbindings.policy.open-cluster-management.io'}", "instance", "Placementbindings Objects", "Count"),
+  query("acm-placementdecisions", "apiserver_storage_objects{resource='placementdecisions.cluster.open-cluster-management.io'}", "instance", "Placementdecisions Objects", "Count"),
+  query("acm-manifestworks", "apiserver_storage_objects{resource='manifestworks.work.open-cluster-management.io'}", "instance", "Manifestworks Objects", "Count"),
+
+  # ACM Open-cluster-management namespace CPU/Memory/Network
+  query("cpu-acm-ocm", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management'})", "open-cluster-management", "ACM open-cluster-management CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management'})", "open-cluster-management", "ACM open-cluster-management Memory Usage", "MEM"),
+  query("net-rcv-acm-ocm", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))", "open-cluster-management", "ACM open-cluster-management Network Receive Throughput", "NET"),
+  query("net-xmt-acm-ocm", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))", "open-cluster-management", "ACM open-cluster-management Network Transmit Throughput", "NET"),
+
+  # ACM Open-cluster-management pods
+  # Graphing all open-cluster-management pods in one graph is too visually busy however useful to find outliers
+  query("cpu-acm-ocm-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management'})", "pod", "Open-cluster-management Pod CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management'})", "pod", "Open-cluster-management Pod Memory Usage", "MEM"),
+  query("net-rcv-acm-ocm-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))", "pod", "Open-cluster-management Pod Network Receive Throughput", "NET"),
+  query("net-xmt-acm-ocm-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management'}[5m]))", "pod", "Open-cluster-management Pod Network Transmit Throughput", "NET"),
+
+  # ACM acm-cli-downloads CPU/Memory
+  query("cpu-acm-ocm-acm-cli-downloads", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'acm-cli-downloads.*'})", "pod", "ACM acm-cli-downloads CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-acm-cli-downloads", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'acm-cli-downloads.*'})", "pod", "ACM acm-cli-downloads Memory Usage", "MEM"),
+
+  # ACM cluster-permission CPU/Memory
+  query("cpu-acm-ocm-cluster-permission", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'cluster-permission.*'})", "pod", "ACM cluster-permission CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-cluster-permission", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'cluster-permission.*'})", "pod", "ACM cluster-permission Memory Usage", "MEM"),
+
+  # ACM console-chart-console-v2 CPU/Memory
+  query("cpu-acm-ocm-console-chart-console-v2", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'console-chart-console-v2.*'})", "pod", "ACM console-chart-console-v2 CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-console-chart-console-v2", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'console-chart-console-v2.*'})", "pod", "ACM console-chart-console-v2 Memory Usage", "MEM"),
+
+  # ACM grc policy CPU/Memory/Network
+  query("cpu-acm-ocm-grc-policy", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'grc-policy-.*'})", "pod", "ACM grc-policy CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-grc-policy", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'grc-policy-.*'})", "pod", "ACM grc-policy Memory Usage", "MEM"),
+  query("net-rcv-acm-grc-policy-prop", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management',pod=~'grc-policy-.*'}[5m]))", "pod", "ACM grc-policy Network Receive Throughput", "NET"),
+  query("net-xmt-acm-grc-policy-prop", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management',pod=~'grc-policy-.*'}[5m]))", "pod", "ACM grc-policy Network Transmit Throughput", "NET"),
+
+  # ACM insights CPU/Memory
+  query("cpu-acm-ocm-insights", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'insights.*'})", "pod", "ACM insights CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-insights", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'insights.*'})", "pod", "ACM insights Memory Usage", "MEM"),
+
+  # ACM klusterlet-addon-controller-v2 CPU/Memory
+  query("cpu-acm-ocm-klusterlet-addon-controller-v2", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'klusterlet-addon-controller-v2.*'})", "pod", "ACM klusterlet-addon-controller-v2 CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-klusterlet-addon-controller-v2", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'klusterlet-addon-controller-v2.*'})", "pod", "ACM klusterlet-addon-controller-v2 Memory Usage", "MEM"),
+
+  # ACM multicluster CPU/Memory
+  query("cpu-acm-ocm-multicluster-", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'multicluster-.*'})", "pod", "ACM multicluster pods CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-multicluster-", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'multicluster-.*'})", "pod", "ACM multicluster pods Memory Usage", "MEM"),
+
+  # ACM multiclusterhub CPU/Memory
+  query("cpu-acm-ocm-multiclusterhub", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'multiclusterhub-.*'})", "pod", "ACM multiclusterhub pods CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-multiclusterhub", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'multiclusterhub-.*'})", "pod", "ACM multiclusterhub pods Memory Usage", "MEM"),
+
+  # ACM Search CPU/Memory/Network
+  query("cpu-acm-search", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'search.*'})", "pod", "ACM Search pods CPU Cores Usage", "CPU"),
+  query("mem-acm-search", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management',pod=~'search.*'})", "pod", "ACM Search pods Memory Usage", "MEM"),
+  query("net-rcv-acm-search", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))", "pod", "ACM Search pods Network Receive Throughput", "NET"),
+  query("net-xmt-acm-search", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))", "pod", "ACM Search pods Network Transmit Throughput", "NET"),
+
+  # ACM Search Total CPU/Memory/Network
+  query("cpu-acm-search-total", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'search.*'})", "ACM - Search", "ACM Search CPU Cores Usage", "CPU"),
+  query("mem-acm-search-total", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='open-cluster-management',pod=~'search.*'})", "ACM - Search", "ACM Search Memory Usage", "MEM"),
+  query("net-rcv-acm-search-total", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))", "ACM - Search", "ACM Search Network Receive Throughput", "NET"),
+  query("net-xmt-acm-search-total", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='open-cluster-management',pod=~'search.*'}[5m]))", "ACM - Search", "ACM Search Network Transmit Throughput", "NET"),
+
+  # ACM Volume Space used
+  query("pvc-acm", "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='open-cluster-management'})", "persistentvolumeclaim", "ACM Volume Usage", "DISK_USAGE"),
+
+  # ACM siteconfig-controller-manager CPU/Memory
+  query("cpu-acm-ocm-siteconfig-controller-manager", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'siteconfig-controller-manager.*'})", "pod", "ACM siteconfig-controller-manager CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-siteconfig-controller-manager", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'siteconfig-controller-manager.*'})", "pod", "ACM siteconfig-controller-manager Memory Usage", "MEM"),
+
+  # ACM submariner-addon CPU/Memory
+  query("cpu-acm-ocm-submariner-addon", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'submariner-addon.*'})", "pod", "ACM submariner-addon CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-submariner-addon", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'submariner-addon.*'})", "pod", "ACM submariner-addon Memory Usage", "MEM"),
+
+  # ACM volsync-addon-controller CPU/Memory
+  query("cpu-acm-ocm-volsync-addon-controller", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='open-cluster-management',pod=~'volsync-addon-controller.*'})", "pod", "ACM volsync-addon-controller CPU Cores Usage", "CPU"),
+  query("mem-acm-ocm-volsync-addon-controller", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='open-cluster-management',pod=~'volsync-addon-controller.*'})", "pod", "ACM volsync-addon-controller Memory Usage", "MEM"),
+]
+
+# Base OCP Combines All Base OCP Namespaces CPU/Memory/Network into a single metric/graph
+CATALOG["base-ocp"] = [
+  query("cpu-base-ocp", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',$BASE_OCP_NAMESPACES})", "base-ocp", "Base OCP CPU Cores Usage", "CPU"),
+  query("mem-base-ocp", "sum(container_memory_working_set_bytes{cluster='',container!='',$BASE_OCP_NAMESPACES})", "base-ocp", "Base OCP Memory Usage", "MEM"),
+  query("net-rcv-base-ocp", "sum(irate(container_network_receive_bytes_total{cluster='',namespace!='',$BASE_OCP_NAMESPACES}[5m]))", "base-ocp", "Base OCP Network Receive Throughput", "NET"),
+  query("net-xmt-base-ocp", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace!='',$BASE_OCP_NAMESPACES}[5m]))", "base-ocp", "Base OCP Network Transmit Throughput", "NET"),
+]
+
+CATALOG["cluster"] = [
+  # Cluster Complete utilization (OS + Applications)
+  # sum(node_cpu_info) is Cluster Core Count and sum(irate(node_cpu_seconds_total{mode="idle"}[1m])) is Idle CPU Usage, subtract idle from core count
+  query("cpu-cluster", "(count(node_cpu_seconds_total{mode='idle'}) - sum(irate(node_cpu_seconds_total{mode='idle'}[1m])))", "cluster", "Cluster CPU Cores Usage", "CPU"),
+  query("mem-cluster", "sum(node_memory_MemTotal_bytes - node_memory_MemAvailable_bytes)", "cluster", "Cluster Memory Usage", "MEM"),
+
+  # Cluster Application utilization below
+  # Cluster CPU/Memory/Network and nonterminated pods (excluding Minio)
+  query("cpu-cluster-app_no-minio", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace!='minio'})", "cluster", "Cluster Application CPU Cores Usage (Excluding Minio)", "CPU", gate="minio"),
+  query("mem-cluster-app_no-minio", "sum(container_memory_working_set_bytes{cluster='',namespace!='minio',container!=''})", "cluster", "Cluster Application Memory Usage (Excluding Minio)", "MEM", gate="minio"),
+  query("net-rcv-cluster_no-minio", "sum(irate(container_network_receive_bytes_total{cluster='',namespace!='',namespace!='minio'}[5m]))", "cluster", "Cluster Network Receive Throughput (Excluding Minio)", "NET", gate="minio"),
+  query("net-xmt-cluster_no-minio", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace!='',namespace!='minio'}[5m]))", "cluster", "Cluster Network Transmit Throughput (Excluding Minio)", "NET", gate="minio"),
+  query("nonterm-pods-cluster_no-minio", "sum(kube_pod_status_phase{phase!='Succeeded',phase!='Failed',namespace!='minio'})", "non-terminated pods", "Non-terminated pods across entire cluster (Excluding Minio)", "Count", gate="minio"),
+
+  # Cluster CPU/Memory/Network and nonterminated pods (No namespaces excluded)
+  query("cpu-cluster-app", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''})", "cluster", "Cluster Application CPU Cores Usage", "CPU"),
+  query("mem-cluster-app", "sum(container_memory_working_set_bytes{cluster='',container!=''})", "cluster", "Cluster Application Memory Usage", "MEM"),
+  query("net-rcv-cluster", "sum(irate(container_network_receive_bytes_total{cluster='',namespace!=''}[5m]))", "cluster", "Cluster Network Receive Throughput", "NET"),
+  query("net-xmt-cluster", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace!=''}[5m]))", "cluster", "Cluster Network Transmit Throughput", "NET"),
+  query("nonterm-pods-cluster", "sum(kube_pod_status_phase{phase!='Succeeded',phase!='Failed'})", "non-terminated pods", "Non-terminated pods across entire cluster", "Count"),
+  # Sum of nodes in each status (Ready, DiskPressure, MemoryPressure, PIDPressure)
+  query("cluster-node-status", "sum by (condition) (kube_node_status_condition{status='true'})", "condition", "Cluster Nodes Status", "Count"),
+]
+
+CATALOG["core-ocp"] = core_ocp_catalog()
+
+CATALOG["etcd"] = [
+  # ETCD DB Size is what can trigger out of quota
+  query("db-size", "etcd_mvcc_db_total_size_in_bytes", "pod", "ETCD DB Size", "DISK_USAGE"),
+  query("db-size-in-use", "etcd_mvcc_db_total_size_in_use_in_bytes", "pod", "ETCD DB Size In-use", "DISK_USAGE"),
+  query("fsync-duration", "histogram_quantile(0.99, sum(rate(etcd_disk_wal_fsync_duration_seconds_bucket{job='etcd'}[5m])) by (instance, pod, le))", "pod", "ETCD Disk Sync Duration", "Seconds"),
+  query("backend-commit-duration", "histogram_quantile(0.99, irate(etcd_disk_backend_commit_duration_seconds_bucket[5m]))", "pod", "ETCD Backend Commit Duration", "Seconds"),
+  query("total-leader-elections", "changes(etcd_server_leader_changes_seen_total{job='etcd'}[1d])", "pod", "ETCD Leader Elections Per Day", "Count"),
+  query("leader-changes", "max by (pod) (etcd_server_leader_changes_seen_total)", "pod", "ETCD Max Leader Changes", "Count"),
+
+  # Summing by pod means latencies between each other member are "summed" FYI
+  query("peer-roundtrip-time", "sum by (pod) (histogram_quantile(0.99, irate(etcd_network_peer_round_trip_time_seconds_bucket[1m])))", "pod", "ETCD Peer Roundtrip Time", "Seconds"),
+]
+
+CATALOG["gitops"] = [
+  # GitOps has two namespaces
+  query("cpu-gitops", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + GITOPS_NAMESPACES + "})", "openshift-gitops", "OpenShift GitOps CPU Cores Usage", "CPU"),
+  query("mem-gitops", "sum(container_memory_working_set_bytes{cluster='',container!=''," + GITOPS_NAMESPACES + "})", "openshift-gitops", "OpenShift GitOps Memory Usage", "MEM"),
+  query("net-rcv-gitops", "sum(irate(container_network_receive_bytes_total{cluster=''," + GITOPS_NAMESPACES + "}[5m]))", "openshift-gitops", "OpenShift GitOps Network Receive Throughput", "NET"),
+  query("net-xmt-gitops", "sum(irate(container_network_transmit_bytes_total{cluster=''," + GITOPS_NAMESPACES + "}[5m]))", "openshift-gitops", "OpenShift GitOps Network Transmit Throughput", "NET"),
+
+  # GitOps pods
+  query("cpu-gitops-pod", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + GITOPS_NAMESPACES + "})", "pod", "OpenShift GitOps Pod CPU Cores Usage", "CPU"),
+  query("mem-gitops-pod", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!=''," + GITOPS_NAMESPACES + "})", "pod", "OpenShift GitOps Pod Memory Usage", "MEM"),
+]
+
+CATALOG["hive"] = [
+  # Hive CPU/Memory/Network
+  query("cpu-hive", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='hive'})", "hive", "Hive CPU Cores Usage", "CPU"),
+  query("mem-hive", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='hive'})", "hive", "Hive Memory Usage", "MEM"),
+  query("net-rcv-hive", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='hive'}[5m]))", "hive", "Hive Network Receive Throughput", "NET"),
+  query("net-xmt-hive", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='hive'}[5m]))", "hive", "Hive Network Transmit Throughput", "NET"),
+
+  # Hive pods
+  query("cpu-hive-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='hive'})", "pod", "Hive Pod CPU Cores Usage", "CPU"),
+  query("mem-hive-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='hive'})", "pod", "Hive Pod Memory Usage", "MEM"),
+  query("net-rcv-hive-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='hive'}[5m]))", "pod", "Hive Pod Network Receive Throughput", "NET"),
+  query("net-xmt-hive-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='hive'}[5m]))", "pod", "Hive Pod Network Transmit Throughput", "NET"),
+]
+
+CATALOG["hypershift"] = [
+  # Hypershift CPU/Memory/Network
+  query("cpu-hypershift", "sum (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='hypershift'})", "hypershift", "Hypershift CPU Cores Usage", "CPU"),
+  query("mem-hypershift", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='hypershift'})", "hypershift", "Hypershift Memory Usage", "MEM"),
+  query("net-rcv-hypershift", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='hypershift'}[5m]))", "hypershift", "Hypershift Network Receive Throughput", "NET"),
+  query("net-xmt-hypershift", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='hypershift'}[5m]))", "hypershift", "Hypershift Network Transmit Throughput", "NET"),
+]
+
+CATALOG["hypershift-uwm"] = [
+  # OpenShift User Workload Monitoring CPU/Memory/Network
+  query("cpu-hypershift-uwm", "sum (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-user-workload-monitoring'})", "hypershift-uwm", "Hypershift UWM CPU Cores Usage", "CPU"),
+  query("mem-hypershift-uwm", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-user-workload-monitoring'})", "hypershift-uwm", "Hypershift UWM Memory Usage", "MEM"),
+  query("net-rcv-hypershift-uwm", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))", "hypershift-uwm", "Hypershift UWM Network Receive Throughput", "NET"),
+  query("net-xmt-hypershift-uwm", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))", "hypershift-uwm", "Hypershift UWM Network Transmit Throughput", "NET"),
+
+  # OpenShift User Workload Monitoring pods
+  query("cpu-hypershift-uwm-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-user-workload-monitoring'})", "pod", "Hypershift UWM Pod CPU Cores Usage", "CPU"),
+  query("mem-hypershift-uwm-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-user-workload-monitoring'})", "pod", "Hypershift UWM Pod Memory Usage", "MEM"),
+  query("net-rcv-hypershift-uwm-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))", "pod", "Hypershift UWM Pod Network Receive Throughput", "NET"),
+  query("net-xmt-hypershift-uwm-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-user-workload-monitoring'}[5m]))", "pod", "Hypershift UWM Pod Network Transmit Throughput", "NET"),
+]
+
+CATALOG["lso"] = [
+  # Local Storage Operator CPU/Memory/Network
+  query("cpu-lso", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-local-storage'})", "openshift-local-storage", "OpenShift LSO CPU Cores Usage", "CPU"),
+  query("mem-lso", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-local-storage'})", "openshift-local-storage", "OpenShift LSO Memory Usage", "MEM"),
+  query("net-rcv-lso", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-local-storage'}[5m]))", "openshift-local-storage", "OpenShift LSO Network Receive Throughput", "NET"),
+  query("net-xmt-lso", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-local-storage'}[5m]))", "openshift-local-storage", "OpenShift LSO Network Transmit Throughput", "NET"),
+]
+
+# MCE - Complete (Hive, Hypershift, MCE, UWM) CPU/Memory/Network
+CATALOG["mce-complete"] = [
+  query("cpu-mce-complete", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''," + MCE_COMPLETE_NAMESPACES + "})", "MCE - Complete", "MCE Complete (Hive, Hypershift, MCE, UWM) CPU Cores Usage", "CPU"),
+  query("mem-mce-complete", "sum(container_memory_working_set_bytes{cluster='',container!=''," + MCE_COMPLETE_NAMESPACES + "})", "MCE - Complete", "MCE Complete (Hive, Hypershift, MCE, UWM) Memory Usage", "MEM"),
+  query("net-rcv-mce-complete", "sum(irate(container_network_receive_bytes_total{cluster=''," + MCE_COMPLETE_NAMESPACES + "}[5m]))", "MCE - Complete", "MCE Complete (Hive, Hypershift, MCE, UWM) Network Receive Throughput", "NET"),
+  query("net-xmt-mce-complete", "sum(irate(container_network_transmit_bytes_total{cluster=''," + MCE_COMPLETE_NAMESPACES + "}[5m]))", "MCE - Complete", "MCE Complete (Hive, Hypershift, MCE, UWM) Network Transmit Throughput", "NET"),
+]
+
+# MCE - multicluster-engine namespace only
+CATALOG["mce"] = [
+  # Interesting MCE objects
+  query("mce-agents", "apiserver_storage_objects{resource='agents.agent-install.openshift.io'}", "instance", "MCE Agent Objects", "Count"),
+
+  query("cpu-mce", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine'})", "MCE - multicluster-engine", "MCE CPU Cores Usage", "CPU"),
+  query("mem-mce", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-engine'})", "MCE - multicluster-engine", "MCE Memory Usage", "MEM"),
+  query("net-rcv-mce", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))", "MCE - multicluster-engine", "MCE Network Receive Throughput", "NET"),
+  query("net-xmt-mce", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))", "MCE - multicluster-engine", "MCE Network Transmit Throughput", "NET"),
+
+  # MCE pods (multicluster-engine namespace)
+  # Graphing all MCE pods in one graph is too visually busy however useful to find outliers
+  query("cpu-mce-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine'})", "pod", "MCE Pod CPU Cores Usage", "CPU"),
+  query("mem-mce-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-engine'})", "pod", "MCE Pod Memory Usage", "MEM"),
+  query("net-rcv-mce-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))", "pod", "MCE Pod Network Receive Throughput", "NET"),
+  query("net-xmt-mce-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-engine'}[5m]))", "pod", "MCE Pod Network Transmit Throughput", "NET"),
+
+  # MCE agentinstalladmission CPU/Memory
+  query("cpu-mce-aia", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'agentinstalladmission.*'})", "pod", "MCE agentinstalladmission CPU Cores Usage", "CPU"),
+  query("mem-mce-aia", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'agentinstalladmission.*'})", "pod", "MCE agentinstalladmission Memory Usage", "MEM"),
+
+  # MCE Assisted installer service(s) CPU/Memory
+  query("cpu-mce-ai", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'assisted.*'})", "pod", "MCE Assisted-Installer CPU Cores Usage", "CPU"),
+  query("mem-mce-ai", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'assisted.*'})", "pod", "MCE Assisted-Installer Memory Usage", "MEM"),
+
+  # MCE cluster-curator-controller CPU/Memory
+  query("cpu-mce-cluster-curator-controller", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-curator-controller.*'})", "pod", "MCE cluster-curator-controller CPU Cores Usage", "CPU"),
+  query("mem-mce-cluster-curator-controller", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-curator-controller.*'})", "pod", "MCE cluster-curator-controller Memory Usage", "MEM"),
+
+  # MCE cluster-image-set-controller CPU/Memory
+  query("cpu-mce-cis", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-image-set-controller.*'})", "pod", "MCE cluster-image-set-controller CPU Cores Usage", "CPU"),
+  query("mem-mce-cis", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-image-set-controller.*'})", "pod", "MCE cluster-image-set-controller Memory Usage", "MEM"),
+
+  # MCE cluster-manager CPU/Memory
+  query("cpu-mce-cm", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-manager.*'})", "pod", "MCE cluster-manager CPU Cores Usage", "CPU"),
+  query("mem-mce-cm", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-manager.*'})", "pod", "MCE cluster-manager Memory Usage", "MEM"),
+
+  # MCE cluster-proxy, cluster-proxy-addon manager/user Pods CPU/Memory
+  query("cpu-mce-cp", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'cluster-proxy.*'})", "pod", "MCE cluster-proxy, cluster-proxy-addon manager/user CPU Cores Usage", "CPU"),
+  query("mem-mce-cp", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'cluster-proxy.*'})", "pod", "MCE cluster-proxy, cluster-proxy-addon manager/user Memory Usage", "MEM"),
+
+  # MCE clusterclaims-controller CPU/Memory
+  query("cpu-mce-clusterclaims-controller", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'clusterclaims-controller.*'})", "pod", "MCE clusterclaims-controller CPU Cores Usage", "CPU"),
+  query("mem-mce-clusterclaims-controller", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'clusterclaims-controller.*'})", "pod", "MCE clusterclaims-controller Memory Usage", "MEM"),
+
+  # MCE clusterlifecycle-state-metrics-v2 CPU/Memory
+  query("cpu-mce-cls", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'clusterlifecycle-state-metrics-v2.*'})", "pod", "MCE clusterlifecycle-state-metrics-v2 CPU Cores Usage", "CPU"),
+  query("mem-mce-cls", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'clusterlifecycle-state-metrics-v2.*'})", "pod", "MCE clusterlifecycle-state-metrics-v2 Memory Usage", "MEM"),
+
+  # MCE console-mce-console CPU/Memory
+  query("cpu-mce-cmc", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'console-mce-console.*'})", "pod", "MCE console-mce-console CPU Cores Usage", "CPU"),
+  query("mem-mce-cmc", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'console-mce-console.*'})", "pod", "MCE console-mce-console Memory Usage", "MEM"),
+
+  # MCE discovery-operator CPU/Memory
+  query("cpu-mce-do", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'discovery-operator.*'})", "pod", "MCE discovery-operator CPU Cores Usage", "CPU"),
+  query("mem-mce-do", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'discovery-operator.*'})", "pod", "MCE discovery-operator Memory Usage", "MEM"),
+
+  # MCE hcp-cli-download CPU/Memory
+  query("cpu-mce-hcp-cli-download", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'hcp-cli-download.*'})", "pod", "MCE hcp-cli-download CPU Cores Usage", "CPU"),
+  query("mem-mce-hcp-cli-download", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'hcp-cli-download.*'})", "pod", "MCE hcp-cli-download Memory Usage", "MEM"),
+
+  # MCE hive-operator CPU/Memory
+  query("cpu-mce-ho", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'hive-operator.*'})", "pod", "MCE hive-operator CPU Cores Usage", "CPU"),
+  query("mem-mce-ho", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'hive-operator.*'})", "pod", "MCE hive-operator Memory Usage", "MEM"),
+
+  # MCE hypershift-addon-manager CPU/Memory
+  query("cpu-mce-ham", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'hypershift-addon-manager.*'})", "pod", "MCE hypershift-addon-manager CPU Cores Usage", "CPU"),
+  query("mem-mce-ham", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'hypershift-addon-manager.*'})", "pod", "MCE hypershift-addon-manager Memory Usage", "MEM"),
+
+  # MCE infrastructure-operator CPU/Memory
+  query("cpu-mce-io", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'infrastructure-operator.*'})", "pod", "MCE infrastructure-operator CPU Cores Usage", "CPU"),
+  query("mem-mce-io", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'infrastructure-operator.*'})", "pod", "MCE infrastructure-operator Memory Usage", "MEM"),
+
+  # MCE Image Based Install Operator CPU/Memory
+  query("cpu-mce-ibio", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'image-based-install-operator.*'})", "pod", "MCE image-based-install-operator CPU Cores Usage", "CPU"),
+  query("mem-mce-ibio", "sum(container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'image-based-install-operator.*'})", "pod", "MCE image-based-install-operator Memory Usage", "MEM"),
+
+  # MCE Managedcluster-import-controller CPU/Memory
+  query("cpu-mce-mcic", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'managedcluster-import-controller-v2.*'})", "pod", "MCE managedcluster-import-controller CPU Cores Usage", "CPU"),
+  query("mem-mce-mcic", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'managedcluster-import-controller-v2.*'})", "pod", "MCE managedcluster-import-controller Memory Usage", "MEM"),
+
+  # MCE multicluster-engine-operator CPU/Memory
+  query("cpu-mce-meo", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'multicluster-engine-operator.*'})", "pod", "MCE multicluster-engine-operator CPU Cores Usage", "CPU"),
+  query("mem-mce-meo", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'multicluster-engine-operator.*'})", "pod", "MCE multicluster-engine-operator Memory Usage", "MEM"),
+
+  # MCE ocm CPU/Memory
+  query("cpu-mce-ocm", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'ocm.*'})", "pod", "MCE ocm CPU Cores Usage", "CPU"),
+  query("mem-mce-ocm", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'ocm.*'})", "pod", "MCE ocm Memory Usage", "MEM"),
+
+  # MCE provider-credential-controller CPU/Memory
+  query("cpu-mce-pcc", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-engine',pod=~'provider-credential-controller.*'})", "pod", "MCE provider-credential-controller CPU Cores Usage", "CPU"),
+  query("mem-mce-pcc", "sum by (pod) (container_memory_working_set_bytes{cluster='', container!='',namespace='multicluster-engine',pod=~'provider-credential-controller.*'})", "pod", "MCE provider-credential-controller Memory Usage", "MEM"),
+
+  # Volume Space used by MCE
+  query("pvc-mce", "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='multicluster-engine'})", "persistentvolumeclaim", "MCE Volume Usage", "DISK_USAGE"),
+]
+
+CATALOG["mcgh"] = [
+  # MCGH CPU/Memory/Network
+  query("cpu-mcgh", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub'})", "MCGH Namespace", "MCGH CPU Cores Usage", "CPU"),
+  query("mem-mcgh", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub'})", "MCGH Namespace", "MCGH Memory Usage", "MEM"),
+  query("net-rcv-mcgh", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub'}[5m]))", "MCGH Namespace", "MCGH Network Receive Throughput", "NET"),
+  query("net-xmt-mcgh", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub'}[5m]))", "MCGH Namespace", "MCGH Network Transmit Throughput", "NET"),
+
+  # MCGH pods
+  query("cpu-mcgh-amq-streams-cluster-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'amq-streams-cluster-operator-.*'})", "pod", "MCGH AMQ Streams Cluster Operator CPU Cores Usage", "CPU"),
+  query("mem-mcgh-amq-streams-cluster-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'amq-streams-cluster-operator-.*'})", "pod", "MCGH AMQ Streams Cluster Operator Memory Usage", "MEM"),
+
+  query("cpu-mcgh-kafka-entity-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'})", "pod", "MCGH Kafka Entity Operator CPU Cores Usage", "CPU"),
+  query("mem-mcgh-kafka-entity-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'})", "pod", "MCGH Kafka Entity Operator Memory Usage", "MEM"),
+  query("net-rcv-mcgh-kafka-entity-operator", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'}[5m]))", "pod", "MCGH Kafka Entity Operator Network Receive Throughput", "NET"),
+  query("net-xmt-mcgh-kafka-entity-operator", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-entity-operator-.*'}[5m]))", "pod", "MCGH Kafka Entity Operator Network Transmit Throughput", "NET"),
+
+  query("cpu-mcgh-kafka-kraft", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'})", "pod", "MCGH Kafka Kraft CPU Cores Usage", "CPU"),
+  query("mem-mcgh-kafka-kraft", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'})", "pod", "MCGH Kafka Kraft Memory Usage", "MEM"),
+  query("net-rcv-mcgh-kafka-kraft", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'}[5m]))", "pod", "MCGH Kafka Kraft Network Receive Throughput", "NET"),
+  query("net-xmt-mcgh-kafka-kraft", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'kafka-kraft-.*'}[5m]))", "pod", "MCGH Kafka Kraft Network Transmit Throughput", "NET"),
+
+  query("cpu-mcgh-pods", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'})", "pod", "MCGH Pod CPU Cores Usage", "CPU"),
+  query("mem-mcgh-pods", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'})", "pod", "MCGH Pod Memory Usage", "MEM"),
+  query("net-rcv-mcgh-pods", "sum by (pod) (irate(container_network_receive_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'}[5m]))", "pod", "MCGH Pod Network Receive Throughput", "NET"),
+  query("net-xmt-mcgh-pods", "sum by (pod) (irate(container_network_transmit_bytes_total{cluster='',namespace='multicluster-global-hub',pod=~'multicluster-global-hub-.*'}[5m]))", "pod", "MCGH Pod Network Transmit Throughput", "NET"),
+]
+
+CATALOG["minio"] = [
+  # Minio CPU/Memory/Network
+  query("cpu-minio", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='minio'})", "minio", "Minio CPU Cores Usage", "CPU"),
+  query("mem-minio", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='minio'})", "minio", "Minio Memory Usage", "MEM"),
+  query("net-rcv-minio", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='minio'}[5m]))", "minio", "Minio Network Receive Throughput", "NET"),
+  query("net-xmt-minio", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='minio'}[5m]))", "minio", "Minio Network Transmit Throughput", "NET"),
+  # Volume Space used by Minio
+  query("pvc-minio", "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='minio'})", "persistentvolumeclaim", "Minio Volume Usage", "DISK_USAGE"),
+  # Minio is a single pod thus no need to split by pod
+]
+
+CATALOG["odf"] = [
+  # ODF openshift-storage Namespace CPU/Memory/Network
+  query("cpu-odf", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage'})", "openshift-storage", "ODF CPU Cores Usage", "CPU"),
+  query("mem-odf", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage'})", "openshift-storage", "ODF Memory Usage", "MEM"),
+  query("net-rcv-odf", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='openshift-storage'}[5m]))", "openshift-storage", "ODF Network Receive Throughput", "NET"),
+  query("net-xmt-odf", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='openshift-storage'}[5m]))", "openshift-storage", "ODF Network Transmit Throughput", "NET"),
+
+  # ODF Operator pods
+  query("cpu-odf-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-operator-controller-manager-.*'})", "pod", "ODF Operator CPU Cores Usage", "CPU"),
+  query("mem-odf-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-operator-controller-manager-.*'})", "pod", "ODF Operator Memory Usage", "MEM"),
+  # OCS Operator pods
+  query("cpu-odf-ocs-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-operator-.*'})", "pod", "OCS Operator CPU Cores Usage", "CPU"),
+  query("mem-odf-ocs-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-operator-.*'})", "pod", "OCS Operator Memory Usage", "MEM"),
+  # Rook-Ceph Operator pods
+  query("cpu-odf-rook-ceph-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-operator-.*'})", "pod", "Rook-Ceph Operator CPU Cores Usage", "CPU"),
+  query("mem-odf-rook-ceph-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-operator-.*'})", "pod", "Rook-Ceph Operator Memory Usage", "MEM"),
+  # NooBaa Operator pods
+  query("cpu-odf-noobaa-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-operator-.*'})", "pod", "NooBaa Operator CPU Cores Usage", "CPU"),
+  query("mem-odf-noobaa-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-operator-.*'})", "pod", "NooBaa Operator Memory Usage", "MEM"),
+  # Ceph CSI Controller Manager pods
+  query("cpu-odf-ceph-csi-controller-manager", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ceph-csi-controller-manager-.*'})", "pod", "Ceph CSI Controller Manager CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-csi-controller-manager", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ceph-csi-controller-manager-.*'})", "pod", "Ceph CSI Controller Manager Memory Usage", "MEM"),
+  # CSI Addons Controller Manager pods
+  query("cpu-odf-csi-addons-controller-manager", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'csi-addons-controller-manager-.*'})", "pod", "CSI Addons Controller Manager CPU Cores Usage", "CPU"),
+  query("mem-odf-csi-addons-controller-manager", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'csi-addons-controller-manager-.*'})", "pod", "CSI Addons Controller Manager Memory Usage", "MEM"),
+  # OCS Client Operator pods
+  query("cpu-odf-ocs-client-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-client-operator-controller-manager-.*'})", "pod", "OCS Client Operator CPU Cores Usage", "CPU"),
+  query("mem-odf-ocs-client-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-client-operator-controller-manager-.*'})", "pod", "OCS Client Operator Memory Usage", "MEM"),
+  # OCS Client Operator Console pods
+  query("cpu-odf-ocs-client-operator-console", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-client-operator-console-.*'})", "pod", "OCS Client Operator Console CPU Cores Usage", "CPU"),
+  query("mem-odf-ocs-client-operator-console", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-client-operator-console-.*'})", "pod", "OCS Client Operator Console Memory Usage", "MEM"),
+  # OCS Metrics Exporter pods
+  query("cpu-odf-ocs-metrics-exporter", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-metrics-exporter-.*'})", "pod", "OCS Metrics Exporter CPU Cores Usage", "CPU"),
+  query("mem-odf-ocs-metrics-exporter", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-metrics-exporter-.*'})", "pod", "OCS Metrics Exporter Memory Usage", "MEM"),
+  # OCS Provider Server pods
+  query("cpu-odf-ocs-provider-server", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ocs-provider-server-.*'})", "pod", "OCS Provider Server CPU Cores Usage", "CPU"),
+  query("mem-odf-ocs-provider-server", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ocs-provider-server-.*'})", "pod", "OCS Provider Server Memory Usage", "MEM"),
+  # ODF Blackbox Exporter pods
+  query("cpu-odf-blackbox-exporter", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-blackbox-exporter-.*'})", "pod", "ODF Blackbox Exporter CPU Cores Usage", "CPU"),
+  query("mem-odf-blackbox-exporter", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-blackbox-exporter-.*'})", "pod", "ODF Blackbox Exporter Memory Usage", "MEM"),
+  # ODF Console pods
+  query("cpu-odf-console", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-console-.*'})", "pod", "ODF Console CPU Cores Usage", "CPU"),
+  query("mem-odf-console", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-console-.*'})", "pod", "ODF Console Memory Usage", "MEM"),
+  # ODF External Snapshotter Operator pods
+  query("cpu-odf-external-snapshotter-operator", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'odf-external-snapshotter-operator-.*'})", "pod", "ODF External Snapshotter Operator CPU Cores Usage", "CPU"),
+  query("mem-odf-external-snapshotter-operator", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'odf-external-snapshotter-operator-.*'})", "pod", "ODF External Snapshotter Operator Memory Usage", "MEM"),
+  # UX Backend Server pods
+  query("cpu-odf-ux-backend-server", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'ux-backend-server-.*'})", "pod", "UX Backend Server CPU Cores Usage", "CPU"),
+  query("mem-odf-ux-backend-server", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'ux-backend-server-.*'})", "pod", "UX Backend Server Memory Usage", "MEM"),
+
+  # Ceph Monitor pods
+  query("cpu-odf-ceph-mon", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-mon-.*'})", "pod", "Ceph Monitor CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-mon", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-mon-.*'})", "pod", "Ceph Monitor Memory Usage", "MEM"),
+  # Ceph Manager pods
+  query("cpu-odf-ceph-mgr", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-mgr-.*'})", "pod", "Ceph Manager CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-mgr", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-mgr-.*'})", "pod", "Ceph Manager Memory Usage", "MEM"),
+  # Ceph OSD pods
+  query("cpu-odf-ceph-osd", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-osd-.*'})", "pod", "Ceph OSD CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-osd", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-osd-.*'})", "pod", "Ceph OSD Memory Usage", "MEM"),
+  # Ceph MDS pods
+  query("cpu-odf-ceph-mds", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-mds-.*'})", "pod", "Ceph MDS CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-mds", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-mds-.*'})", "pod", "Ceph MDS Memory Usage", "MEM"),
+  # Ceph RGW pods
+  query("cpu-odf-ceph-rgw", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-rgw-.*'})", "pod", "Ceph RGW CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-rgw", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-rgw-.*'})", "pod", "Ceph RGW Memory Usage", "MEM"),
+  # Ceph Crash Collector pods
+  query("cpu-odf-ceph-crashcollector", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-crashcollector-.*'})", "pod", "Ceph Crash Collector CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-crashcollector", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-crashcollector-.*'})", "pod", "Ceph Crash Collector Memory Usage", "MEM"),
+
+  # Rook-Ceph Exporter pods
+  query("cpu-odf-ceph-exporter", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'rook-ceph-exporter-.*'})", "pod", "Ceph Exporter CPU Cores Usage", "CPU"),
+  query("mem-odf-ceph-exporter", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'rook-ceph-exporter-.*'})", "pod", "Ceph Exporter Memory Usage", "MEM"),
+
+  # CSI RBD Node Plugin pods (DaemonSet)
+  query("cpu-odf-csi-rbd-nodeplugin", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-nodeplugin-.*'})", "pod", "CSI RBD Node Plugin CPU Cores Usage", "CPU"),
+  query("mem-odf-csi-rbd-nodeplugin", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-nodeplugin-.*'})", "pod", "CSI RBD Node Plugin Memory Usage", "MEM"),
+  # CSI RBD Controller Plugin pods
+  query("cpu-odf-csi-rbd-ctrlplugin", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-ctrlplugin-.*'})", "pod", "CSI RBD Controller Plugin CPU Cores Usage", "CPU"),
+  query("mem-odf-csi-rbd-ctrlplugin", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.rbd.csi.ceph.com-ctrlplugin-.*'})", "pod", "CSI RBD Controller Plugin Memory Usage", "MEM"),
+  # CSI CephFS Node Plugin pods (DaemonSet)
+  query("cpu-odf-csi-cephfs-nodeplugin", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-nodeplugin-.*'})", "pod", "CSI CephFS Node Plugin CPU Cores Usage", "CPU"),
+  query("mem-odf-csi-cephfs-nodeplugin", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-nodeplugin-.*'})", "pod", "CSI CephFS Node Plugin Memory Usage", "MEM"),
+  # CSI CephFS Controller Plugin pods
+  query("cpu-odf-csi-cephfs-ctrlplugin", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-ctrlplugin-.*'})", "pod", "CSI CephFS Controller Plugin CPU Cores Usage", "CPU"),
+  query("mem-odf-csi-cephfs-ctrlplugin", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'openshift-storage.cephfs.csi.ceph.com-ctrlplugin-.*'})", "pod", "CSI CephFS Controller Plugin Memory Usage", "MEM"),
+
+  # NooBaa Core pods
+  query("cpu-odf-noobaa-core", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-core-.*'})", "pod", "NooBaa Core CPU Cores Usage", "CPU"),
+  query("mem-odf-noobaa-core", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-core-.*'})", "pod", "NooBaa Core Memory Usage", "MEM"),
+  # NooBaa Endpoint pods
+  query("cpu-odf-noobaa-endpoint", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-endpoint-.*'})", "pod", "NooBaa Endpoint CPU Cores Usage", "CPU"),
+  query("mem-odf-noobaa-endpoint", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-endpoint-.*'})", "pod", "NooBaa Endpoint Memory Usage", "MEM"),
+  # NooBaa DB (PostgreSQL) pods
+  query("cpu-odf-noobaa-db-pg", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'noobaa-db-pg-.*'})", "pod", "NooBaa DB CPU Cores Usage", "CPU"),
+  query("mem-odf-noobaa-db-pg", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'noobaa-db-pg-.*'})", "pod", "NooBaa DB Memory Usage", "MEM"),
+  # CNPG Controller Manager pods
+  query("cpu-odf-cnpg-controller-manager", "sum by (pod) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='openshift-storage',pod=~'cnpg-controller-manager-.*'})", "pod", "CNPG Controller Manager CPU Cores Usage", "CPU"),
+  query("mem-odf-cnpg-controller-manager", "sum by (pod) (container_memory_working_set_bytes{cluster='',container!='',namespace='openshift-storage',pod=~'cnpg-controller-manager-.*'})", "pod", "CNPG Controller Manager Memory Usage", "MEM"),
+
+  # Ceph Storage Capacity and Usage
+  # Ceph cluster total raw capacity (divide by 1e12 to convert bytes to TB, avoids plotly showing "k GB" on the y-axis)
+  query("ceph-cluster-total-capacity", "(ceph_cluster_total_bytes / 1e12)", "instance", "Ceph Cluster Total Raw Capacity", "Capacity (TB)"),
+  query("ceph-cluster-used-capacity", "ceph_cluster_total_used_bytes", "instance", "Ceph Cluster Used Raw Capacity", "DISK_USAGE"),
+  # Per-pool stored data with human-readable pool names from ceph_pool_metadata
+  query("ceph-pool-stored-raw", "sum by (name) (ceph_pool_stored_raw * on(pool_id) group_left(name) ceph_pool_metadata)", "name", "Ceph Pool Stored Raw Data By Pool", "DISK_USAGE"),
+  # OSD storage: total used across all OSDs, per-OSD used, per-OSD capacity
+  query("ceph-osd-used-total", "sum(ceph_osd_stat_bytes_used)", "Ceph OSD Total", "Ceph OSD Aggregate Used", "DISK_USAGE"),
+  query("ceph-osd-used-per-osd", "ceph_osd_stat_bytes_used", "ceph_daemon", "Ceph OSD Used Per OSD", "DISK_USAGE"),
+  query("ceph-osd-capacity-per-osd", "ceph_osd_stat_bytes", "ceph_daemon", "Ceph OSD Capacity Per OSD", "DISK_USAGE"),
+  # ODF filesystem PVC usage (block PVCs are not reported by kubelet_volume_stats_used_bytes)
+  query("pvc-odf", "sum by (persistentvolumeclaim) (kubelet_volume_stats_used_bytes{namespace='openshift-storage'})", "persistentvolumeclaim", "ODF PVC Filesystem Usage", "DISK_USAGE"),
+
+  # Ceph Object Store (RGW) object count and stored size
+  query("ceph-rgw-object-count", "sum(ceph_pool_objects * on(pool_id) group_left(name) ceph_pool_metadata{name=~'.*rgw.*'})", "Ceph RGW Total", "Ceph RGW Object Count", "Objects"),
+  query("ceph-rgw-object-size", "sum(ceph_pool_stored * on(pool_id) group_left(name) ceph_pool_metadata{name=~'.*rgw.*'})", "Ceph RGW Total", "Ceph RGW Object Store Used", "DISK_USAGE"),
+  # NooBaa total storage usage
+  query("noobaa-total-usage", "NooBaa_total_usage", "instance", "NooBaa Total Usage", "DISK_USAGE"),
+
+  # Ceph OSD Performance
+  query("ceph-osd-read-latency", "rate(ceph_osd_op_r_latency_sum[5m])", "ceph_daemon", "Ceph OSD Read Latency Per OSD", "Latency (ms)"),
+  query("ceph-osd-write-latency", "rate(ceph_osd_op_w_latency_sum[5m])", "ceph_daemon", "Ceph OSD Write Latency Per OSD", "Latency (ms)"),
+
+  # Ceph IOPS
+  query("ceph-iops-read-total", "sum(rate(ceph_osd_op_r[5m]))", "Ceph Total", "Ceph Cluster Read IOPS", "IOPS"),
+  query("ceph-iops-write-total", "sum(rate(ceph_osd_op_w[5m]))", "Ceph Total", "Ceph Cluster Write IOPS", "IOPS"),
+  query("ceph-iops-read-per-osd", "rate(ceph_osd_op_r[5m])", "ceph_daemon", "Ceph Read IOPS Per OSD", "IOPS"),
+  query("ceph-iops-write-per-osd", "rate(ceph_osd_op_w[5m])", "ceph_daemon", "Ceph Write IOPS Per OSD", "IOPS"),
+  query("ceph-iops-read-per-pool", "sum by (name) (rate(ceph_pool_rd[5m]) * on(pool_id) group_left(name) ceph_pool_metadata)", "name", "Ceph Read IOPS Per Pool", "IOPS"),
+  query("ceph-iops-write-per-pool", "sum by (name) (rate(ceph_pool_wr[5m]) * on(pool_id) group_left(name) ceph_pool_metadata)", "name", "Ceph Write IOPS Per Pool", "IOPS"),
+
+  # Ceph Health Status (0=HEALTH_OK, 1=HEALTH_WARN, 2=HEALTH_ERR)
+  query("ceph-health-status", "ceph_health_status", "instance", "Ceph Health Status", "Status"),
+]
+
+CATALOG["node"] = [
+  # Node CPU/Memory/Disk/Network
+
+  # Keep in mind the below two queries include Minio
+  # Subtract by node/instance idle CPU usage from core count to get each node/instance's CPU usage
+  query("cpu-node", "(count by (instance) (node_cpu_seconds_total{mode='idle'}) - sum by (instance) (irate(node_cpu_seconds_total{mode='idle'}[1m])))", "instance", "Node CPU Cores Usage", "CPU"),
+  query("mem-node", "sum by (instance) (node_memory_MemTotal_bytes - node_memory_MemAvailable_bytes)", "instance", "Node Memory Usage", "MEM"),
+
+  # Node CPU/Memory/Disk/Network (excluding Minio)
+  query("cpu-node-app_no-minio", "sum by(node) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace!='minio'})", "node", "Node Application CPU Cores Usage (Excluding Minio)", "CPU", gate="minio"),
+  query("mem-node-app_no-minio", "sum by(node) (container_memory_working_set_bytes{cluster='',container!='',namespace!='minio'})", "node", "Node Application Memory Usage (Excluding Minio)", "MEM", gate="minio"),
+
+  # Node CPU/Memory/Network (including Minio)
+  query("cpu-node-app", "sum by(node) (node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster=''})", "node", "Node Application CPU Cores Usage", "CPU"),
+  query("mem-node-app", "sum by(node) (container_memory_working_set_bytes{cluster='',container!=''})", "node", "Node Application Memory Usage", "MEM"),
+  query("net-rcv-node", "sum by (instance) (instance:node_network_receive_bytes_excluding_lo:rate1m{cluster=''})", "instance", "Node Network Receive Throughput", "NET"),
+  query("net-xmt-node", "sum by (instance) (instance:node_network_transmit_bytes_excluding_lo:rate1m{cluster=''})", "instance", "Node Network Transmit Throughput", "NET"),
+
+  # Disk space utilization does not include Minio PV data (Separate PV Disk for Minio)
+  query("disk-util-root-node", "sum by (instance) (node_filesystem_size_bytes{mountpoint='/sysroot'} - node_filesystem_avail_bytes{mountpoint='/sysroot'})", "instance", "Node / space utilization", "DISK_USAGE"),
+  query("disk-util-etcd-node", "sum by (instance) (node_filesystem_size_bytes{mountpoint='/var/lib/etcd'} - node_filesystem_avail_bytes{mountpoint='/var/lib/etcd'})", "instance", "Node /var/lib/etcd space utilization", "DISK_USAGE"),
+  query("disk-util-containers-node", "sum by (instance) (node_filesystem_size_bytes{mountpoint='/var/lib/containers'} - node_filesystem_avail_bytes{mountpoint='/var/lib/containers'})", "instance", "Node /var/lib/containers space utilization", "DISK_USAGE"),
+
+  # Disk Throughput and Iops utilization by node for disk mounting / or /sysroot
+  # Complexity in this query is due to device naming (/dev/sda1 vs sda) and grouping mountpoints to devices
+  query("disk-tput-read-root-node", "sum by (instance) (irate(node_disk_read_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node / Read Throughput", "DISK_TPUT_MB"),
+  query("disk-tput-write-root-node", "sum by (instance) (irate(node_disk_written_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node / Write Throughput", "DISK_TPUT_MB"),
+  query("disk-iops-read-root-node", "sum by (instance) (irate(node_disk_reads_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node / Read Iops", "Iops"),
+  query("disk-iops-write-root-node", "sum by (instance) (irate(node_disk_writes_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/sysroot'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node / Write Iops", "Iops"),
+  # Disk Throughput and Iops utilization by node for disk mounting /var/lib/etcd
+  # /var/lib/etcd is usually placed on a separate nvme disk
+  query("disk-tput-read-etcd-node", "sum by (instance) (irate(node_disk_read_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node /var/lib/etcd Read Throughput", "DISK_TPUT_MB"),
+  query("disk-tput-write-etcd-node", "sum by (instance) (irate(node_disk_written_bytes_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node /var/lib/etcd Write Throughput", "DISK_TPUT_MB"),
+  query("disk-iops-read-etcd-node", "sum by (instance) (irate(node_disk_reads_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node /var/lib/etcd Read Iops", "Iops"),
+  query("disk-iops-write-etcd-node", "sum by (instance) (irate(node_disk_writes_completed_total[5m]) * on(instance,device) group_left(mountpoint) (label_replace(node_filesystem_mount_info{mountpoint='/var/lib/etcd'}, 'device', '$1', 'device', '/dev/(nvme[0-9]+n[0-9]+|[a-z]+).*')))", "instance", "Node /var/lib/etcd Write Iops", "Iops"),
+
+  query("nonterm-pods-node", "sum(kube_pod_status_phase{phase!='Succeeded',phase!='Failed'} * on (namespace, pod, container, uid) group_left(node) kube_pod_info{pod_ip!=''}) by (node)", "node", "Non-terminated pods by Node", "Count"),
+]
+
+CATALOG["resource"] = [
+  query("all", "sum by (instance) (apiserver_storage_objects)", "instance", "All Resources", "Count"),
+  query("namespaces", "sum by (instance) (apiserver_storage_objects{resource='namespaces'})", "instance", "Namespaces", "Count"),
+  query("serviceaccounts", "sum by (instance) (apiserver_storage_objects{resource='serviceaccounts'})", "instance", "Serviceaccounts", "Count"),
+  query("pods", "sum by (instance) (apiserver_storage_objects{resource='pods'})", "instance", "Pods", "Count"),
+  query("replicasets", "sum by (instance) (apiserver_storage_objects{resource='replicasets.apps'})", "instance", "Replicasets", "Count"),
+  query("deployments", "sum by (instance) (apiserver_storage_objects{resource='deployments.apps'})", "instance", "Deployments", "Count"),
+  query("daemonsets", "sum by (instance) (apiserver_storage_objects{resource='daemonsets.apps'})", "instance", "Daemonsets", "Count"),
+  query("statefulsets", "sum by (instance) (apiserver_storage_objects{resource='statefulsets.apps'})", "instance", "Statefulsets", "Count"),
+  query("jobs", "sum by (instance) (apiserver_storage_objects{resource='jobs.batch'})", "instance", "Jobs", "Count"),
+  query("cronjobs", "sum by (instance) (apiserver_storage_objects{resource='cronjobs.batch'})", "instance", "Cronjobs", "Count"),
+  query("endpoints", "sum by (instance) (apiserver_storage_objects{resource='endpoints'})", "instance", "Endpoints", "Count"),
+  query("services", "sum by (instance) (apiserver_storage_objects{resource='services'})", "instance", "Services", "Count"),
+  query("configmaps", "sum by (instance) (apiserver_storage_objects{resource='configmaps'})", "instance", "Configmaps", "Count"),
+  query("secrets", "sum by (instance) (apiserver_storage_objects{resource='secrets'})", "instance", "Secrets", "Count"),
+  query("pvc-usage", "sum by (namespace) (kubelet_volume_stats_used_bytes)", "namespace", "Volume Usage By Namespace", "DISK_USAGE"),
+]
+
+CATALOG["talm"] = [
+  query("talm-cgu", "apiserver_storage_objects{resource='clustergroupupgrades.ran.openshift.io'}", "instance", "ClusterGroupUpgrades Objects", "Count"),
+
+  # TALM CPU/Memory/Network
+  # When TALM is installed via OLM subscription it runs in openshift-operators alongside other
+  # operators, so filter by pod name to isolate TALM metrics
+  query("cpu-talm", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',$TALM_SELECTOR})", "TALM", "TALM CPU Cores Usage", "CPU"),
+  query("mem-talm", "sum(container_memory_working_set_bytes{cluster='',container!='',$TALM_SELECTOR})", "TALM", "TALM Memory Usage", "MEM"),
+  query("net-rcv-talm", "sum(irate(container_network_receive_bytes_total{cluster='',$TALM_SELECTOR}[5m]))", "TALM", "TALM Network Receive Throughput", "NET"),
+  query("net-xmt-talm", "sum(irate(container_network_transmit_bytes_total{cluster='',$TALM_SELECTOR}[5m]))", "TALM", "TALM Network Transmit Throughput", "NET"),
+  # TALM is a single pod thus no need to split by pod
+]
+
+CATALOG["ztp-day2"] = [
+  # AAP Namespace
+  query("cpu-ztp-day2", "sum(node_namespace_pod_container:container_cpu_usage_seconds_total:sum_irate{cluster='',namespace='ztp-day2-automation'})", "ztp-day2-automation", "ztp-day2-automation CPU Cores Usage", "CPU"),
+  query("mem-ztp-day2", "sum(container_memory_working_set_bytes{cluster='',container!='',namespace='ztp-day2-automation'})", "ztp-day2-automation", "ztp-day2-automation Memory Usage", "MEM"),
+  query("net-rcv-ztp-day2", "sum(irate(container_network_receive_bytes_total{cluster='',namespace='ztp-day2-automation'}[5m]))", "ztp-day2-automation", "ztp-day2-automation Network Receive Throughput", "NET"),
+  query("net-xmt-ztp-day2", "sum(irate(container_network_transmit_bytes_total{cluster='',namespace='ztp-day2-automation'}[5m]))", "ztp-day2-automation", "ztp-day2-automation Network Transmit Throughput", "NET"),
+  query("nonterm-pods-ztp-day2", "sum(kube_pod_status_phase{phase!='Succeeded', phase!='Failed', namespace='ztp-day2-automation'})", "non-terminated pods", "Non-terminated pods across ztp-day2-automation namespace", "Count"),
+]
+
+
+# sum by (pod) over a single metric selector, the form of the per pod queries that can share one request per namespace
+POD_SUM_RE = re.compile(r"^sum by \(pod\) \(([A-Za-z_:][A-Za-z0-9_:]*)\{([^{}]*)\}\)$")
+MATCHER_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(=~|!~|!=|=)\s*'([^']*)'\s*$")
+
+
+def parse_pod_sum(expr):
+  # Returns (metric, matchers without pod, pod regex or None) of a mergeable sum by (pod) query, otherwise None
+  match = POD_SUM_RE.match(expr)
+  if not match:
+    return None
+  matchers = []
+  pod_pattern = None
+  for matcher in match.group(2).split(","):
+    m = MATCHER_RE.match(matcher)
+    if not m:
+      return None
+    if m.group(1) == "pod":
+      if m.group(2) != "=~" or pod_pattern is not None:
+        return None
+      pod_pattern = m.group(3)
+    else:
+      matchers.append("{}{}'{}'".format(m.group(1), m.group(2), m.group(3)))
+  if not any(m.startswith("namespace='") for m in matchers):
+    return None
+  return match.group(1), matchers, pod_pattern
+
+
+def plan_queries(present, variables):
+  # Returns the report sections with their query names and titles, and the requests to run. Identical expressions
+  # share a request, and sum by (pod) queries of one metric and namespace differing only by pod regex are merged into
+  # one request whose series are split back out by each query's pod regex.
+  report_data = OrderedDict()
+  requests = OrderedDict()
+  for section, gate in SECTIONS.items():
+    if gate is not None:
+      if gate not in present:
+        continue
+      logger.info("{} found, querying for {} metrics".format(gate, section))
+    report_data[section] = OrderedDict()
+    for entry in CATALOG[section]:
+      if entry["gate"] is not None and entry["gate"] not in present:
+        continue
+      if entry["name"] in report_data[section]:
+        logger.warning("Duplicate query name {} in section {}".format(entry["name"], section))
+        continue
+      report_data[section][entry["name"]] = entry["title"]
+      expr = entry["expr"]
+      for variable, value in variables.items():
+        expr = expr.replace("$" + variable, value)
+      key = (expr, entry["resolution"])
+      if key not in requests:
+        requests[key] = {"expr": expr, "resolution": entry["resolution"], "queries": []}
+      requests[key]["queries"].append(dict(entry, section=section, expr=expr, pod_pattern=None))
+
+  # Group mergeable requests by metric, non pod matchers and resolution
+  groups = OrderedDict()
+  for key, request in requests.items():
+    parsed = parse_pod_sum(request["expr"])
+    if parsed is not None:
+      metric, matchers, pod_pattern = parsed
+      group_key = (metric, tuple(sorted(matchers)), request["resolution"])
+      groups.setdefault(group_key, []).append((key, matchers, pod_pattern))
+
+  merged = {}
+  for (metric, _, resolution), members in groups.items():
+    if len(members) < 2:
+      continue
+    patterns = [pod_pattern for _, _, pod_pattern in members]
+    matchers = list(members[0][1])
+    # An unfiltered member already returns every pod of the namespace
+    if None not in patterns:
+      matchers.append("pod=~'{}'".format("|".join(patterns)))
+    expr = "sum by (pod) ({}{{{}}})".format(metric, ",".join(matchers))
+    request = {"expr": expr, "resolution": resolution, "queries": []}
+    for key, _, pod_pattern in members:
+      for entry in requests[key]["queries"]:
+        request["queries"].append(dict(entry, pod_pattern=pod_pattern))
+      merged[key] = (members[0][0], request)
+
+  planned = []
+  for key, request in requests.items():
+    if key not in merged:
+      planned.append(request)
+    elif merged[key][0] == key:
+      planned.append(merged[key][1])
+  logger.info("Planned {} queries as {} requests".format(sum(len(q) for q in report_data.values()), len(planned)))
+  return report_data, planned
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Typed columnar copies of result csv files. Each table is written as a parquet file beside its csv (same name with a
+# .parquet extension) with timestamp columns typed and run metadata kept in the file schema, so graphing and cross-run
+# comparisons load without parsing csv text. pyarrow is installed from requirements.txt, an environment without it still
+# writes and reads the csv files, which remain the source every script can fall back to.
+
+import json
+import logging
+import os
+import pandas as pd
+
+try:
+  import pyarrow as pa
+  import pyarrow.parquet as pq
+except ImportError:
+  pa = None
+  pq = None
+
+logger = logging.getLogger("acm-deploy-load")
+
+# Schema metadata key holding the run metadata json
+METADATA_KEY = b"acm-deploy-load"
+
+
+def parquet_path(csv_path):
+  return "{}.parquet".format(os.path.splitext(csv_path)[0])
+
+
+def write_results(csv_path, df, metadata=None, datetime_columns=()):
+  # Writes df as parquet beside csv_path, returns the parquet path or "" when pyarrow is not installed
+  if pq is None:
+    return ""
+  df = df.copy()
+  for column in datetime_columns:
+    if column in df.columns:
+      df[column] = pd.to_datetime(df[column], utc=True)
+  table = pa.Table.from_pandas(df, preserve_index=False)
+  schema_metadata = dict(table.schema.metadata or {})
+  schema_metadata[METADATA_KEY] = json.dumps(metadata or {}).encode()
+  table = table.replace_schema_metadata(schema_metadata)
+  path = parquet_path(csv_path)
+  pq.write_table(table, path, compression="zstd")
+  return path
+
+
+def read_results(csv_path, datetime_columns=(), **csv_kwargs):
+  # Reads the parquet copy of csv_path when it is at least as new as the csv, otherwise the csv with datetime_columns
+  # parsed to UTC timestamps
+  path = parquet_path(csv_path)
+  if pq is not None and os.path.exists(path):
+    if not os.path.exists(csv_path) or os.path.getmtime(path) >= os.path.getmtime(csv_path):
+      return pq.read_table(path).to_pandas()
+  df = pd.read_csv(csv_path, **csv_kwargs)
+  for column in datetime_columns:
+    if column in df.columns:
+      df[column] = pd.to_datetime(df[column], utc=True)
+  return df
+
+
+def read_metadata(csv_path):
+  # Returns the run metadata of the parquet copy of csv_path, empty when there is none
+  path = parquet_path(csv_path)
+  if pq is None or not os.path.exists(path):
+    return {}
+  schema_metadata = pq.read_schema(path).metadata or {}
+  return json.loads(schema_metadata.get(METADATA_KEY, b"{}"))
+
+
+def convert_csv(csv_path, metadata=None, datetime_columns=(), **csv_kwargs):
+  # Writes the parquet copy of an existing csv, for csv files appended to row by row while they are analyzed
+  if pq is None or not os.path.exists(csv_path):
+    return ""
+  return write_results(csv_path, pd.read_csv(csv_path, **csv_kwargs), metadata, datetime_columns)
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Concurrent collection of resources from deployed (spoke) clusters for the per-cluster analyzers. Each cluster's
+# requests run in order through a pooled kube client built from {kubeconfigs}/{cluster}/kubeconfig, bounded by a time
+# budget per cluster. Every result is written to {raw_data_dir}/{cluster}-{name}.json as it arrives, an empty file
+# records a failed fetch and a missing file a skipped request, so --offline-process reads what a live run wrote.
+#
+# The outcome of each cluster is appended to {raw_data_dir}/manifest.jsonl once all of its requests finish, the last
+# line of a cluster wins. A run can be resumed into the same raw data directory, collecting only clusters the manifest
+# lacks, clusters whose requests failed (--retry-unreachable) or clusters collected too long ago (--stale-after).
+
+import calendar
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import logging
+import os
+import time
+from utils.kube import close_client
+from utils.kube import get_client
+
+logger = logging.getLogger("acm-deploy-load")
+
+# Clusters collected between progress messages
+progress_interval = 100
+
+manifest_file = "manifest.jsonl"
+
+
+def spoke_request(name, api_version, resource, object_name="", namespace="", when=None):
+  """Describe one request made of every cluster, a list unless object_name is set.
+
+  when(fetched) is passed the earlier results of the same cluster by request name, None for a failed fetch, and
+  returns whether this request runs.
+  """
+  return {
+    "name": name,
+    "api_version": api_version,
+    "resource": resource,
+    "object_name": object_name,
+    "namespace": namespace,
+    "when": when
+  }
+
+
+def add_collector_arguments(parser):
+  parser.add_argument("-c", "--concurrency", type=int, default=64, help="Number of clusters collected concurrently")
+  parser.add_argument("--spoke-timeout", type=int, default=120,
+                      help="Seconds allowed to collect each cluster before recording it unreachable")
+  parser.add_argument("--resume", action="store_true", default=False,
+                      help="Continue collecting into the raw data directory, skipping clusters already collected")
+  parser.add_argument("--retry-unreachable", action="store_true", default=False,
+                      help="Collect again the clusters of the raw data directory that were unreachable")
+  parser.add_argument("--stale-after", type=int, default=0,
+                      help="With --resume, collect again clusters collected more than this many seconds ago, 0 never")
+
+
+def resuming(cliargs):
+  # Resumed runs reuse an existing raw data directory, including its hub data, and collect only what is missing
+  return cliargs.resume or cliargs.retry_unreachable
+
+
+def raw_file(raw_data_dir, cluster, name):
+  return "{}/{}-{}.json".format(raw_data_dir, cluster, name)
+
+
+def read_raw(raw_data_dir, cluster, name):
+  # Returns the stored object, "" when the fetch failed
+  with open(raw_file(raw_data_dir, cluster, name), "r") as raw_data_file:
+    raw_data = raw_data_file.read()
+  if raw_data == "":
+    return ""
+  return json.loads(raw_data)
+
+
+def read_manifest(raw_data_dir):
+  """Return the latest manifest entry of each cluster."""
+  entries = {}
+  path = os.path.join(raw_data_dir, manifest_file)
+  if not os.path.exists(path):
+    return entries
+  with open(path, "r") as m_file:
+    for line in m_file:
+      try:
+        entry = json.loads(line)
+      except ValueError:
+        # A run killed mid write leaves a partial last line
+        continue
+      entries[entry["cluster"]] = entry
+  return entries
+
+
+class SpokeCollector():
+  def __init__(self, kubeconfigs, raw_data_dir, requests, concurrency=64, timeout=120):
+    self.kubeconfigs = kubeconfigs
+    self.raw_data_dir = raw_data_dir
+    self.requests = requests
+    self.concurrency = concurrency
+    self.timeout = timeout
+
+  def _fetch(self, client, request, deadline):
+    # Two attempts sharing what remains of the cluster's time budget
+    rc, data = 1, {}
+    for attempt in range(2):
+      remaining = deadline - time.time()
+      if remaining <= 0:
+        break
+      if request["object_name"] != "":
+        rc, data = client.get(request["api_version"], request["resource"], request["object_name"],
+            request["namespace"], timeout=remaining / (2 - attempt))
+      else:
+        rc, data = client.list(request["api_version"], request["resource"], request["namespace"],
+            timeout=remaining / (2 - attempt))
+      if rc == 0:
+        break
+    return rc, data
+
+  def collect_cluster(self, cluster):
+    """Run every request of one cluster, returns its start time and the rc of each request run by name."""
+    started = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    deadline = time.time() + self.timeout
+    kubeconfig = "{}/{}/kubeconfig".format(self.kubeconfigs, cluster)
+    try:
+      client = get_client(kubeconfig)
+    except Exception as e:
+      logger.error("Cluster {} kubeconfig {}: {}".format(cluster, kubeconfig, e))
+      client = None
+
+    fetched = {}
+    results = {}
+    for request in self.requests:
+      if request["when"] is not None and not request["when"](fetched):
+        continue
+      rc, data = 1, {}
+      if client is not None:
+        rc, data = self._fetch(client, request, deadline)
+        if rc != 0:
+          logger.error("Cluster {} {} {} rc: {}".format(cluster, "get" if request["object_name"] else "list",
+              request["resource"], rc))
+      fetched[request["name"]] = data if rc == 0 else None
+      results[request["name"]] = rc
+      with open(raw_file(self.raw_data_dir, cluster, request["name"]), "w") as raw_data_file:
+        if rc == 0:
+          json.dump(data, raw_data_file)
+    if client is not None:
+      close_client(kubeconfig)
+    return started, results
+
+  def pending(self, clusters, resume=False, retry_unreachable=False, stale_after=0):
+    """Select the clusters to collect, all of them unless resuming."""
+    if not resume and not retry_unreachable:
+      return clusters
+    manifest = read_manifest(self.raw_data_dir)
+    now = time.time()
+    missing = []
+    unreachable = []
+    stale = []
+    for cluster in clusters:
+      entry = manifest.get(cluster)
+      if entry is None:
+        missing.append(cluster)
+      elif entry["status"] != "collected":
+        if retry_unreachable:
+          unreachable.append(cluster)
+      elif resume and stale_after > 0 and now - calendar.timegm(
+          time.strptime(entry["end"], "%Y-%m-%dT%H:%M:%SZ")) > stale_after:
+        stale.append(cluster)
+    logger.info("Manifest has {} of {} clusters, collecting {} missing, {} unreachable and {} stale".format(
+        len(set(clusters) & set(manifest)), len(clusters), len(missing), len(unreachable), len(stale)))
+    return missing + unreachable + stale
+
+  def collect(self, clusters, resume=False, retry_unreachable=False, stale_after=0):
+    """Collect every pending cluster concurrently, returns each collected cluster's request results."""
+    clusters = self.pending(clusters, resume, retry_unreachable, stale_after)
+    logger.info("Collecting {} from {} clusters, {} at a time".format(
+        ", ".join(request["name"] for request in self.requests), len(clusters), self.concurrency))
+    start_time = time.time()
+    results = {}
+    unreachable = 0
+    manifest_path = os.path.join(self.raw_data_dir, manifest_file)
+    torn = False
+    if os.path.exists(manifest_path) and os.path.getsize(manifest_path) > 0:
+      with open(manifest_path, "rb") as m_file:
+        m_file.seek(-1, os.SEEK_END)
+        torn = m_file.read(1) != b"\n"
+    with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="spoke") as collect_executor, \
+        open(manifest_path, "a") as m_file:
+      if torn:
+        # Start after the partial line a killed run left behind
+        m_file.write("\n")
+      futures = {collect_executor.submit(self.collect_cluster, cluster): cluster for cluster in clusters}
+      for future in as_completed(futures):
+        cluster = futures[future]
+        started, results[cluster] = future.result()
+        status = "collected"
+        if any(rc != 0 for rc in results[cluster].values()):
+          status = "unreachable"
+          unreachable += 1
+        m_file.write("{}\n".format(json.dumps({"cluster": cluster, "status": status, "start": started,
+            "end": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "requests": results[cluster]})))
+        m_file.flush()
+        if len(results) % progress_interval == 0 or len(results) == len(futures):
+          logger.info("Collected {}/{} clusters, {} unreachable, {}s".format(
+              len(results), len(futures), unreachable, round(time.time() - start_time, 1)))
+    return results
@@ -13,9 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import json
 import logging
-from utils.command import command
+from utils.kube import get_client
 
 
 logger = logging.getLogger("acm-deploy-load")
@@ -23,10 +22,10 @@ logger = logging.getLogger("acm-deploy-load")
 
 def detect_talm_csv(kubeconfig):
   logger.info("Checking for TALM ClusterServiceVersion in openshift-operators")
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "csv", "-n", "openshift-operators", "-o", "json"]
-  rc, output = command(oc_cmd, False, retries=3, no_log=True)
+  rc, csv_data = get_client(kubeconfig).list("operators.coreos.com/v1alpha1", "clusterserviceversions",
+      "openshift-operators", retries=3)
   if rc == 0:
-    for item in json.loads(output).get("items", []):
+    for item in csv_data.get("items", []):
       name = item.get("metadata", {}).get("name", "")
       if "topology-aware-lifecycle-manager" in name:
         logger.info("Detected TALM CSV in openshift-operators: {}".format(name))
@@ -39,13 +38,12 @@ def detect_talm_minor(kubeconfig, default_talm_version="4.14", dry_run=False):
   talm_version = default_talm_version
   logger.info("Detecting TALM version by image tag")
   # Try repo install (openshift-cluster-group-upgrades) — image tag carries version
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "deploy", "-n", "openshift-cluster-group-upgrades", "cluster-group-upgrades-controller-manager-v2", "-o", "json"]
-  rc, output = command(oc_cmd, dry_run, retries=3, no_log=True)
+  rc, td_data = get_client(kubeconfig).get("apps/v1", "deployments", "cluster-group-upgrades-controller-manager-v2",
+      "openshift-cluster-group-upgrades", retries=3, dry_run=dry_run)
   if rc != 0:
-    logger.warning("talm, oc get deploy -n openshift-cluster-group-upgrades rc: {}".format(rc))
+    logger.warning("talm, get deploy -n openshift-cluster-group-upgrades rc: {}".format(rc))
   else:
     if not dry_run:
-      td_data = json.loads(output)
       talm_image_ver = ""
       if "spec" in td_data and "template" in td_data["spec"] and "spec" in td_data["spec"]["template"]:
         for container in td_data["spec"]["template"]["spec"]["containers"]:
@@ -60,10 +58,10 @@ def detect_talm_minor(kubeconfig, default_talm_version="4.14", dry_run=False):
   # OLM/subscription install places TALM in openshift-operators with a SHA digest
   # instead of a version tag; fall back to the ClusterServiceVersion name
   logger.info("Detecting TALM version from ClusterServiceVersion (OLM install)")
-  oc_cmd = ["oc", "--kubeconfig", kubeconfig, "get", "csv", "-n", "openshift-operators", "-o", "json"]
-  rc, output = command(oc_cmd, dry_run, retries=3, no_log=True)
+  rc, csv_data = get_client(kubeconfig).list("operators.coreos.com/v1alpha1", "clusterserviceversions",
+      "openshift-operators", retries=3, dry_run=dry_run)
   if rc == 0 and not dry_run:
-    for item in json.loads(output).get("items", []):
+    for item in csv_data.get("items", []):
       name = item.get("metadata", {}).get("name", "")
       if "topology-aware-lifecycle-manager" in name and ".v" in name:
         talm_csv_ver = name.split(".v")[-1]
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+#  Copyright 2026 Red Hat
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# 1 minute bucket series of how many objects are in a state over time. Each object spends an interval of buckets in a
+# state, the intervals are counted with a difference array (+1 at each start, -1 after each end) summed down the
+# buckets, so the cost follows the number of objects and buckets instead of their product.
+
+import numpy as np
+
+
+def minute_index(timestamps, start_time):
+  """Return the 1 minute bucket, counted from start_time, of each timestamp in a datetime Series."""
+  return ((timestamps.dt.floor("min") - start_time).dt.total_seconds() // 60).to_numpy(dtype=np.int64)
+
+
+def minute_counts(start_minutes, end_minutes, bucket_count, groups=None, group_count=1):
+  """Count the intervals covering each bucket, by group in group_count columns when groups are given.
+
+  Intervals run from start_minutes through end_minutes inclusive, an interval ending before it starts covers no
+  buckets.
+  """
+  covering = end_minutes >= start_minutes
+  grouped = groups is not None
+  if not grouped:
+    groups = np.zeros(len(start_minutes), dtype=np.int64)
+  counts = np.zeros((bucket_count + 1, group_count), dtype=np.int64)
+  np.add.at(counts, (start_minutes[covering], groups[covering]), 1)
+  np.add.at(counts, (end_minutes[covering] + 1, groups[covering]), -1)
+  counts = np.cumsum(counts[:-1], axis=0)
+  if not grouped:
+    return counts[:, 0]
+  return counts
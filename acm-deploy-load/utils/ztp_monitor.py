@@ -13,22 +13,308 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import json
 import logging
-import time
 import os
-from utils.command import command
+from utils.kube import get_client
+from utils.output import assemble_stats
+from utils.output import log_write
 import time
+from threading import Lock
 from threading import Thread
 import traceback
 
 
 logger = logging.getLogger("acm-deploy-load")
 
+# Counters derived from hub objects, in monitor_data.csv column order
+monitor_counters = [
+  "cluster_init",
+  "cluster_notstarted",
+  "node_booted",
+  "node_discovered",
+  "cluster_installing",
+  "cluster_install_failed",
+  "cluster_install_completed",
+  "managed",
+  "policy_init",
+  "policy_notstarted",
+  "policy_applying",
+  "policy_timedout",
+  "policy_compliant",
+  "playbook_notstarted",
+  "playbook_running",
+  "playbook_completed"
+]
+
+# Seconds taken to list each resource per sample, appended after the counters in monitor_data.csv
+fetch_columns = [
+  "clusterinstall_fetch",
+  "baremetalhost_fetch",
+  "agent_fetch",
+  "managedcluster_fetch",
+  "clustergroupupgrades_fetch"
+]
+
+# Resources monitored on the hub cluster
+# projection is the compact form requested from the API server (see utils/kube.py), agents are only counted so
+# metadata is enough, baremetalhosts and managedclusters carry the fields counted in their printer columns, and
+# clusterinstalls and clustergroupupgrades need their conditions so they are returned whole
+monitor_resources = {
+  "aci": {
+    "resource": "agentclusterinstall",
+    "api_version": "extensions.hive.openshift.io/v1beta1",
+    "plural": "agentclusterinstalls",
+    "namespace": "",
+    "fetch_column": "clusterinstall_fetch",
+    "projection": ""
+  },
+  "ici": {
+    "resource": "imageclusterinstall",
+    "api_version": "extensions.hive.openshift.io/v1alpha1",
+    "plural": "imageclusterinstalls",
+    "namespace": "",
+    "fetch_column": "clusterinstall_fetch",
+    "projection": ""
+  },
+  "bmh": {
+    "resource": "baremetalhost",
+    "api_version": "metal3.io/v1alpha1",
+    "plural": "baremetalhosts",
+    "namespace": "",
+    "fetch_column": "baremetalhost_fetch",
+    "projection": "table"
+  },
+  "agent": {
+    "resource": "agent",
+    "api_version": "agent-install.openshift.io/v1beta1",
+    "plural": "agents",
+    "namespace": "",
+    "fetch_column": "agent_fetch",
+    "projection": "metadata"
+  },
+  "mc": {
+    "resource": "managedcluster",
+    "api_version": "cluster.open-cluster-management.io/v1",
+    "plural": "managedclusters",
+    "namespace": "",
+    "fetch_column": "managedcluster_fetch",
+    "projection": "table"
+  },
+  "cgu": {
+    "resource": "clustergroupupgrades",
+    "api_version": "ran.openshift.io/v1alpha1",
+    "plural": "clustergroupupgrades",
+    "namespace": "ztp-install",
+    "fetch_column": "clustergroupupgrades_fetch",
+    "projection": ""
+  }
+}
+
+# Per-cluster states in the order a cluster normally passes through them, each is recorded the first time it is observed
+timeline_states = [
+  "applied",
+  "init",
+  "booted",
+  "discovered",
+  "installing",
+  "completed",
+  "install_failed",
+  "managed",
+  "policy_applying",
+  "policy_compliant",
+  "policy_timedout",
+  "playbook_completed"
+]
+
+# Counter an object contributes to and the cluster state it marks
+counter_states = {
+  "cluster_init": "init",
+  "node_booted": "booted",
+  "node_discovered": "discovered",
+  "cluster_installing": "installing",
+  "cluster_install_completed": "completed",
+  "cluster_install_failed": "install_failed",
+  "managed": "managed",
+  "policy_applying": "policy_applying",
+  "policy_compliant": "policy_compliant",
+  "policy_timedout": "policy_timedout",
+  "playbook_completed": "playbook_completed"
+}
+
+# Seconds a single watch request is held open before it is re-established from the last resourceVersion
+watch_timeout = 300
+
+
+# Per-object counter contributions, kept consistent under a lock so a sample is a cheap read of the counters
+class ZTPState():
+  def __init__(self):
+    self.lock = Lock()
+    self.objects = {}
+    self.counters = dict.fromkeys(monitor_counters, 0)
+
+  def _add(self, counts, sign):
+    for counter, value in counts.items():
+      self.counters[counter] += sign * value
+
+  def set(self, kind, uid, counts):
+    with self.lock:
+      objects = self.objects.setdefault(kind, {})
+      if uid in objects:
+        self._add(objects[uid], -1)
+      objects[uid] = counts
+      self._add(counts, 1)
+
+  def delete(self, kind, uid):
+    with self.lock:
+      objects = self.objects.setdefault(kind, {})
+      if uid in objects:
+        self._add(objects.pop(uid), -1)
+
+  def replace(self, kind, objects):
+    # Replaces every object of a kind, dropping any object no longer listed
+    # Contributions that are the same dict as before belong to unchanged objects and are left as they are
+    with self.lock:
+      previous = self.objects.get(kind, {})
+      for uid, counts in previous.items():
+        if uid not in objects:
+          self._add(counts, -1)
+      for uid, counts in objects.items():
+        if uid in previous:
+          if previous[uid] is counts:
+            continue
+          self._add(previous[uid], -1)
+        self._add(counts, 1)
+      self.objects[kind] = objects
+
+  def snapshot(self):
+    with self.lock:
+      return dict(self.counters)
+
+
+# First observed time of each state per cluster, every new transition is appended to the transitions file as it is seen
+class ZTPTimeline():
+  def __init__(self, transitions_file=""):
+    self.lock = Lock()
+    self.clusters = {}
+    self.transitions_file = transitions_file
+    self.t_file = None
+    if transitions_file != "":
+      self.t_file = open(transitions_file, "w")
+      self.t_file.write("cluster,state,timestamp\n")
+      self.t_file.flush()
+
+  def observe(self, cluster, state, timestamp):
+    with self.lock:
+      if cluster not in self.clusters:
+        self.clusters[cluster] = {}
+      if state in self.clusters[cluster]:
+        return
+      self.clusters[cluster][state] = timestamp
+      if self.t_file is not None:
+        self.t_file.write("{},{},{}\n".format(
+            cluster, state, datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")))
+        self.t_file.flush()
+
+  def latencies(self):
+    # Seconds from applied until each later state, only for clusters whose applied time is known
+    with self.lock:
+      latencies = {state: [] for state in timeline_states[1:]}
+      for states in self.clusters.values():
+        if "applied" not in states:
+          continue
+        for state in latencies:
+          if state in states:
+            latencies[state].append(round(states[state] - states["applied"], 1))
+      return latencies
+
+  def write_stats(self, stats_file):
+    latencies = self.latencies()
+    with open(stats_file, "w") as s_file:
+      log_write(s_file, "Stats on per-cluster transitions since applied")
+      for state in latencies:
+        log_write(s_file, "{} Count: {}".format(state, len(latencies[state])))
+        log_write(s_file, "{} Min/Avg/50p/95p/99p/Max (seconds): {}".format(state, assemble_stats(latencies[state])))
+        log_write(s_file, "{} Min/Avg/50p/95p/99p/Max: {}".format(state, assemble_stats(latencies[state], False)))
+
+  def close(self):
+    with self.lock:
+      if self.t_file is not None:
+        self.t_file.close()
+        self.t_file = None
+
+
+# Keeps ZTPState current for one kind with an initial list followed by watch events
+class ZTPWatcher(Thread):
+  def __init__(self, kind, classify, state, kubeconfig, projection=""):
+    super(ZTPWatcher, self).__init__(name="watch-{}".format(kind))
+    self.kind = kind
+    self.resource = monitor_resources[kind]
+    self.classify = classify
+    self.state = state
+    self.client = get_client(kubeconfig)
+    self.projection = projection
+    self.signal = True
+
+  def _list(self):
+    objects = {}
+    for rc, page in self.client.list_pages(self.resource["api_version"], self.resource["plural"], self.resource["namespace"],
+        retries=3, projection=self.projection):
+      if rc != 0:
+        logger.error("acm-deploy-load, list {} rc: {}".format(self.resource["resource"], rc))
+        return None
+      for item in page["items"]:
+        objects[item["metadata"]["uid"]] = self.classify(self.kind, item)
+    self.state.replace(self.kind, objects)
+    logger.info("Listed {} {} objects at resourceVersion {}".format(
+        len(objects), self.resource["resource"], page["metadata"]["resourceVersion"]))
+    return page["metadata"]["resourceVersion"]
+
+  def _watch(self, resource_version):
+    # Returns the resourceVersion to resume the watch from, or None when a relist is required
+    for event in self.client.watch(self.resource["api_version"], self.resource["plural"], self.resource["namespace"],
+        resource_version, watch_timeout, self.projection):
+      if not self.signal:
+        break
+      item = event["object"]
+      if event["type"] == "ERROR":
+        if item.get("code") == 410:
+          logger.info("{} watch resourceVersion {} expired, relisting".format(self.kind, resource_version))
+        else:
+          logger.warning("{} watch error: {}".format(self.kind, item))
+        return None
+      if event["type"] in ("ADDED", "MODIFIED"):
+        self.state.set(self.kind, item["metadata"]["uid"], self.classify(self.kind, item))
+      elif event["type"] == "DELETED":
+        self.state.delete(self.kind, item["metadata"]["uid"])
+      resource_version = item["metadata"]["resourceVersion"]
+    return resource_version
+
+  def stop(self):
+    self.signal = False
+
+  def run(self):
+    resource_version = None
+    while self.signal:
+      try:
+        if resource_version is None:
+          resource_version = self._list()
+          if resource_version is None:
+            time.sleep(5)
+            continue
+        resource_version = self._watch(resource_version)
+      except Exception as e:
+        # Nothing supervises this thread, so a bad event or object forces a relist instead of freezing the counters
+        logger.error("Error in {} watch: {}".format(self.kind, e))
+        logger.error('\n{}'.format(traceback.format_exc()))
+        resource_version = None
+        time.sleep(5)
+
 
 class ZTPMonitor(Thread):
-  def __init__(self, method, talm_minor, monitor_data, csv_file, dry_run, sample_interval, kubeconfig):
+  def __init__(self, method, talm_minor, monitor_data, csv_file, dry_run, sample_interval, kubeconfig, watch=False,
+      projection=True, transitions_file="", adaptive=False, sample_interval_min=10, sample_interval_max=300):
     super(ZTPMonitor, self).__init__()
     if method in ["ai-manifest", "ai-clusterinstance", "ai-clusterinstance-gitops", "ai-siteconfig-gitops"]:
       self.method = "agent"
@@ -39,304 +325,284 @@ class ZTPMonitor(Thread):
     self.csv_file = csv_file
     self.dry_run = dry_run
     self.sample_interval = sample_interval
+    self.adaptive = adaptive
+    self.sample_interval_min = sample_interval_min
+    self.sample_interval_max = sample_interval_max
     self.kubeconfig = kubeconfig
+    self.client = get_client(kubeconfig)
+    self.watch = watch
+    self.projection = projection
+    self.state = ZTPState()
+    self.timeline = ZTPTimeline(transitions_file)
+    # resourceVersion and counters of each listed object by kind and uid, so unchanged objects are not reclassified
+    self.classified = {}
     self.signal = True
 
-  def _real_run(self):
-    logger.info("Starting ZTP Monitor")
+  def _kinds(self):
+    if self.method == "agent":
+      # Discovered agents are only collected for assisted installs
+      return ["aci", "bmh", "agent", "mc", "cgu"]
+    return ["ici", "bmh", "mc", "cgu"]
 
-    with open(self.csv_file, "w") as csv_file:
-      csv_file.write("date,cluster_applied,cluster_init,cluster_notstarted,node_booted,node_discovered,cluster_installing,cluster_install_failed,cluster_install_completed,managed,policy_init,policy_notstarted,policy_applying,policy_timedout,policy_compliant,playbook_notstarted,playbook_running,playbook_completed\n")
+  def _projection(self, kind):
+    if self.projection:
+      return monitor_resources[kind]["projection"]
+    return ""
 
-    while self.signal:
-      start_sample_time = time.time()
+  def _unproject(self, kind, item):
+    # Rebuilds the fields _classify reads from the printer columns of a table projected object
+    if "columns" not in item:
+      return item
+    columns = item.pop("columns")
+    if kind == "bmh":
+      item["status"] = {"provisioning": {"state": columns.get("State") or ""}}
+    elif kind == "mc":
+      item["status"] = {"conditions": [{"type": "ManagedClusterConditionAvailable", "status": columns.get("Available", "")}]}
+    return item
 
-      if self.method == "agent":
-        # Get agentclusterinstall data
-        oc_cmd = ["oc", "--kubeconfig", self.kubeconfig, "get", "agentclusterinstall", "-A", "-o", "json"]
-        rc, output = command(oc_cmd, self.dry_run, retries=3, no_log=True)
-        if rc != 0:
-          logger.error("acm-deploy-load, oc get agentclusterinstall rc: {}".format(rc))
-        else:
-          if self.dry_run:
-            aci_data = {"items": []}
-          else:
-            try:
-              aci_data = json.loads(output)
-            except json.decoder.JSONDecodeError:
-              logger.warning("aci JSONDecodeError: {}".format(output[:2500]))
-      elif self.method == "image":
-        # Get imageclusterinstall data
-        oc_cmd = ["oc", "--kubeconfig", self.kubeconfig, "get", "imageclusterinstall", "-A", "-o", "json"]
-        rc, output = command(oc_cmd, self.dry_run, retries=3, no_log=True)
-        if rc != 0:
-          logger.error("acm-deploy-load, oc get imageclusterinstall rc: {}".format(rc))
-        else:
-          if self.dry_run:
-            ici_data = {"items": []}
+  def _classify(self, kind, item):
+    # Returns the counters an object contributes to
+    counts = {}
+    item = self._unproject(kind, item)
+    if kind == "aci":
+      if item["metadata"]["name"] == "local-agent-cluster-cluster-install":
+        logger.debug("aci: Skipping local-agent-cluster-cluster-install")
+        return counts
+      if item["metadata"]["name"] == "local-cluster":
+        logger.debug("aci: Skipping local-cluster")
+        return counts
+      counts["cluster_init"] = 1
+      if "status" in item and "conditions" in item["status"]:
+        for condition in item["status"]["conditions"]:
+          if "type" in condition:
+            if condition["type"] == "Completed":
+              if "reason" in condition:
+                logger.debug("ACI: {} is {}".format(item["metadata"]["name"], condition["reason"]))
+                if condition["reason"] == "InstallationNotStarted":
+                  counts["cluster_notstarted"] = 1
+                elif condition["reason"] == "InstallationInProgress":
+                  counts["cluster_installing"] = 1
+                elif condition["reason"] == "InstallationFailed":
+                  counts["cluster_install_failed"] = 1
+                elif condition["reason"] == "InstallationCompleted":
+                  counts["cluster_install_completed"] = 1
+                else:
+                  logger.info("aci: {}: Unrecognized Completed Reason: {}".format(item["metadata"]["name"], condition["reason"]))
+                break
+              else:
+                logger.warning("reason missing from condition: {}".format(condition))
           else:
-            try:
-              ici_data = json.loads(output)
-            except json.decoder.JSONDecodeError:
-              logger.warning("ici JSONDecodeError: {}".format(output[:2500]))
-
-      # Get baremetalhost data
-      oc_cmd = ["oc", "--kubeconfig", self.kubeconfig, "get", "baremetalhost", "-A", "-o", "json"]
-      rc, output = command(oc_cmd, self.dry_run, retries=3, no_log=True)
-      if rc != 0:
-        logger.error("acm-deploy-load, oc get baremetalhost rc: {}".format(rc))
+            logger.warning("aci: type missing from condition(item): {}".format(item))
+            logger.warning("aci: type missing from condition(condition): {}".format(condition))
       else:
-        if self.dry_run:
-          bmh_data = {"items": []}
-        else:
-          try:
-            bmh_data = json.loads(output)
-          except json.decoder.JSONDecodeError:
-            logger.warning("bmh JSONDecodeError: {}".format(output[:2500]))
-
-      if self.method == "agent":
-        # Get agent data
-        oc_cmd = ["oc", "--kubeconfig", self.kubeconfig, "get", "agent", "-A", "-o", "json"]
-        rc, output = command(oc_cmd, self.dry_run, retries=3, no_log=True)
-        if rc != 0:
-          logger.error("acm-deploy-load, oc get agent rc: {}".format(rc))
-        else:
-          if self.dry_run:
-            agent_data = {"items": []}
+        logger.warning("status or conditions not found in agentclusterinstall object: {}".format(item))
+    elif kind == "ici":
+      counts["cluster_init"] = 1
+      if "status" in item and "conditions" in item["status"]:
+        for condition in item["status"]["conditions"]:
+          if "type" in condition:
+            if condition["type"] == "Completed":
+              if "reason" in condition:
+                logger.debug("ICI: {} is {}".format(item["metadata"]["name"], condition["reason"]))
+                if condition["reason"] == "Unknown":
+                  counts["cluster_notstarted"] = 1
+                elif condition["reason"] == "ClusterInstallationInProgress":
+                  counts["cluster_installing"] = 1
+                elif condition["reason"] == "ClusterInstallationTimedOut":
+                  counts["cluster_install_failed"] = 1
+                elif condition["reason"] == "ClusterInstallationSucceeded":
+                  counts["cluster_install_completed"] = 1
+                else:
+                  logger.info("ici: {}: Unrecognized Completed Reason: {}".format(item["metadata"]["name"], condition["reason"]))
+                break
+              else:
+                logger.warning("reason missing from condition: {}".format(condition))
           else:
-            try:
-              agent_data = json.loads(output)
-            except json.decoder.JSONDecodeError:
-              logger.warning("agent JSONDecodeError: {}".format(output[:2500]))
-      elif self.method == "image":
-        # No discovered agents collected for image based installs
-        agent_data = {"items": []}
-
-      # Get managedcluster data
-      oc_cmd = ["oc", "--kubeconfig", self.kubeconfig, "get", "managedcluster", "-A", "-o", "json"]
-      rc, output = command(oc_cmd, self.dry_run, retries=3, no_log=True)
-      if rc != 0:
-        logger.error("acm-deploy-load, oc get managedcluster rc: {}".format(rc))
+            logger.warning("ici: type missing from condition(item): {}".format(item))
+            logger.warning("ici: type missing from condition(condition): {}".format(condition))
       else:
-        if self.dry_run:
-          mc_data = {"items": []}
-        else:
-          try:
-            mc_data = json.loads(output)
-          except json.decoder.JSONDecodeError:
-            logger.warning("mc JSONDecodeError: {}".format(output[:2500]))
-
-      # Get clustergroupupgrades data
-      oc_cmd = ["oc", "--kubeconfig", self.kubeconfig, "get", "clustergroupupgrades", "-n", "ztp-install", "-o", "json"]
-      rc, output = command(oc_cmd, self.dry_run, retries=3, no_log=True)
-      if rc != 0:
-        logger.error("acm-deploy-load, oc get clustergroupupgrades rc: {}".format(rc))
+        logger.warning("status or conditions not found in imageclusterinstall object: {}".format(item))
+    elif kind == "bmh":
+      if "status" in item and "provisioning" in item["status"] and "state" in item["status"]["provisioning"]:
+        if item["status"]["provisioning"]["state"] in ("inspecting", "provisioning", "preparing", "provisioned"):
+          logger.debug("BMH: {} is {}".format(item["metadata"]["name"], item["status"]["provisioning"]["state"]))
+          counts["node_booted"] = 1
       else:
-        if self.dry_run:
-          cgu_data = {"items": []}
-        else:
-          try:
-            cgu_data = json.loads(output)
-          except json.decoder.JSONDecodeError:
-            logger.warning("cgu JSONDecodeError: {}".format(output[:2500]))
-
-      cluster_init = 0
-      cluster_notstarted = 0
-      node_booted = 0
-      node_discovered = len(agent_data["items"])
-      cluster_installing = 0
-      cluster_install_failed = 0
-      cluster_install_completed = 0
-      cluster_managed = 0
-      cluster_policy_init = 0
-      cluster_policy_notstarted = 0
-      cluster_policy_applying = 0
-      cluster_policy_timedout = 0
-      cluster_policy_compliant = 0
-      cluster_playbook_notstarted = 0
-      cluster_playbook_running = 0
-      cluster_playbook_completed = 0
-
-
-      if self.method == "agent":
-        # Parse agentclusterinstall data
-        for item in aci_data["items"]:
-          if item["metadata"]["name"] == "local-agent-cluster-cluster-install":
-            logger.debug("aci: Skipping local-agent-cluster-cluster-install")
-            continue
-          if item["metadata"]["name"] == "local-cluster":
-            logger.debug("aci: Skipping local-cluster")
-            continue
-          cluster_init += 1
-          if "status" in item and "conditions" in item["status"]:
-            for condition in item["status"]["conditions"]:
-              if "type" in condition:
-                if condition["type"] == "Completed":
-                  if "reason" in condition:
-                    logger.debug("ACI: {} is {}".format(item["metadata"]["name"], condition["reason"]))
-                    if condition["reason"] == "InstallationNotStarted":
-                      cluster_notstarted += 1
-                    elif condition["reason"] == "InstallationInProgress":
-                      cluster_installing += 1
-                    elif condition["reason"] == "InstallationFailed":
-                      cluster_install_failed += 1
-                    elif condition["reason"] == "InstallationCompleted":
-                      cluster_install_completed += 1
-                    else:
-                      logger.info("aci: {}: Unrecognized Completed Reason: {}".format(item["metadata"]["name"], condition["reason"]))
-                    break
-                  else:
-                    logger.warning("reason missing from condition: {}".format(condition))
-              else:
-                logger.warning("aci: type missing from condition(item): {}".format(item))
-                logger.warning("aci: type missing from condition(condition): {}".format(condition))
-          else:
-            logger.warning("status or conditions not found in agentclusterinstall object: {}".format(item))
-      elif self.method == "image":
-        # Parse imageclusterinstall data
-        for item in ici_data["items"]:
-          cluster_init += 1
-          if "status" in item and "conditions" in item["status"]:
-            for condition in item["status"]["conditions"]:
-              if "type" in condition:
-                if condition["type"] == "Completed":
-                  if "reason" in condition:
-                    logger.debug("ICI: {} is {}".format(item["metadata"]["name"], condition["reason"]))
-                    if condition["reason"] == "Unknown":
-                      cluster_notstarted += 1
-                    elif condition["reason"] == "ClusterInstallationInProgress":
-                      cluster_installing += 1
-                    elif condition["reason"] == "ClusterInstallationTimedOut":
-                      cluster_install_failed += 1
-                    elif condition["reason"] == "ClusterInstallationSucceeded":
-                      cluster_install_completed += 1
-                    else:
-                      logger.info("ici: {}: Unrecognized Completed Reason: {}".format(item["metadata"]["name"], condition["reason"]))
-                    break
-                  else:
-                    logger.warning("reason missing from condition: {}".format(condition))
-              else:
-                logger.warning("ici: type missing from condition(item): {}".format(item))
-                logger.warning("ici: type missing from condition(condition): {}".format(condition))
+        logger.warning("missing status or elements under status in baremetalhost object: {}".format(item))
+    elif kind == "agent":
+      counts["node_discovered"] = 1
+    elif kind == "mc":
+      if item["metadata"]["name"] == "local-cluster":
+        logger.debug("mc: Skipping local-cluster")
+        return counts
+      if "status" in item and "conditions" in item["status"]:
+        for condition in item["status"]["conditions"]:
+          if "type" in condition:
+            if condition["type"] == "ManagedClusterConditionAvailable":
+              logger.debug(
+                  "MC: {} is {} is {}".format(item["metadata"]["name"], condition["type"], condition["status"]))
+              if condition["status"] == "True":
+                counts["managed"] = 1
+              break
           else:
-            logger.warning("status or conditions not found in imageclusterinstall object: {}".format(item))
-
-      # Parse baremetalhost data
-      for item in bmh_data["items"]:
-        if "status" in item and "provisioning" in item["status"] and "state" in item["status"]["provisioning"]:
-          if item["status"]["provisioning"]["state"] in ("inspecting", "provisioning", "preparing", "provisioned"):
-            logger.debug("BMH: {} is {}".format(item["metadata"]["name"], item["status"]["provisioning"]["state"]))
-            node_booted += 1
+            logger.warning("mc: type missing from condition(item): {}".format(item))
+            logger.warning("mc: type missing from condition(condition): {}".format(condition))
+      else:
+        logger.warning("status or conditions not found in managedcluster object: {}".format(item))
+      if "ztp-done" in item["metadata"]["labels"] and "ztp-ansible" not in item["metadata"]["labels"]:
+        counts["playbook_notstarted"] = 1
+      # Monitoring for the aap day 2 playbook running
+      if "ztp-ansible" in item["metadata"]["labels"]:
+        mc_aap_label = item["metadata"]["labels"]["ztp-ansible"]
+        if mc_aap_label == "running":
+          counts["playbook_running"] = 1
+        elif mc_aap_label == "completed":
+          counts["playbook_completed"] = 1
         else:
-          logger.warning("missing status or elements under status in baremetalhost object: {}".format(item))
-
-      # Parse managedcluster data
-      for item in mc_data["items"]:
-        if item["metadata"]["name"] == "local-cluster":
-          logger.debug("mc: Skipping local-cluster")
-          continue
-        if "status" in item and "conditions" in item["status"]:
-          for condition in item["status"]["conditions"]:
+          logger.warning("Unexpected ztp-ansible value: {}".format(mc_aap_label))
+    elif kind == "cgu":
+      if item["metadata"]["name"] == "local-cluster":
+        logger.debug("cgu: Skipping local-cluster")
+        return counts
+      counts["policy_init"] = 1
+      if "status" in item and "conditions" in item["status"]:
+        for condition in item["status"]["conditions"]:
+          if self.talm_minor >= 12:
             if "type" in condition:
-              if condition["type"] == "ManagedClusterConditionAvailable":
-                logger.debug(
-                    "MC: {} is {} is {}".format(item["metadata"]["name"], condition["type"], condition["status"]))
-                if condition["status"] == "True":
-                  cluster_managed += 1
+              logger.debug("CGU: {} Condition: {}".format(item["metadata"]["name"], condition))
+              if (condition["type"] == "Progressing" and condition["status"] == "False"
+                  and condition["reason"] != "Completed" and condition["reason"] != "TimedOut"):
+                counts["policy_notstarted"] = 1
+                break
+              if condition["type"] == "Progressing" and condition["status"] == "True" and condition["reason"] == "InProgress":
+                counts["policy_applying"] = 1
+                break
+              if condition["type"] == "Succeeded" and condition["status"] == "False" and condition["reason"] == "TimedOut":
+                counts["policy_timedout"] = 1
+                break
+              if condition["type"] == "Succeeded" and condition["status"] == "True" and condition["reason"] == "Completed":
+                counts["policy_compliant"] = 1
                 break
             else:
-              logger.warning("mc: type missing from condition(item): {}".format(item))
-              logger.warning("mc: type missing from condition(condition): {}".format(condition))
-        else:
-          logger.warning("status or conditions not found in managedcluster object: {}".format(item))
-        if "ztp-done" in item["metadata"]["labels"] and "ztp-ansible" not in item["metadata"]["labels"]:
-          cluster_playbook_notstarted += 1
-        # Monitoring for the aap day 2 playbook running
-        if "ztp-ansible" in item["metadata"]["labels"]:
-          mc_aap_label = item["metadata"]["labels"]["ztp-ansible"]
-          if mc_aap_label == "running":
-            cluster_playbook_running += 1
-          elif mc_aap_label == "completed":
-            cluster_playbook_completed += 1
+              logger.warning("cgu: type missing from condition(item): {}".format(item))
+              logger.warning("cgu: type missing from condition(condition): {}".format(condition))
           else:
-            logger.warning("Unexpected ztp-ansible value: {}".format(mc_aap_label))
-
-      # Parse clustergroupupgrades data
-      for item in cgu_data["items"]:
-        if item["metadata"]["name"] == "local-cluster":
-          logger.debug("cgu: Skipping local-cluster")
-          continue
-        cluster_policy_init += 1
-        if "status" in item and "conditions" in item["status"]:
-          for condition in item["status"]["conditions"]:
-            if self.talm_minor >= 12:
-              if "type" in condition:
-                logger.debug("CGU: {} Condition: {}".format(item["metadata"]["name"], condition))
-                if (condition["type"] == "Progressing" and condition["status"] == "False"
-                    and condition["reason"] != "Completed" and condition["reason"] != "TimedOut"):
-                  cluster_policy_notstarted += 1
-                  break
-                if condition["type"] == "Progressing" and condition["status"] == "True" and condition["reason"] == "InProgress":
-                  cluster_policy_applying += 1
-                  break
-                if condition["type"] == "Succeeded" and condition["status"] == "False" and condition["reason"] == "TimedOut":
-                  cluster_policy_timedout += 1
-                  break
-                if condition["type"] == "Succeeded" and condition["status"] == "True" and condition["reason"] == "Completed":
-                  cluster_policy_compliant += 1
+            if "type" in condition:
+              if condition["type"] == "Ready":
+                if "reason" in condition:
+                  logger.debug("CGU: {} is {}".format(item["metadata"]["name"], condition["reason"]))
+                  if condition["reason"] == "UpgradeNotStarted":
+                    counts["policy_notstarted"] = 1
+                  elif condition["reason"] == "UpgradeNotCompleted":
+                    counts["policy_applying"] = 1
+                  elif condition["reason"] == "UpgradeTimedOut":
+                    counts["policy_timedout"] = 1
+                  elif condition["reason"] == "UpgradeCompleted":
+                    counts["policy_compliant"] = 1
+                  else:
+                    logger.info("cgu: {}: Unrecognized Completed Reason: {}".format(item["metadata"]["name"], condition["reason"]))
                   break
-              else:
-                logger.warning("cgu: type missing from condition(item): {}".format(item))
-                logger.warning("cgu: type missing from condition(condition): {}".format(condition))
+                else:
+                  logger.warning("reason missing from condition: {}".format(condition))
             else:
-              if "type" in condition:
-                if condition["type"] == "Ready":
-                  if "reason" in condition:
-                    logger.debug("CGU: {} is {}".format(item["metadata"]["name"], condition["reason"]))
-                    if condition["reason"] == "UpgradeNotStarted":
-                      cluster_policy_notstarted += 1
-                    elif condition["reason"] == "UpgradeNotCompleted":
-                      cluster_policy_applying += 1
-                    elif condition["reason"] == "UpgradeTimedOut":
-                      cluster_policy_timedout += 1
-                    elif condition["reason"] == "UpgradeCompleted":
-                      cluster_policy_compliant += 1
-                    else:
-                      logger.info("cgu: {}: Unrecognized Completed Reason: {}".format(item["metadata"]["name"], condition["reason"]))
-                    break
-                  else:
-                    logger.warning("reason missing from condition: {}".format(condition))
-              else:
-                logger.warning("cgu: type missing from condition(item): {}".format(item))
-                logger.warning("cgu: type missing from condition(condition): {}".format(condition))
+              logger.warning("cgu: type missing from condition(item): {}".format(item))
+              logger.warning("cgu: type missing from condition(condition): {}".format(condition))
+      else:
+        logger.warning("status or conditions not found in clustergroupupgrades object: {}".format(item))
+    return counts
+
+  def cluster_applied(self, clusters, timestamp=None):
+    if timestamp is None:
+      timestamp = time.time()
+    for cluster in clusters:
+      self.timeline.observe(cluster, "applied", timestamp)
+
+  def _observe(self, kind, item):
+    # Classifies an object and records the states it marks for its cluster
+    # Clusterinstalls, hosts and agents live in the cluster namespace, managedclusters and cgus are named after the cluster
+    counts = self._classify(kind, item)
+    if kind in ["mc", "cgu"]:
+      cluster = item["metadata"]["name"]
+    else:
+      cluster = item["metadata"].get("namespace", "")
+    observed_time = time.time()
+    for counter in counts:
+      if counter in counter_states:
+        self.timeline.observe(cluster, counter_states[counter], observed_time)
+    return counts
+
+  def _collect(self, kind):
+    # Lists a kind and replaces its objects in the state, prior objects are kept if the list fails
+    # Returns the seconds taken to fetch and classify the list
+    # Pages are classified as they arrive so only one page of full objects is held at a time, and only objects whose
+    # resourceVersion changed since the prior sample are classified again
+    start_fetch_time = time.time()
+    previous = self.classified.get(kind, {})
+    classified = {}
+    objects = {}
+    changed = 0
+    for rc, page in self.client.list_pages(monitor_resources[kind]["api_version"], monitor_resources[kind]["plural"],
+        monitor_resources[kind]["namespace"], retries=3, dry_run=self.dry_run, projection=self._projection(kind)):
+      if rc != 0:
+        logger.error("acm-deploy-load, list {} rc: {}".format(monitor_resources[kind]["resource"], rc))
+        return round(time.time() - start_fetch_time, 2)
+      for item in page["items"]:
+        uid = item["metadata"]["uid"]
+        resource_version = item["metadata"]["resourceVersion"]
+        if uid in previous and previous[uid][0] == resource_version:
+          classified[uid] = previous[uid]
         else:
-          logger.warning("status or conditions not found in clustergroupupgrades object: {}".format(item))
-
-      self.monitor_data["cluster_init"] = cluster_init
-      self.monitor_data["cluster_notstarted"] = cluster_notstarted
-      self.monitor_data["node_booted"] = node_booted
-      self.monitor_data["node_discovered"] = node_discovered
-      self.monitor_data["cluster_installing"] = cluster_installing
-      self.monitor_data["cluster_install_failed"] = cluster_install_failed
-      self.monitor_data["cluster_install_completed"] = cluster_install_completed
-      self.monitor_data["managed"] = cluster_managed
-      self.monitor_data["policy_init"] = cluster_policy_init
-      self.monitor_data["policy_notstarted"] = cluster_policy_notstarted
-      self.monitor_data["policy_applying"] = cluster_policy_applying
-      self.monitor_data["policy_timedout"] = cluster_policy_timedout
-      self.monitor_data["policy_compliant"] = cluster_policy_compliant
-      self.monitor_data["playbook_notstarted"] = cluster_playbook_notstarted
-      self.monitor_data["playbook_running"] = cluster_playbook_running
-      self.monitor_data["playbook_completed"] = cluster_playbook_completed
+          classified[uid] = (resource_version, self._observe(kind, item))
+          changed += 1
+        objects[uid] = classified[uid][1]
+    self.classified[kind] = classified
+    self.state.replace(kind, objects)
+    logger.debug("Classified {} of {} {} objects".format(changed, len(objects), monitor_resources[kind]["resource"]))
+    return round(time.time() - start_fetch_time, 2)
+
+  def _real_run(self):
+    logger.info("Starting ZTP Monitor")
+
+    with open(self.csv_file, "w") as csv_file:
+      csv_file.write("date,cluster_applied,{},{}\n".format(",".join(monitor_counters), ",".join(fetch_columns)))
+
+    watchers = []
+    if self.watch and not self.dry_run:
+      logger.info("Monitoring via watch of {}".format(", ".join(self._kinds())))
+      for kind in self._kinds():
+        watcher = ZTPWatcher(kind, self._observe, self.state, self.kubeconfig, self._projection(kind))
+        watcher.daemon = True
+        watcher.start()
+        watchers.append(watcher)
+
+    # Each resource is listed on its own worker so a sample takes about as long as the slowest list
+    executor = None
+    if not self.watch:
+      executor = ThreadPoolExecutor(max_workers=len(self._kinds()), thread_name_prefix="collect")
+
+    interval = self.sample_interval
+    prior_counters = None
+    while self.signal:
+      start_sample_time = time.time()
+      applied = self.monitor_data["cluster_applied_committed"]
+
+      fetch_times = dict.fromkeys(fetch_columns, 0)
+      if not self.watch:
+        futures = {kind: executor.submit(self._collect, kind) for kind in self._kinds()}
+        for kind, future in futures.items():
+          fetch_times[monitor_resources[kind]["fetch_column"]] = future.result()
+          logger.debug("Fetched {} in {}s".format(monitor_resources[kind]["resource"], fetch_times[monitor_resources[kind]["fetch_column"]]))
+
+      counters = self.state.snapshot()
+      for counter in monitor_counters:
+        self.monitor_data[counter] = counters[counter]
 
       # Write csv data
       with open(self.csv_file, "a") as csv_file:
-        csv_file.write("{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{},{}\n".format(
+        csv_file.write("{},{},{},{}\n".format(
             datetime.fromtimestamp(start_sample_time, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            self.monitor_data["cluster_applied_committed"], cluster_init, cluster_notstarted, node_booted,
-            node_discovered, cluster_installing, cluster_install_failed, cluster_install_completed, cluster_managed,
-            cluster_policy_init, cluster_policy_notstarted, cluster_policy_applying, cluster_policy_timedout,
-            cluster_policy_compliant, cluster_playbook_notstarted, cluster_playbook_running, cluster_playbook_completed
+            self.monitor_data["cluster_applied_committed"], ",".join(str(counters[counter]) for counter in monitor_counters),
+            ",".join(str(fetch_times[column]) for column in fetch_columns)
         ))
 
       logger.debug("Applied/Committed Clusters: {}".format(self.monitor_data["cluster_applied_committed"]))
@@ -361,11 +627,39 @@ class ZTPMonitor(Thread):
       sample_time = round(end_sample_time - start_sample_time, 1)
       logger.info("Monitor sampled in {}".format(sample_time))
 
-      time_to_sleep = self.sample_interval - sample_time
-      if time_to_sleep > 0:
-        time.sleep(time_to_sleep)
-      else:
+      if not self.adaptive:
+        time_to_sleep = self.sample_interval - sample_time
+        if time_to_sleep > 0:
+          time.sleep(time_to_sleep)
+        else:
+          logger.warning("Time to monitor exceeded monitor interval")
+        continue
+
+      # Adaptive interval: halve it while counters move and back off by half again while they are flat
+      counters["cluster_applied"] = applied
+      if prior_counters is not None and counters != prior_counters:
+        interval = max(self.sample_interval_min, interval / 2)
+      elif prior_counters is not None:
+        interval = min(self.sample_interval_max, interval * 1.5)
+      prior_counters = counters
+      logger.debug("Next monitor sample in {}s".format(round(interval, 1)))
+      if interval - sample_time <= 0:
         logger.warning("Time to monitor exceeded monitor interval")
+      # Clusters applied or committed since the sample start a burst, so sample again at the minimum interval
+      while self.signal and time.time() < start_sample_time + interval:
+        if self.monitor_data["cluster_applied_committed"] != applied:
+          interval = self.sample_interval_min
+          if time.time() >= start_sample_time + interval:
+            break
+        time.sleep(1)
+
+    if executor is not None:
+      executor.shutdown()
+    for watcher in watchers:
+      watcher.stop()
+    self.timeline.close()
+    if self.timeline.transitions_file != "":
+      self.timeline.write_stats("{}.stats".format(os.path.splitext(self.timeline.transitions_file)[0]))
     logger.info("Monitor Thread terminating")
 
   def run(self):